@@ -0,0 +1,38 @@
+"""
+Compares building an Arrow table from ORM objects through per-row dicts
+of validated models (``Table.from_pylist``) with ``to_arrow_table``
+(requires ``pyarrow``)
+
+Usage: python -m benchmarks.arrow_export [rows] [repeats]
+"""
+import sys
+from collections.abc import Callable
+from timeit import timeit
+from typing import Any
+
+import pyarrow as pa
+
+from benchmarks.schema import User, make_user
+
+
+def main(row_count: int = 10000, repeats: int = 5) -> None:
+    users = [make_user(index) for index in range(row_count)]
+    model = User.ColumnsModel
+
+    def from_rows() -> Any:
+        rows = [item.model_dump() for item in model.validate_many(users)]
+        for row in rows:
+            row["e"] = row["e"].name
+        return pa.Table.from_pylist(rows)
+
+    functions: tuple[tuple[str, Callable[[], Any]], ...] = (
+        ("per-row dicts", from_rows),
+        ("to_arrow_table", lambda: model.to_arrow_table(users)),
+    )
+    for name, function in functions:
+        elapsed = timeit(function, number=repeats) / repeats
+        print(f"{name:<16} {elapsed * 1000:8.2f} ms / {row_count} rows")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,40 @@
+"""
+Compares serializing ORM objects into JSON through validation & model instances
+(``model_validate(user).model_dump_json()``) with reading attributes directly
+(``dump_attributes_json(user)``)
+
+Usage: python -m benchmarks.attribute_serialization [objects] [repeats]
+"""
+import sys
+from timeit import timeit
+
+from benchmarks.schema import User, make_user
+
+
+def main(object_count: int = 1000, repeats: int = 20) -> None:
+    users = [make_user(index) for index in range(object_count)]
+    model = User.FullModel
+
+    def validate_then_dump() -> list[bytes]:
+        return [model.model_validate(user).model_dump_json().encode() for user in users]
+
+    def dump_attributes() -> list[bytes]:
+        return [model.dump_attributes_json(user) for user in users]
+
+    if validate_then_dump() != dump_attributes():
+        sys.exit("outputs differ")
+
+    for name, function in (
+        ("validate & dump", validate_then_dump),
+        ("dump attributes", dump_attributes),
+    ):
+        elapsed = timeit(function, number=repeats) / repeats
+        per_object = elapsed / object_count * 1e6
+        print(  # noqa: T201
+            f"{name}: {elapsed * 1000:8.2f} ms / {object_count} objects"
+            f" ({per_object:.2f} us per object)"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
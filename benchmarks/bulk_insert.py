@@ -0,0 +1,65 @@
+"""
+Compares inserting validated create payloads through ORM objects
+(``session.add`` & flush) with ``bulk_insert`` (one Core executemany)
+
+Usage: python -m benchmarks.bulk_insert [rows] [repeats]
+"""
+import sys
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from benchmarks.schema import User, create_database
+
+
+def make_payload(index: int) -> dict[str, Any]:
+    return {
+        "name": f"user {index}",
+        "a": index,
+        "b": 0,
+        "c": index % 10,
+        "e": 1 + index % 2,
+        "d1": "2000-01-01",
+        "d2": "2000-01-01T12:30:00",
+        "avatar_id": 0,
+    }
+
+
+def main(row_count: int = 10000, repeats: int = 5) -> None:
+    engine = create_database(1)
+    payloads = [make_payload(index) for index in range(row_count)]
+
+    def orm(session: Session) -> None:
+        for payload in payloads:
+            item = User.InsertModel.model_validate(payload)
+            session.add(User(**item.model_dump()))
+        session.flush()
+
+    def bulk(session: Session) -> None:
+        # SQLite can only keep the order of returned rows by inserting one by one
+        User.InsertModel.bulk_insert(session, payloads, sort_by_parameter_order=False)
+
+    functions: tuple[tuple[str, Callable[[Session], None]], ...] = (
+        ("ORM objects", orm),
+        ("bulk_insert", bulk),
+    )
+    for name, function in functions:
+        timings = []
+        for _ in range(repeats):
+            with Session(engine) as session:
+                session.execute(delete(User).where(User.id > 0))
+                start = perf_counter()
+                function(session)
+                timings.append(perf_counter() - start)
+                session.rollback()
+        print(  # noqa: T201
+            f"{name:<12} {min(timings) * 1000:8.1f} ms / {row_count} rows"
+            " (validation & insert)"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
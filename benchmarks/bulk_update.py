@@ -0,0 +1,61 @@
+"""
+Compares applying patches through ORM objects (``setattr`` over supplied
+fields & flush) with ``bulk_update`` (one executemany per set of fields)
+
+Usage: python -m benchmarks.bulk_update [rows] [repeats]
+"""
+import sys
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, lazyload
+
+from benchmarks.schema import User, create_database
+from pydantic_marshals.base import PatchDefault
+
+
+def make_patch(index: int) -> tuple[int, Any]:
+    payload: dict[str, Any] = {"a": -index}
+    if index % 2:
+        payload["name"] = f"patched {index}"
+    return index, User.PatchModel.model_validate(payload)
+
+
+def main(row_count: int = 10000, repeats: int = 5) -> None:
+    engine = create_database(row_count)
+    patches = [make_patch(index) for index in range(row_count)]
+
+    def orm(session: Session) -> None:
+        statement = select(User).options(lazyload("*"))
+        users = {user.id: user for user in session.scalars(statement)}
+        for key, patch in patches:
+            user = users[key]
+            for name, value in vars(patch).items():  # noqa: WPS421
+                if value is not PatchDefault:
+                    setattr(user, name, value)
+        session.flush()
+
+    def bulk(session: Session) -> None:
+        User.PatchModel.bulk_update(session, patches)
+
+    functions: tuple[tuple[str, Callable[[Session], None]], ...] = (
+        ("ORM objects", orm),
+        ("bulk_update", bulk),
+    )
+    for name, function in functions:
+        timings = []
+        for _ in range(repeats):
+            with Session(engine) as session:
+                start = perf_counter()
+                function(session)
+                timings.append(perf_counter() - start)
+                session.rollback()
+        print(  # noqa: T201
+            f"{name:<12} {min(timings) * 1000:8.1f} ms / {row_count} rows"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,62 @@
+"""
+Compares validating & serializing ORM objects loaded from SQLite one by one
+(``model_validate`` in a loop) with validating them in one call
+(``validate_many``) or in batches (``dump_many_json``)
+
+Usage: python -m benchmarks.bulk_validation [row counts...]
+"""
+import sys
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from benchmarks.schema import User, create_database
+
+
+def measure(function: Callable[[], Any], repeats: int = 3) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = perf_counter()
+        function()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def main(*row_counts: int) -> None:
+    model = User.FullModel
+    for row_count in row_counts or (1000, 10000, 100000):
+        engine = create_database(row_count)
+        with Session(engine) as session:
+            users = session.scalars(select(User).order_by(User.id)).all()
+
+            def validate_loop() -> list[Any]:
+                return [model.model_validate(user) for user in users]
+
+            def dump_loop() -> bytes:
+                dumped = b",".join(
+                    model.model_validate(user).model_dump_json().encode()
+                    for user in users
+                )
+                return b"[" + dumped + b"]"
+
+            if dump_loop() != model.dump_many_json(users):
+                sys.exit("outputs differ")
+
+            for name, function in (
+                ("model_validate loop", validate_loop),
+                ("validate_many", lambda: model.validate_many(users)),
+                ("model_dump_json loop", dump_loop),
+                ("dump_many_json", lambda: model.dump_many_json(users)),
+            ):
+                elapsed = measure(function)
+                print(  # noqa: T201
+                    f"{row_count:>7} rows  {name:<21} {elapsed * 1000:9.1f} ms"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,33 @@
+"""
+Compares serializing many ORM objects into a JSON array of objects
+(``dump_many_json``, ``dump_attributes_json`` for every object)
+with columnar JSON (``dump_columns_json``): time & payload size
+
+Usage: python -m benchmarks.columnar [objects] [repeats]
+"""
+import sys
+from collections.abc import Callable
+from timeit import timeit
+
+from benchmarks.schema import User, make_user
+
+
+def main(object_count: int = 10000, repeats: int = 5) -> None:
+    users = [make_user(index) for index in range(object_count)]
+    model = User.ColumnsModel
+
+    functions: tuple[tuple[str, Callable[[], bytes]], ...] = (
+        ("dump many", lambda: model.dump_many_json(users)),
+        ("dump attributes", lambda: b",".join(map(model.dump_attributes_json, users))),
+        ("dump columns", lambda: model.dump_columns_json(users)),
+    )
+    for name, function in functions:
+        elapsed = timeit(function, number=repeats) / repeats
+        print(  # noqa: T201
+            f"{name:<16} {elapsed * 1000:8.2f} ms / {object_count} objects,"
+            f" {len(function()) / 1024:8.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,74 @@
+"""
+Accesses cold models from many threads at once & counts how many times each one
+was generated. With single-flight generation every model is built exactly once
+
+Usage: python -m benchmarks.concurrent_generation [threads] [models]
+"""
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import perf_counter
+
+from pydantic import BaseModel
+
+from pydantic_marshals.base.fields.properties import PropertyField
+from pydantic_marshals.base.models import MarshalModel
+
+builds: Counter[int] = Counter()
+
+
+class CountingModel(MarshalModel):
+    def generate_model(self) -> type[BaseModel]:
+        builds[id(self)] += 1
+        return super().generate_model()
+
+
+def make_property(index: int) -> property:
+    def getter(_: object) -> int:
+        return index
+
+    getter.__name__ = f"field_{index}"
+    getter.__annotations__ = {"return": int}
+    return property(getter)
+
+
+def make_models(count: int, width: int = 50) -> list[MarshalModel]:
+    properties = [make_property(i) for i in range(width)]
+    result = []
+    for index in range(count):
+        marshal_model = CountingModel(
+            *(PropertyField(prop) for prop in properties), bases=[]
+        )
+        marshal_model.model_name = f"Model{index}"
+        result.append(marshal_model)
+    return result
+
+
+def main(thread_count: int = 32, model_count: int = 20) -> None:
+    marshal_models = make_models(model_count)
+    barrier = Barrier(thread_count)
+
+    def worker(_: int) -> list[type[BaseModel]]:
+        barrier.wait()
+        return [marshal_model.generated_model for marshal_model in marshal_models]
+
+    start = perf_counter()
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        results = list(executor.map(worker, range(thread_count)))
+    elapsed = perf_counter() - start
+
+    distinct = {id(model) for result in results for model in result}
+    duplicates = sum(builds.values()) - model_count
+    print(f"threads:          {thread_count}")  # noqa: T201
+    print(f"models:           {model_count}")  # noqa: T201
+    print(f"builds:           {sum(builds.values())}")  # noqa: T201
+    print(f"duplicate builds: {duplicates}")  # noqa: T201
+    print(f"distinct classes: {len(distinct)}")  # noqa: T201
+    print(f"elapsed:          {elapsed * 1000:.1f} ms")  # noqa: T201
+    if duplicates or len(distinct) != model_count:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
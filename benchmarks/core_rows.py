@@ -0,0 +1,43 @@
+"""
+Compares validating ORM objects (``validate_many``) with validating Core rows
+of the same columns straight into the model (``validate_rows``)
+
+Usage: python -m benchmarks.core_rows [rows] [repeats]
+"""
+import sys
+from time import perf_counter
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, lazyload
+
+from benchmarks.schema import User, create_database
+
+
+def main(row_count: int = 10000, repeats: int = 5) -> None:
+    engine = create_database(row_count)
+    marshal_model = User.__dict__["ColumnsModel"]
+
+    def orm() -> int:
+        with Session(engine) as session:
+            users = session.scalars(select(User).options(lazyload("*"))).all()
+            return len(marshal_model.validate_many(users))
+
+    def core() -> int:
+        with engine.connect() as connection:
+            rows = connection.execute(marshal_model.core_select()).all()
+            return len(marshal_model.validate_rows(rows))
+
+    for name, function in (("ORM objects", orm), ("Core rows", core)):
+        timings = []
+        for _ in range(repeats):
+            start = perf_counter()
+            function()
+            timings.append(perf_counter() - start)
+        print(  # noqa: T201
+            f"{name:<12} {min(timings) * 1000:8.1f} ms / {row_count} rows"
+            " (query & validation)"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,49 @@
+"""
+Compares deriving sub-models for sparse fieldsets (``?fields=id,name,avatar.id``)
+from scratch (a new MarshalModel & pydantic model for every request) with
+``select_fields``, which keeps them in a bounded LRU cache
+
+Usage: python -m benchmarks.field_selection [requests] [selections]
+"""
+import sys
+from itertools import cycle, islice
+from time import perf_counter
+
+from benchmarks.schema import User, make_user
+from pydantic_marshals.base.selections import parse_field_selection
+
+FIELD_SETS = (
+    "id,name",
+    "id,name,avatar.id",
+    "id,a,b,c,addresses.id",
+    "name,e,d2,avatar",
+)
+
+
+def main(request_count: int = 1000, selection_count: int = 4) -> None:
+    marshal_model = User.__dict__["FullModel"]
+    user = make_user(1)
+    field_sets = list(islice(cycle(FIELD_SETS), selection_count))
+
+    start = perf_counter()
+    for fields in islice(cycle(field_sets), request_count):
+        selection = parse_field_selection([fields])
+        model = marshal_model.create_selection(selection).generated_model
+        model.model_validate(user).model_dump_json()
+    uncached = perf_counter() - start
+
+    start = perf_counter()
+    for fields in islice(cycle(field_sets), request_count):
+        model = marshal_model.select_fields(fields).generated_model
+        model.model_validate(user).model_dump_json()
+    cached = perf_counter() - start
+
+    for name, elapsed in (("uncached", uncached), ("select_fields", cached)):
+        print(  # noqa: T201
+            f"{name:<14} {elapsed * 1000:8.2f} ms / {request_count} requests,"
+            f" {elapsed / request_count * 1e6:8.2f} us / request"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,96 @@
+"""
+Compares validating a mixed list of objects from a polymorphic hierarchy
+with a plain ``Union`` of models and with ``polymorphic_union``
+
+Usage: python -m benchmarks.polymorphic [rows] [repeats]
+"""
+import sys
+from time import perf_counter
+from typing import Any, Union
+
+from pydantic import TypeAdapter
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from pydantic_marshals.sqlalchemy import MappedModel
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Shape(Base):
+    __tablename__ = "shapes"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kind: Mapped[str] = mapped_column()
+    name: Mapped[str] = mapped_column()
+
+    __mapper_args__ = {"polymorphic_on": kind, "polymorphic_identity": "shape"}
+
+    FullModel = MappedModel.create(columns=[id, name])
+
+
+class Circle(Shape):
+    radius: Mapped[float] = mapped_column(nullable=True)
+
+    __mapper_args__ = {"polymorphic_identity": "circle"}
+
+    FullModel = Shape.__dict__["FullModel"].extend(columns=[radius])
+
+
+class Square(Shape):
+    side: Mapped[float] = mapped_column(nullable=True)
+
+    __mapper_args__ = {"polymorphic_identity": "square"}
+
+    FullModel = Shape.__dict__["FullModel"].extend(columns=[side])
+
+
+class Triangle(Shape):
+    __tablename__ = "triangles"
+
+    id: Mapped[int] = mapped_column(  # noqa: VNE003
+        ForeignKey("shapes.id"), primary_key=True
+    )
+    a: Mapped[float] = mapped_column()
+    b: Mapped[float] = mapped_column()
+    c: Mapped[float] = mapped_column()
+
+    __mapper_args__ = {"polymorphic_identity": "triangle"}
+
+    FullModel = Shape.__dict__["FullModel"].extend(columns=[a, b, c])
+
+
+def make_shape(index: int) -> Shape:
+    if index % 3 == 0:
+        return Circle(id=index, name=str(index), radius=index)
+    if index % 3 == 1:
+        return Square(id=index, name=str(index), side=index)
+    return Triangle(id=index, name=str(index), a=1, b=2, c=index)
+
+
+def main(row_count: int = 50000, repeats: int = 5) -> None:
+    shapes = [make_shape(index) for index in range(row_count)]
+    models = (Triangle.FullModel, Square.FullModel, Circle.FullModel)
+    union_type: Any = Union[models]  # noqa: WPS465
+    plain_union: TypeAdapter[list[Any]] = TypeAdapter(list[union_type])
+    polymorphic_union = Shape.__dict__["FullModel"].polymorphic_union
+
+    for name, adapter in (
+        ("Union", plain_union),
+        ("polymorphic", polymorphic_union.adapter),
+    ):
+        timings = []
+        for _ in range(repeats):
+            start = perf_counter()
+            adapter.dump_json(adapter.validate_python(shapes))
+            timings.append(perf_counter() - start)
+        print(  # noqa: T201
+            f"{name:<12} {min(timings) * 1000:8.1f} ms / {row_count} rows"
+            " (validate & dump)"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
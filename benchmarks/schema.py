@@ -0,0 +1,111 @@
+"""
+Schema from ``examples/sqlalchemy/full.py`` & helpers for filling it with data,
+shared between benchmarks
+"""
+from collections.abc import Iterator
+from datetime import date, datetime
+from enum import Enum, auto
+
+from sqlalchemy import Engine, ForeignKey, MetaData, String, create_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship
+
+from pydantic_marshals.sqlalchemy import MappedModel
+
+db_meta = MetaData()
+
+
+class Base(DeclarativeBase):
+    __tablename__: str
+
+    metadata = db_meta
+
+
+class E(int, Enum):
+    A = auto()
+    B = auto()
+
+
+class Avatar(Base):
+    __tablename__ = "avatars"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    CreateModel = MappedModel.create(columns=[id])
+
+
+class Address(Base):
+    __tablename__ = "addresses"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+
+    CreateModel = MappedModel.create(columns=[id])
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    a: Mapped[int | None] = mapped_column()
+    b: Mapped[int | None] = mapped_column(default=0)
+    c: Mapped[int] = mapped_column(default=0)
+    e: Mapped[E] = mapped_column()
+
+    d1: Mapped[date] = mapped_column()
+    d2: Mapped[datetime] = mapped_column()
+
+    avatar_id: Mapped[int] = mapped_column(ForeignKey("avatars.id"))
+    avatar: Mapped[Avatar] = relationship(lazy="joined")
+
+    addresses: Mapped[list[Address]] = relationship(lazy="selectin")
+
+    @property
+    def hey(self) -> str:
+        return "hey"
+
+    @property
+    def av(self) -> Avatar:
+        return self.avatar
+
+    CreateModel = MappedModel.create(
+        columns=[name],
+        relationships=[
+            (avatar, Avatar.CreateModel),
+            (addresses, Address.CreateModel),
+        ],
+        properties=[hey, (av, Avatar.CreateModel)],
+    )
+    FullModel = CreateModel.extend(columns=[id, a, b, c, e, d2])
+    ColumnsModel = MappedModel.create(columns=[id, name, a, b, c, e, d1, d2])
+    InsertModel = MappedModel.create(columns=[name, a, b, c, e, d1, d2, avatar_id])
+    PatchModel = InsertModel.as_patch()
+
+
+def make_user(index: int) -> User:
+    return User(
+        id=index,
+        name=f"user {index}",
+        a=index,
+        b=0,
+        c=index % 10,
+        e=E.A if index % 2 else E.B,
+        d1=date(2000, 1, 1),
+        d2=datetime(2000, 1, 1, 12, 30),
+        avatar=Avatar(id=index),
+        addresses=[Address(id=index * 2), Address(id=index * 2 + 1)],
+    )
+
+
+def create_database(row_count: int) -> Engine:
+    """Creates an in-memory SQLite database with `row_count` users"""
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    db_meta.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(make_user(index) for index in range(row_count))
+        session.commit()
+    return engine
+
+
+def iter_users(session: Session) -> Iterator[User]:
+    yield from session.query(User).order_by(User.id)
@@ -0,0 +1,55 @@
+"""
+Measures peak memory (via tracemalloc) of exporting SQLite query results into
+JSON at once (``dump_many_json``) and in chunks (``iter_ndjson`` with
+``yield_per``). Peak memory of streaming stays flat as the row count grows
+
+Usage: python -m benchmarks.streaming [row counts...]
+"""
+import sys
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from benchmarks.schema import User, create_database
+
+
+def measure_peak(function: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(*row_counts: int) -> None:
+    model = User.FullModel
+    statement = select(User).order_by(User.id)
+    for row_count in row_counts or (1000, 10000, 30000):
+        engine = create_database(row_count)
+
+        def dump_at_once() -> int:
+            with Session(engine) as session:
+                return len(model.dump_many_json(session.scalars(statement)))
+
+        def stream() -> int:
+            with Session(engine) as session:
+                rows = session.execute(statement).yield_per(500)
+                return sum(len(chunk) for chunk in model.iter_ndjson(rows, 500))
+
+        for name, function in (
+            ("dump_many_json", dump_at_once),
+            ("iter_ndjson", stream),
+        ):
+            peak = measure_peak(function)
+            print(  # noqa: T201
+                f"{row_count:>7} rows  {name:<15} peak {peak / 2**20:8.1f} MiB"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
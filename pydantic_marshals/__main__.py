@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import sys
+from argparse import ArgumentParser, Namespace
+from collections.abc import Sequence
+from importlib import import_module
+from pathlib import Path
+
+from pydantic_marshals.base.codegen import generate_code
+from pydantic_marshals.base.registry import registry
+
+
+def warmup_command(arguments: Namespace) -> int:
+    for module_name in arguments.modules:
+        import_module(module_name)
+
+    failures: dict[str, Exception] = {}
+    timings = registry.warm_up(failures)
+    for registry_key, build_time in timings.items():
+        sys.stdout.write(f"{build_time * 1000:10.3f} ms  {registry_key}\n")
+    sys.stdout.write(
+        f"{sum(timings.values()) * 1000:10.3f} ms  total"
+        f" ({len(timings)} built, {registry.count_materialized()} materialized,"
+        f" {len(registry)} registered)\n"
+    )
+    return report_failures(failures)
+
+
+def report_failures(failures: dict[str, Exception]) -> int:
+    for registry_key, error in failures.items():
+        sys.stderr.write(f"{registry_key} failed: {type(error).__name__}: {error}\n")
+    return 1 if failures else 0
+
+
+def codegen_command(arguments: Namespace) -> int:
+    for module_name in arguments.modules:
+        import_module(module_name)
+
+    failures: dict[str, Exception] = {}
+    code = generate_code(*arguments.modules, failures=failures)
+    output: Path = arguments.output
+
+    if not arguments.check:
+        output.write_text(code, encoding="utf-8")
+        return report_failures(failures)
+
+    if not output.is_file() or output.read_text(encoding="utf-8") != code:
+        sys.stderr.write(f"{output} is out of date, regenerate it with codegen\n")
+        return 1
+    return report_failures(failures)
+
+
+def build_parser() -> ArgumentParser:
+    parser = ArgumentParser(prog="python -m pydantic_marshals")
+    subparsers = parser.add_subparsers(required=True)
+
+    warmup_parser = subparsers.add_parser(
+        "warmup",
+        help="import modules & generate all models in them, reporting build times",
+    )
+    warmup_parser.add_argument("modules", nargs="+", help="modules to import")
+    warmup_parser.set_defaults(command=warmup_command)
+
+    codegen_parser = subparsers.add_parser(
+        "codegen",
+        help="generate code with plain pydantic models for all models in modules",
+    )
+    codegen_parser.add_argument("modules", nargs="+", help="modules to import")
+    codegen_parser.add_argument(
+        "-o", "--output", type=Path, required=True, help="file to write the code to"
+    )
+    codegen_parser.add_argument(
+        "--check",
+        action="store_true",
+        help="don't write the file, fail if it differs from the generated code",
+    )
+    codegen_parser.set_defaults(command=codegen_command)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    arguments = build_parser().parse_args(argv)
+    return arguments.command(arguments)  # type: ignore[no-any-return]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,12 @@
 from pydantic_marshals.base.composite import CompositeMarshalModel
 from pydantic_marshals.base.fields.base import PatchDefault, PatchDefaultType
 from pydantic_marshals.base.models import MarshalModel
+from pydantic_marshals.base.registry import warm_up
 
-__all__ = ("MarshalModel", "PatchDefault", "PatchDefaultType", "CompositeMarshalModel")
+__all__ = (
+    "MarshalModel",
+    "PatchDefault",
+    "PatchDefaultType",
+    "CompositeMarshalModel",
+    "warm_up",
+)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from hashlib import sha256
+from os import getpid
+from pathlib import Path
+from types import NoneType
+from typing import TYPE_CHECKING, Any, get_args, get_origin
+
+from pydantic import VERSION, BaseModel
+
+from pydantic_marshals.utils import is_subtype
+
+if TYPE_CHECKING:
+    from pydantic_marshals.base.models import MarshalModel
+
+JSONDict = dict[str, Any]
+
+
+def qualified_name(klass: Any) -> str:
+    return f"{klass.__module__}.{klass.__qualname__}"
+
+
+memory_address = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def describe_value(value: Any) -> Any:
+    """
+    Process-independent representation of defaults and other field data.
+    Classes & functions are described by qualified names, containers and
+    dataclasses (e.g. ``AfterValidator``) by their contents, memory addresses
+    are removed from everything else
+    """
+    if isinstance(value, Enum):
+        return f"{qualified_name(type(value))}.{value.name}"
+    if callable(value) and hasattr(value, "__qualname__"):
+        return qualified_name(value)
+    if isinstance(value, dict):
+        return {str(key): describe_value(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [describe_value(item) for item in value]
+    if isinstance(value, set | frozenset):
+        return sorted(repr(describe_value(item)) for item in value)
+    if is_dataclass(value):
+        return {
+            "dataclass": qualified_name(type(value)),
+            "fields": {
+                field.name: describe_value(getattr(value, field.name))
+                for field in fields(value)
+            },
+        }
+    return memory_address.sub("", repr(value))
+
+
+def describe_type(type_hint: Any, seen: set[type] | None = None) -> Any:
+    """
+    Converts a type hint into a json-compatible structure, which only changes
+    if the type hint changes. Nested pydantic models and enums are described
+    by their contents, not only by name
+    """
+    if seen is None:
+        seen = set()
+
+    if type_hint is NoneType or type_hint is None:
+        return "None"
+
+    if get_origin(type_hint) is not None:
+        return {
+            "origin": describe_type(get_origin(type_hint), seen),
+            "args": [describe_type(arg, seen) for arg in get_args(type_hint)],
+        }
+
+    if is_subtype(type_hint, BaseModel):
+        if type_hint in seen:
+            return qualified_name(type_hint)
+        seen.add(type_hint)
+        return {
+            "model": qualified_name(type_hint),
+            "config": describe_value(dict(type_hint.model_config)),
+            "fields": {
+                name: {
+                    "type": describe_type(field.annotation, seen),
+                    "alias": field.alias,
+                    "default": describe_value(field.default),
+                    "metadata": describe_value(field.metadata),
+                }
+                for name, field in type_hint.model_fields.items()
+            },
+        }
+
+    if is_subtype(type_hint, Enum):
+        return {
+            "enum": qualified_name(type_hint),
+            "members": {member.name: repr(member.value) for member in type_hint},
+        }
+
+    return describe_value(type_hint)
+
+
+def describe_model(
+    marshal_model: MarshalModel, seen: set[int] | None = None
+) -> JSONDict:
+    """
+    Describes declared field sources & bases of the model in a json-compatible
+    format (see :py:meth:`MarshalField.describe_source`), without generating it
+    or nested models. Models in `seen` (recursive ones) are described by name.
+    Used for fingerprinting in :py:class:`SchemaCache`
+    """
+    if seen is None:
+        seen = set()
+    if id(marshal_model) in seen:
+        return {"name": marshal_model.model_name}
+    seen.add(id(marshal_model))
+
+    return {
+        "name": marshal_model.model_name,
+        "bases": [
+            describe_type(base)
+            for base in (marshal_model.model_base_class, *marshal_model.bases)
+        ],
+        "config": describe_value(marshal_model.generate_class_kwargs()),
+        "fields": {
+            field.generate_name(): field.describe_source(seen)
+            for field in marshal_model.fields
+        },
+    }
+
+
+class SchemaCache:
+    """
+    Opt-in on-disk cache for JSON schemas of :py:class:`MarshalModel`s.
+
+    Only JSON schemas are cached: pydantic models can't be stored, so they are
+    still generated on first validation or serialization. Entries are keyed
+    by the model and a fingerprint of its field definitions, bases, config and
+    pydantic version. Changing the model's source replaces its entry
+    (old ones are removed), while unchanged entries are reused between processes
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def fingerprint(self, description: JSONDict) -> str:
+        source = json.dumps([VERSION, description], sort_keys=True)
+        return sha256(source.encode("utf-8")).hexdigest()
+
+    def model_key(self, marshal_model: MarshalModel) -> str:
+        """Stable file-safe key, same for all versions of one model"""
+        model_module = getattr(marshal_model, "model_module", "")
+        name = f"{model_module}:{marshal_model.model_name}"
+        return sha256(name.encode("utf-8")).hexdigest()[:16]
+
+    def path(self, model_key: str, fingerprint: str) -> Path:
+        return self.directory / f"{model_key}-{fingerprint}.json"
+
+    def load(self, model_key: str, fingerprint: str) -> JSONDict | None:
+        try:
+            data = self.path(model_key, fingerprint).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        try:
+            return json.loads(data)  # type: ignore[no-any-return]
+        except ValueError:  # broken entry, will be overwritten
+            return None
+
+    def store(self, model_key: str, fingerprint: str, entry: JSONDict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(model_key, fingerprint)
+        temporary = path.with_suffix(f".{getpid()}.tmp")
+        temporary.write_text(json.dumps(entry), encoding="utf-8")
+        temporary.replace(path)  # atomic, parallel workers may write the same entry
+        self.prune(model_key, keep=path)
+
+    def prune(self, model_key: str, keep: Path) -> None:
+        """Removes stale entries of the model (ones with other fingerprints)"""
+        for stale_path in self.directory.glob(f"{model_key}-*.json"):
+            if stale_path != keep:
+                stale_path.unlink(missing_ok=True)  # could be removed in parallel
+
+    def json_schema(self, marshal_model: MarshalModel) -> JSONDict:
+        """Loads the JSON schema from cache, or generates and stores it"""
+        model_key = self.model_key(marshal_model)
+        fingerprint = self.fingerprint(describe_model(marshal_model))
+
+        entry = self.load(model_key, fingerprint)
+        if entry is not None:
+            return entry["schema"]  # type: ignore[no-any-return]
+
+        schema = marshal_model.generated_model.model_json_schema()
+        self.store(model_key, fingerprint, {"schema": schema})
+        return schema
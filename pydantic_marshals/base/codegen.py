@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from inspect import isbuiltin, isfunction
+from keyword import iskeyword
+from types import NoneType, UnionType
+from typing import Annotated, Any, ForwardRef, Literal, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from pydantic_marshals.base.fields.base import MarshalField
+from pydantic_marshals.base.models import MarshalModel
+from pydantic_marshals.base.registry import ModelGenerationError, registry
+from pydantic_marshals.utils import is_subtype
+
+HEADER = """# This file is generated by pydantic-marshals, do not edit it manually
+# Sources: {sources}
+"""
+
+literal_types = (NoneType, bool, int, float, str, bytes)
+datetime_types = (datetime, date, time, timedelta)
+
+
+class CodeGenerator:
+    """
+    Generates python code with plain pydantic models, equivalent to models
+    generated by :py:class:`MarshalModel`s at runtime. Models are built with
+    :py:meth:`MarshalField.generate_name`, :py:meth:`MarshalField.generate_type` &
+    :py:meth:`MarshalField.generate_field_data`, so all of them have to be
+    representable in code: types & functions must be importable, defaults
+    & metadata must be literals, enums, datetime values or dataclasses
+    (e.g. ``MaxLen(100)``). A `TypeError` is raised otherwise, see :py:meth:`render`
+
+    Registered models, used by the passed ones (e.g. in relationships),
+    are included in the generated code automatically
+    """
+
+    def __init__(self, marshal_models: Iterable[MarshalModel]) -> None:
+        self.marshal_models: list[MarshalModel] = []
+        self.imports: set[str] = set()
+        self.class_names: dict[type[BaseModel], str] = {}
+        self.generated_models: dict[type[BaseModel], MarshalModel] = {}
+        self.references: set[str] = set()
+
+        for marshal_model in marshal_models:
+            self.add_model(marshal_model)
+
+    def add_model(self, marshal_model: MarshalModel) -> str:
+        generated_model = marshal_model.generated_model
+        class_name = self.class_names.get(generated_model)
+        if class_name is not None:
+            return class_name  # same (interned) model
+
+        class_name = re.sub(r"\W+", "_", marshal_model.model_name).strip("_")
+        while class_name in self.class_names.values():
+            class_name = f"{class_name}_"
+        self.class_names[generated_model] = class_name
+        self.marshal_models.append(marshal_model)
+        return class_name
+
+    def import_name(self, module: str, name: str) -> str:
+        if module == "builtins":
+            return name
+        if "<locals>" in name:
+            raise TypeError(f"{module}.{name} can't be imported (defined locally)")
+        if not all(part.isidentifier() for part in name.split(".")):
+            raise TypeError(f"{module}.{name} can't be imported")
+        self.imports.add(module)
+        return f"{module}.{name}"
+
+    def find_marshal_model(self, klass: type) -> MarshalModel | None:
+        """Finds the registered MarshalModel, which generated `klass`"""
+        if not is_subtype(klass, BaseModel):
+            return None
+        if klass not in self.generated_models:  # models are generated on the go
+            self.generated_models = {
+                marshal_model.generated_model: marshal_model
+                for marshal_model in registry
+                if marshal_model.is_generated
+            }
+        return self.generated_models.get(klass)
+
+    def render_class(self, klass: type) -> str:
+        marshal_model = self.find_marshal_model(klass)
+        if marshal_model is not None:
+            class_name = self.add_model(marshal_model)
+            self.references.add(class_name)
+            return class_name
+        return self.import_name(klass.__module__, klass.__qualname__)
+
+    def render_value(self, value: Any) -> str:
+        if isinstance(value, Enum):
+            return f"{self.render_class(type(value))}.{value.name}"
+        if isinstance(value, literal_types):
+            return repr(value)
+        if isinstance(value, datetime_types):
+            self.imports.add("datetime")
+            return repr(value)
+        if isinstance(value, (tuple, list, set, frozenset)):
+            items = ", ".join(self.render_value(item) for item in value)
+            if isinstance(value, tuple):
+                return f"({items}{',' if len(value) == 1 else ''})"
+            if isinstance(value, list):
+                return f"[{items}]"
+            return f"{type(value).__name__}([{items}])"
+        if isinstance(value, dict):
+            items = ", ".join(
+                f"{self.render_value(key)}: {self.render_value(item)}"
+                for key, item in value.items()
+            )
+            return f"{{{items}}}"
+        if is_dataclass(value) and not isinstance(value, type):
+            arguments = ", ".join(
+                f"{field.name}={self.render_value(getattr(value, field.name))}"
+                for field in fields(value)
+                if field.init
+            )
+            return f"{self.render_class(type(value))}({arguments})"
+        if isinstance(value, type):
+            return self.render_class(value)
+        if isfunction(value) or isbuiltin(value):
+            return self.import_name(value.__module__, value.__qualname__)
+        raise TypeError(f"Value {value!r} can't be represented in code")
+
+    def render_type(self, type_hint: Any) -> str:
+        if type_hint is None or type_hint is NoneType:
+            return "None"
+        if type_hint is Any:
+            return self.import_name("typing", "Any")
+        if isinstance(type_hint, ForwardRef):
+            marshal_model = registry.references.get(type_hint.__forward_arg__)
+            if marshal_model is None:
+                raise TypeError(f"Unknown forward reference: {type_hint}")
+            return self.render_type(marshal_model.generated_model)
+
+        origin = get_origin(type_hint)
+        if origin is None:
+            if isinstance(type_hint, type):
+                return self.render_class(type_hint)
+            raise TypeError(f"Type {type_hint!r} can't be represented in code")
+
+        args = get_args(type_hint)
+        if origin in {Union, UnionType}:
+            return " | ".join(self.render_type(arg) for arg in args)
+        if origin is Literal:
+            rendered_args = ", ".join(self.render_value(arg) for arg in args)
+            return f"{self.import_name('typing', 'Literal')}[{rendered_args}]"
+        if origin is Annotated:
+            rendered_args = ", ".join(
+                [self.render_type(args[0])]
+                + [self.render_value(metadata) for metadata in args[1:]]
+            )
+            return f"{self.import_name('typing', 'Annotated')}[{rendered_args}]"
+        rendered_args = ", ".join(self.render_type(arg) for arg in args)
+        return f"{self.render_class(origin)}[{rendered_args}]"
+
+    def render_field(self, field: MarshalField) -> str:
+        name = field.generate_name()
+        if not name.isidentifier() or iskeyword(name):
+            raise TypeError(f"Field name {name!r} can't be represented in code")
+
+        field_data = [
+            f"{key}={self.render_value(value)}"
+            for key, value in field.generate_field_data()
+            if not (key == "default" and value is PydanticUndefined)
+        ]
+        annotation = self.render_type(field.generate_type())
+        field_info = self.import_name("pydantic", "Field")
+        return f"    {name}: {annotation} = {field_info}({', '.join(field_data)})"
+
+    def render_model(self, marshal_model: MarshalModel) -> Iterator[str]:
+        bases = marshal_model.generate_base()
+        if not isinstance(bases, tuple):
+            bases = (bases,)
+        class_arguments = [self.render_class(base) for base in bases] + [
+            f"{key}={self.render_value(value)}"
+            for key, value in marshal_model.generate_class_kwargs().items()
+        ]
+
+        class_name = self.class_names[marshal_model.generated_model]
+        yield f"class {class_name}({', '.join(class_arguments)}):"
+        yield f'    """Generated from {marshal_model.registry_key}"""'
+        if marshal_model.fields:
+            yield ""
+        for field in marshal_model.fields:
+            yield self.render_field(field)
+
+    def render(self, failures: dict[str, Exception] | None = None) -> str:
+        """
+        Generates code for all models, in order they were added.
+        A model failing to render is left out, along with models using it
+
+        :param failures: collects exceptions of failed models by registry key.
+            If not passed, they are raised in a :py:class:`ModelGenerationError`
+        """
+        errors: dict[str, Exception] = {} if failures is None else failures
+        rendered_models: dict[str, str] = {}
+        model_imports: dict[str, set[str]] = {}
+        model_references: dict[str, set[str]] = {}
+        marshal_models: dict[str, MarshalModel] = {}
+        index = 0
+        while index < len(self.marshal_models):  # can grow while rendering
+            marshal_model = self.marshal_models[index]
+            index += 1
+            class_name = self.class_names[marshal_model.generated_model]
+            marshal_models[class_name] = marshal_model
+            self.imports, self.references = set(), set()
+            try:
+                rendered_model = "\n".join(self.render_model(marshal_model))
+            except Exception as error:  # noqa: WPS440
+                errors[marshal_model.registry_key] = error
+            else:
+                rendered_models[class_name] = rendered_model
+                model_imports[class_name] = self.imports
+                model_references[class_name] = self.references
+
+        dropped = True
+        while dropped:  # models using left out ones are left out too
+            dropped = False
+            for class_name, references in list(model_references.items()):
+                missing = sorted(references - rendered_models.keys())
+                if missing:
+                    marshal_model = marshal_models[class_name]
+                    errors[marshal_model.registry_key] = TypeError(
+                        f"Uses {', '.join(missing)}, which can't be rendered"
+                    )
+                    del rendered_models[class_name], model_references[class_name]
+                    dropped = True
+
+        if failures is None and errors:
+            raise ModelGenerationError(errors) from next(iter(errors.values()))
+
+        imports = set().union(*(model_imports[name] for name in rendered_models))
+        sources = sorted(
+            {marshal_models[name].model_module for name in rendered_models}
+        )
+        return "\n".join(
+            [
+                HEADER.format(sources=", ".join(sources)),
+                "from __future__ import annotations",
+                "",
+                *(f"import {module}" for module in sorted(imports)),
+                "",
+                "",
+                "\n\n\n".join(rendered_models.values()),
+                "",
+                "",
+                *(f"{class_name}.model_rebuild()" for class_name in rendered_models),
+                "",
+            ]
+        )
+
+
+def generate_code(*modules: str, failures: dict[str, Exception] | None = None) -> str:
+    """
+    Generates code for all registered models defined in `modules`
+    (see :py:class:`CodeGenerator`), placing dependencies first.
+    Abstract models are skipped, models failing to generate or render are left out,
+    see :py:meth:`MarshalRegistry.generate_models` & :py:meth:`CodeGenerator.render`
+    for `failures`
+    """
+    marshal_models = [
+        marshal_model
+        for marshal_model in registry.iter_build_order()
+        if marshal_model.model_module in modules
+    ]
+    errors: dict[str, Exception] = {} if failures is None else failures
+    registry.generate_models(marshal_models, errors)
+    code = CodeGenerator(
+        marshal_model for marshal_model in marshal_models if marshal_model.is_generated
+    ).render(errors)
+    if failures is None and errors:
+        raise ModelGenerationError(errors) from next(iter(errors.values()))
+    return code
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Hashable, Iterator
 from enum import Enum
-from typing import Any, ClassVar, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
 
 from pydantic import ConfigDict, RootModel
 from pydantic.fields import Field
 from pydantic_core import PydanticUndefined, PydanticUndefinedType
 from typing_extensions import Self
 
+from pydantic_marshals.base.cache import describe_type, describe_value, qualified_name
 from pydantic_marshals.base.type_aliases import FieldType, TypeHint
 
+if TYPE_CHECKING:
+    from pydantic_marshals.base.models import MarshalModel
+    from pydantic_marshals.base.selections import FieldSelection
+
 T = TypeVar("T")
 
 
@@ -32,6 +37,13 @@ class MarshalField:
     marshal_root_model: ClassVar[type[RootModel[Any]]] = MarshalRootModel
     """Base root model class. Subclasses of :py:class:`MarshalRootModel` are recommended"""
 
+    source_types: ClassVar[tuple[type, ...] | None] = None
+    """
+    Types of the first argument of :py:meth:`convert`, which can be converted.
+    Used for dispatching in :py:meth:`FieldConverter.convert_field`,
+    None means that any type could be accepted
+    """
+
     def __init__(self, alias: str | None = None) -> None:
         """
         :param alias: same as Field(alias=...), can be None for no alias
@@ -42,7 +54,8 @@ class MarshalField:
     def convert(cls, *source: Any) -> Self | None:
         """
         Convert something into a field.
-        If conversion is not possible, this method should return None
+        If conversion is not possible, this method should return None.
+        Only called with sources matching :py:attr:`source_types`, if it is set
         """
         raise NotImplementedError
 
@@ -83,6 +96,54 @@ class MarshalField:
             Field(**dict(self.generate_field_data())),
         )
 
+    def structural_key(self) -> Hashable:
+        """
+        Representation of the generated field, which is equal for fields
+        generating the same definition from the same source. Used for interning in
+        :py:meth:`pydantic_marshals.models.base.MarshalModel.generate_interned_model`
+        """
+        return (
+            type(self),
+            self.generate_name(),
+            self.generate_type(),
+            tuple(
+                (key, type(value), value) for key, value in self.generate_field_data()
+            ),
+        )
+
+    def describe_source(self, seen: set[int]) -> dict[str, Any]:
+        """
+        JSON-compatible description of everything the field is generated from,
+        used for fingerprints in :py:class:`pydantic_marshals.base.cache.SchemaCache`.
+        Fields with nested MarshalModels should describe them with
+        :py:func:`pydantic_marshals.base.cache.describe_model` (passing `seen`),
+        so nested models aren't generated
+        """
+        return {
+            "kind": qualified_name(type(self)),
+            "type": describe_type(self.generate_type()),
+            "data": {
+                key: describe_value(value) for key, value in self.generate_field_data()
+            },
+        }
+
+    def dependencies(self) -> Iterator[MarshalModel]:
+        """
+        Yields models, which have to be generated before the field can be used, see
+        :py:meth:`pydantic_marshals.models.base.MarshalModel.dependencies`
+        """
+        yield from ()  # noqa: WPS353
+
+    def select_fields(self, selection: FieldSelection) -> Self:
+        """
+        Creates the same field, but with a `selection` of nested fields, see
+        :py:meth:`pydantic_marshals.models.base.MarshalModel.select_fields`.
+        Only fields with nested models can do this
+
+        :raises ValueError: if nested fields can't be selected
+        """
+        raise ValueError(f"Field {self.generate_name()} has no nested fields")
+
     def generate_root_model(self) -> type[RootModel[Any]]:
         # TODO maybe move to `contains`
         return self.marshal_root_model[self.generate_type()]  # type: ignore[no-any-return, index]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Sequence
 from typing import Any, get_type_hints
 
 from typing_extensions import Self
@@ -14,27 +14,45 @@ class PropertyField(PatchMarshalField):
     """
     Implementation of :py:class:`MarshalField` to use with properties
     Can be used directly or with an added type hit override
+
+    Attributes, which the property reads, can be declared in `depends`, for
+    implementations to load them too (e.g. columns in SQLAlchemy's projections)
     """
 
+    source_types = (property,)
+
     def __init__(
         self,
-        mapped_property: property,
+        mapped_property: property | Callable[[Any], Any],
         type_: TypeHint | None = None,
         alias: str | None = None,
         patch: bool = False,
+        depends: Sequence[Any] = (),
     ) -> None:
+        """
+        :param mapped_property: the property. Its getter type is accepted too,
+            because type checkers see properties in class bodies as functions
+        """
         super().__init__(alias, patch)
         self.mapped_property = mapped_property
+        self.depends: tuple[Any, ...] = tuple(depends)
 
-        if self.mapped_property.fget is None:
+        getter: Callable[[Any], Any] | None = getattr(mapped_property, "fget", None)
+        if getter is None:
             raise RuntimeError("Property's fget is None somehow")
-        self.getter: Callable[[Any], Any] = self.mapped_property.fget
+        self.getter: Callable[[Any], Any] = getter
 
         self.name: str = self.getter.__name__
         self.type_: TypeHint = type_ or get_type_hints(self.getter).get("return", Any)
 
     def as_patch(self) -> PropertyField:
-        return PropertyField(self.mapped_property, self.type_, self.alias, patch=True)
+        return PropertyField(
+            self.mapped_property,
+            self.type_,
+            self.alias,
+            patch=True,
+            depends=self.depends,
+        )
 
     @classmethod
     def convert(cls, mapped: Any = None, type_: Any = None, *_: Any) -> Self | None:
@@ -48,6 +66,9 @@ class PropertyField(PatchMarshalField):
     def generate_type(self) -> TypeHint:
         return self.type_
 
+    def structural_key(self) -> Hashable:
+        return super().structural_key(), self.mapped_property
+
 
 PropertyType = (
     property
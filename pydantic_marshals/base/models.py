@@ -1,14 +1,174 @@
-from collections.abc import Iterator
-from typing import Any, ClassVar
+import copyreg
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from importlib import import_module
+from threading import get_ident
+from types import NoneType
+from typing import Any, ClassVar, Generic, Union
+from weakref import WeakSet
 
 from pydantic import BaseModel, ConfigDict, create_model
+from pydantic._internal._model_construction import ModelMetaclass
+from typing_extensions import Self, TypeVar
 
+from pydantic_marshals.base.cache import SchemaCache
 from pydantic_marshals.base.fields.base import MarshalField
+from pydantic_marshals.base.registry import registry
+from pydantic_marshals.base.selections import (
+    FieldSelection,
+    SelectionCache,
+    parse_field_selection,
+)
+from pydantic_marshals.base.serializers import (
+    AttributeSerializer,
+    aiter_json_array,
+    aiter_ndjson,
+    dump_json_array,
+    get_list_adapter,
+    get_serializer,
+    iter_json_array,
+    iter_ndjson,
+    prepare_sources,
+)
+from pydantic_marshals.base.type_aliases import TypeHint
+from pydantic_marshals.utils import aiter_batches, is_subtype, iter_batches
 
+M = TypeVar("M", bound="MarshalModel")
+B = TypeVar("B", bound=BaseModel)
 
-class MarshalBaseModel(BaseModel):
+
+class MarshalModelMetaclass(ModelMetaclass):
+    """
+    Metaclass of :py:class:`MarshalBaseModel`. Pickling is customized
+    for classes of this metaclass only (see :py:func:`reduce_model_class`),
+    other pydantic models are pickled as usual
+    """
+
+
+class MarshalBaseModel(BaseModel, metaclass=MarshalModelMetaclass):
     model_config = ConfigDict(from_attributes=True)
 
+    __marshal_model__: ClassVar["MarshalModel | None"] = None
+    """
+    The :py:class:`MarshalModel`, which generated this model (if any).
+    MarshalModels are descriptors, use :py:meth:`get_marshal_model` to read it
+    """
+
+    @classmethod
+    def get_marshal_model(cls) -> "MarshalModel | None":
+        """Finds the :py:class:`MarshalModel`, which generated this model or its base"""
+        for klass in cls.__mro__:
+            marshal_model = vars(klass).get("__marshal_model__")
+            if marshal_model is not None:
+                return marshal_model  # type: ignore[no-any-return]
+        return None
+
+    @classmethod
+    def dump_attributes_json(cls, source: Any) -> bytes:
+        """
+        Same as ``model_validate(source).model_dump_json()``, but without creating
+        model instances. Only for trusted data, see :py:class:`AttributeSerializer`
+        """
+        return get_serializer(cls).to_json(prepare_sources(cls, (source,))[0])
+
+    @classmethod
+    def dump_columns_json(cls, sources: Iterable[Any], flatten: bool = False) -> bytes:
+        """
+        Serializes `sources` into one JSON object with an array per field,
+        without creating model instances, see :py:meth:`MarshalModel.dump_columns_json`
+        """
+        return get_serializer(cls).to_columns_json(
+            prepare_sources(cls, sources), flatten
+        )
+
+    @classmethod
+    def select_fields(cls, *paths: str) -> type[BaseModel]:
+        """
+        Generated model with only the selected fields (cached),
+        see :py:meth:`MarshalModel.select_fields`
+        """
+        marshal_model = cls.get_marshal_model()
+        if marshal_model is None:
+            raise TypeError(f"{cls.__name__} is not generated by a MarshalModel")
+        return marshal_model.select_fields(*paths).generated_model
+
+    @classmethod
+    def validate_many(cls: type[B], sources: Iterable[Any]) -> list[B]:
+        """Validates all `sources` in one call, see :py:func:`get_list_adapter`"""
+        return get_list_adapter(cls).validate_python(prepare_sources(cls, sources))
+
+    @classmethod
+    def dump_many_json(cls, sources: Iterable[Any]) -> bytes:
+        """
+        Validates all `sources` & serializes them into one JSON array
+        in batches, see :py:func:`dump_json_array`
+        """
+        return dump_json_array(cls, prepare_sources(cls, sources))
+
+    @classmethod
+    def prepare_batch(cls, batch: list[Any]) -> list[Any]:
+        """
+        Hook for unwrapping & checking sources (e.g. query result rows) before
+        validation or serialization, used by all batch & fast-path methods
+        (streaming included), see :py:func:`prepare_sources`
+        """
+        return batch
+
+    @classmethod
+    def iter_ndjson(
+        cls,
+        sources: Iterable[Any],
+        batch_size: int = 1000,
+    ) -> Iterator[bytes]:
+        """
+        Streams `sources` (any iterable, e.g. a query result with ``yield_per``)
+        as NDJSON in chunks, validating `batch_size` objects at a time
+        """
+        batches = iter_batches(sources, batch_size)
+        return iter_ndjson(cls, map(cls.prepare_batch, batches))
+
+    @classmethod
+    def iter_json_array(
+        cls,
+        sources: Iterable[Any],
+        batch_size: int = 1000,
+    ) -> Iterator[bytes]:
+        """Same as :py:meth:`iter_ndjson`, but chunks form one JSON array"""
+        batches = iter_batches(sources, batch_size)
+        return iter_json_array(cls, map(cls.prepare_batch, batches))
+
+    @classmethod
+    def aiter_ndjson(
+        cls,
+        sources: AsyncIterable[Any],
+        batch_size: int = 1000,
+    ) -> AsyncIterator[bytes]:
+        """
+        Async version of :py:meth:`iter_ndjson` for async iterables, e.g.
+        ``AsyncSession.stream(...)`` results. Yields to the event loop between batches
+        """
+        batches = aiter_batches(sources, batch_size)
+        return aiter_ndjson(cls, (cls.prepare_batch(batch) async for batch in batches))
+
+    @classmethod
+    def aiter_json_array(
+        cls,
+        sources: AsyncIterable[Any],
+        batch_size: int = 1000,
+    ) -> AsyncIterator[bytes]:
+        """Same as :py:meth:`aiter_ndjson`, but chunks form one JSON array"""
+        batches = aiter_batches(sources, batch_size)
+        return aiter_json_array(
+            cls, (cls.prepare_batch(batch) async for batch in batches)
+        )
+
 
 class FieldConverter:
     field_types: tuple[type[MarshalField], ...] = ()
@@ -32,14 +192,61 @@ class FieldConverter:
         if cls.default_field_type is not None:
             yield cls.default_field_type
 
-    def __init_subclass__(cls, **_: Any) -> None:
+    field_type_dispatch: ClassVar[
+        dict[type, tuple[type[MarshalField], ...]] | None
+    ] = None
+    """
+    Cache of :py:attr:`field_types` applicable to each source type,
+    see :py:attr:`MarshalField.source_types` and :py:meth:`find_field_types`
+    """
+
+    @classmethod
+    def filter_field_types(cls, source_type: type) -> tuple[type[MarshalField], ...]:
+        """
+        Selects :py:attr:`field_types`, which can convert a source of `source_type`
+        (with respect to its MRO), keeping the order intact
+        """
+        return tuple(
+            field_type
+            for field_type in cls.field_types
+            if getattr(field_type, "source_types", None) is None
+            or issubclass(source_type, field_type.source_types)  # type: ignore[arg-type]
+        )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
         cls.field_types = tuple(cls.collect_field_types())
+        cls.field_type_dispatch = {}
+        for field_type in cls.field_types:
+            for source_type in getattr(field_type, "source_types", None) or ():
+                cls.field_type_dispatch[source_type] = cls.filter_field_types(
+                    source_type
+                )
+
+    @classmethod
+    def find_field_types(
+        cls, raw_field: tuple[Any, ...]
+    ) -> Sequence[type[MarshalField]]:
+        """
+        Finds :py:attr:`field_types` to try for the `raw_field` in the dispatch table.
+        Falls back to all of them if the table is not set up (outside subclasses)
+        """
+        if cls.field_type_dispatch is None:
+            return cls.field_types
+
+        source_type = type(raw_field[0]) if raw_field else NoneType
+        field_types = cls.field_type_dispatch.get(source_type)
+        if field_types is None:
+            field_types = cls.filter_field_types(source_type)
+            cls.field_type_dispatch[source_type] = field_types
+        return field_types
 
     @classmethod
     def convert_field(cls, raw_field: Any) -> MarshalField:
         """
         Converts "raw_field"s into :py:class:`MarshalField` by trying to call
-        the .convert method on all of :py:attr:`field_types` in this class.
+        the .convert method on :py:attr:`field_types` in this class, which accept
+        the source's type (see :py:meth:`find_field_types`).
         Will raise a `RuntimeError` if none of them return MarshalField
         """
         if isinstance(raw_field, MarshalField):
@@ -48,7 +255,7 @@ class FieldConverter:
         if not isinstance(raw_field, tuple):
             raw_field = (raw_field,)
 
-        for field_type in cls.field_types:
+        for field_type in cls.find_field_types(raw_field):
             field: MarshalField | None = field_type.convert(*raw_field)
             if field is not None:
                 return field
@@ -85,11 +292,16 @@ class FieldConverter:
         )
 
 
-class MarshalModel(FieldConverter):
+G = TypeVar("G", bound=MarshalBaseModel, default=MarshalBaseModel, covariant=True)
+
+
+class MarshalModel(FieldConverter, Generic[G]):
     """
     Basic boilerplate class for all pydantic-marshals models.
     This is a complete class, but it could be extended with alternative constructors,
-    updated base model, new runtime methods or auto-converters for fields
+    updated base model, new runtime methods or auto-converters for fields.
+    Subclasses with another :py:attr:`model_base_class` should also parametrize
+    this class with it, to type :py:attr:`generated_model` accordingly
     """
 
     def __init__(
@@ -103,44 +315,449 @@ class MarshalModel(FieldConverter):
         """
         self.fields: list[MarshalField] = list(fields)
         self.bases: list[type[BaseModel]] = bases
-        self._generated_model: type[BaseModel] | None = None
+        self._generated_model: type[G] | None = None
+        self._generating_thread: int | None = None
+        self._derived_models: dict[Hashable, MarshalModel] = {}
+        self.prototype: Self | None = None
+        self._shares: WeakSet[Self] = WeakSet()
+        self.selected_from: tuple[MarshalModel, FieldSelection] | None = None
+        self._selection_cache = SelectionCache(self.selection_cache_size)
 
-    def __set_name__(self, owner: type, name: str) -> None:
+    owner: type[Any] | None = None
+    """Class with this model in its body (if any), set in :py:meth:`__set_name__`"""
+    attribute: str | None = None
+    """Name of this model in the body of :py:attr:`owner`"""
+
+    def __set_name__(self, owner: type[Any], name: str) -> None:
         self.model_name: str = f"{owner.__qualname__}.{name}"
+        self.model_module: str = owner.__module__
+        self.owner = owner
+        self.attribute = name
+        registry.register(self)
+
+    @property
+    def registry_key(self) -> str:
+        """Unique name of the model in :py:data:`registry`"""
+        return f"{self.model_module}:{self.model_name}"
+
+    def dependencies(self) -> Iterator["MarshalModel"]:
+        """
+        Yields models, which have to be generated before this one.
+        Collected from :py:meth:`MarshalField.dependencies` of all fields
+        """
+        for field in self.fields:
+            yield from field.dependencies()
+
+    def derive(self, key: Any, derive_model: Callable[[], M]) -> M:
+        """
+        Memoizes models derived from this one (patch variants, extensions, etc.).
+        Calls `derive_model` only once per `key`, keeping the result as a prototype.
+        Every call returns a new :py:meth:`share` of it, so each class attribute
+        gets its own name, while the pydantic model is only generated once per
+        owner class. None or unhashable keys disable memoization
+
+        :param key: hashable representation of all arguments used for derivation
+        :param derive_model: function to create the derived model
+        """
+        if key is None:
+            return derive_model()
+        try:
+            derived_model = self._derived_models.get(key)
+        except TypeError:  # unhashable key
+            return derive_model()
+        if derived_model is None:
+            derived_model = self._derived_models.setdefault(key, derive_model())
+        return derived_model.share()  # type: ignore[return-value]
+
+    def share(self) -> Self:
+        """
+        Creates a new MarshalModel with the same fields & bases, which reuses
+        the pydantic model of other shares of this one (or of its :py:attr:`prototype`)
+        in the same owner class, see :py:meth:`generate_shared_model`
+        """
+        marshal_model = type(self)(*self.fields, bases=self.bases)
+        marshal_model.prototype = self.prototype or self
+        marshal_model.prototype._shares.add(marshal_model)  # noqa: WPS437
+        return marshal_model
+
+    selection_cache_size: ClassVar[int] = 128
+    """
+    Maximum number of models kept by :py:meth:`select_fields` for each model,
+    least recently used ones are evicted first. Zero disables caching
+    """
+
+    def select_fields(self, *paths: str) -> Self:
+        """
+        Derives a model with only the selected fields (sparse fieldsets), e.g.
+        ``User.FullModel.select_fields("id,name,avatar.id")`` for a query string.
+        Paths are dotted to select fields of nested models
+        (see :py:meth:`MarshalField.select_fields`) and can be comma-separated.
+        Fields are matched by names & aliases, no paths select the whole model.
+
+        Models are cached by the normalized selection in a bounded LRU, see
+        :py:attr:`selection_cache_size`. Repeated selections only cost parsing
+        & a lookup, while arbitrary ones can't grow memory without limit
+
+        :raises ValueError: if fields are unknown or have no nested fields
+        """
+        return self.select_field_tree(parse_field_selection(paths))
+
+    def select_field_tree(self, selection: FieldSelection) -> Self:
+        """Same as :py:meth:`select_fields`, but for a parsed selection"""
+        if not selection:
+            return self
+        return self._selection_cache.get(  # type: ignore[return-value]
+            selection,
+            lambda: self.create_selection(selection),
+        )
+
+    def create_selection(self, selection: FieldSelection) -> Self:
+        positions: dict[str, int] = {}
+        for position, field in enumerate(self.fields):
+            positions[field.generate_name()] = position
+            if field.alias is not None:
+                positions.setdefault(field.alias, position)
 
-    model_base_class: ClassVar[type[BaseModel]] = MarshalBaseModel
+        selected: dict[int, MarshalField] = {}
+        for name, nested_selection in selection:
+            index = positions.get(name)
+            if index is None:
+                model_name = getattr(self, "model_name", type(self).__name__)
+                raise ValueError(f"Unknown field {name} in {model_name}")
+            field = self.fields[index]
+            if nested_selection:
+                field = field.select_fields(nested_selection)
+            selected[index] = field
+        marshal_model = self.create_selected_model(
+            [selected[key] for key in sorted(selected)]
+        )
+        marshal_model.selected_from = self, selection
+        return marshal_model
+
+    def create_selected_model(self, fields: list[MarshalField]) -> Self:
+        """
+        Creates the model for :py:meth:`select_fields` with selected `fields`.
+        It's named after this one (``User.FullModel[id,name]``), but isn't
+        registered. Such names can't be imported, so generated models are pickled
+        by the registry key of this one & the selection, see :py:meth:`reduction`
+        """
+        marshal_model = type(self)(*fields, bases=self.bases)
+        model_name = getattr(self, "model_name", type(self).__name__)
+        names = ",".join(field.generate_name() for field in fields)
+        marshal_model.model_name = f"{model_name}[{names}]"
+        marshal_model.model_module = getattr(self, "model_module", __name__)
+        return marshal_model
+
+    model_base_class: ClassVar[type[MarshalBaseModel]] = MarshalBaseModel
     """Base model class. Subclasses of :py:class:`MarshalBaseModel` are recommended"""
 
     def generate_base(self) -> type[BaseModel] | tuple[type[BaseModel], ...]:
         """Generate __base__ argument for :py:func:`create_model`"""
         return self.model_base_class, *self.bases
 
-    def generate_model(self) -> type[BaseModel]:
-        """Generate the pydantic model"""
+    defer_build: ClassVar[bool] = False
+    """
+    Opt-in: generate pydantic models with ``defer_build=True``. Model classes are
+    still created right away, but their validators and serializers are only
+    built on first validation or serialization, see :py:attr:`is_materialized`
+    """
+
+    def generate_class_kwargs(self) -> dict[str, Any]:
+        """Generate __cls_kwargs__ argument (config overrides) for create_model"""
+        if self.defer_build:
+            return {"defer_build": True}
+        return {}
+
+    def generate_model(self) -> type[G]:
+        """
+        Generate the pydantic model. It is placed in the module of the owner class,
+        so the model (and its instances) can be pickled, see :py:meth:`reduction`
+        """
         return create_model(  # type: ignore[call-overload, no-any-return]
             self.model_name,
+            __module__=getattr(self, "model_module", None),  # if named manually
             __base__=self.generate_base(),
+            __cls_kwargs__=self.generate_class_kwargs(),
             **{
                 mapped_field.generate_name(): mapped_field.generate_field()
                 for mapped_field in self.fields
             },
         )
 
+    intern_models: ClassVar[bool] = False
+    """
+    Opt-in: share one generated pydantic model between all MarshalModels
+    with equal :py:meth:`structural_key`, see :py:meth:`generate_interned_model`
+    """
+
+    def structural_key(self) -> Hashable | None:
+        """
+        Key, equal for MarshalModels generating the same pydantic model from the
+        same sources (bases and :py:meth:`MarshalField.structural_key` of fields).
+        Returns None if some of the field data can't be hashed
+        """
+        key = (
+            self.generate_base(),
+            tuple(self.generate_class_kwargs().items()),
+            tuple(field.structural_key() for field in self.fields),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def generate_interned_model(self) -> type[G]:
+        """
+        Same as :py:meth:`generate_model`, but reuses models from the registry
+        if :py:attr:`intern_models` is enabled. Models are shared under the name of
+        the first MarshalModel that generated them
+        """
+        key = self.structural_key() if self.intern_models else None
+        if key is None:
+            return self.generate_model()
+        return registry.intern_model(key, self.generate_model)
+
+    def generate_shared_model(self) -> type[G]:
+        """
+        Same as :py:meth:`generate_interned_model`, but models from :py:meth:`share`
+        reuse one generated by another share of their :py:attr:`prototype`
+        with the same :py:attr:`owner`. Generated models are bound to the owner
+        (names, pickling, queries), so shares in other classes get their own
+        """
+        prototype = self.prototype
+        if prototype is None:
+            return self.generate_interned_model()
+        for shared in prototype._shares:  # noqa: WPS437
+            model = shared._generated_model  # noqa: WPS437
+            if shared.owner is self.owner and model is not None:
+                return model
+        return self.generate_interned_model()
+
+    def reduction(self) -> tuple[str, str, tuple[FieldSelection, ...]] | None:
+        """
+        Arguments of :py:func:`find_generated_model` for finding the generated model
+        in other processes (e.g. when pickled for worker processes): the module
+        & registry key of the model, plus selections for :py:meth:`select_fields`.
+        Returns None for unregistered models, which are pickled by name
+        """
+        if self.selected_from is not None:
+            source, selection = self.selected_from
+            reduction = source.reduction()
+            if reduction is None:
+                return None
+            source_module, registry_key, selections = reduction
+            return source_module, registry_key, (*selections, selection)
+
+        model_module: str | None = getattr(self, "model_module", None)
+        if model_module is None or registry.get(self.registry_key) is not self:
+            return None
+        return model_module, self.registry_key, ()
+
+    @property
+    def is_abstract(self) -> bool:
+        """
+        Abstract models are only templates for others (e.g. ones declared in
+        abstract classes), they are skipped in :py:meth:`MarshalRegistry.warm_up`
+        """
+        return False
+
+    @property
+    def is_generated(self) -> bool:
+        return self._generated_model is not None
+
     @property
-    def generated_model(self) -> type[BaseModel]:
+    def is_materialized(self) -> bool:
+        """
+        Checks if the model is generated and its validator & serializer are built.
+        Only differs from :py:attr:`is_generated` in :py:attr:`defer_build` mode
+        """
+        return (
+            self._generated_model is not None
+            and self._generated_model.__pydantic_complete__
+        )
+
+    @property
+    def generated_model(self) -> type[G]:
         """
         Pydantic model, generated by the MarshalModel
         First call to this will call :py:meth:`.generate_model`,
         then save the result to :py:attr:`._generated_model`,
         for it to be reused on future calls
+
+        Generation is single-flight: if multiple threads access a model at once,
+        only one of them generates it, others wait and receive the same class.
+        The lock is shared between all models, so cyclic models can't deadlock
         """
         if self._generated_model is None:
-            self._generated_model = self.generate_model()
+            with registry.generation_lock:
+                if self._generated_model is None:
+                    self._generated_model = self.generate_referenced_model()
         return self._generated_model
 
+    def generate_referenced_model(self) -> type[G]:
+        """
+        Same as :py:meth:`generate_shared_model`, but also resolves forward
+        references, created by :py:meth:`reference` on recursive models
+        """
+        reference_count = registry.reference_count
+        self._generating_thread = get_ident()
+        try:
+            model = self.generate_shared_model()
+        finally:
+            self._generating_thread = None
+
+        if registry.reference_count != reference_count:
+            registry.add_unresolved(model)
+        if (
+            isinstance(model, type)
+            and issubclass(model, MarshalBaseModel)
+            and vars(model).get("__marshal_model__") is None
+        ):
+            model.__marshal_model__ = self  # interned models keep the first one
+        self._generated_model = model
+        registry.resolve_references()
+        return model
+
+    def reference(self) -> TypeHint:
+        """
+        Type hint for using the generated model inside other models.
+        Same as :py:attr:`generated_model`, but if called while generating this
+        model (i.e. it's recursive), a forward reference is returned
+        """
+        if self._generated_model is None and self._generating_thread == get_ident():
+            return registry.forward_reference(self)
+        return self.generated_model
+
+    schema_cache: ClassVar[SchemaCache | None] = None
+    """Opt-in on-disk cache for :py:meth:`.json_schema`, disabled by default"""
+
+    def json_schema(self) -> dict[str, Any]:
+        """
+        JSON schema of the generated model. If :py:attr:`schema_cache` is set,
+        the schema is loaded from it, without generating the pydantic model
+        """
+        if self.schema_cache is None:
+            return self.generated_model.model_json_schema()
+        return self.schema_cache.json_schema(self)
+
+    @property
+    def serializer(self) -> AttributeSerializer:
+        """Serializer for the generated model, see :py:class:`AttributeSerializer`"""
+        return get_serializer(self.generated_model)
+
+    def dump_attributes_json(self, source: Any) -> bytes:
+        """
+        Serializes `source` (e.g. an ORM instance) into JSON by reading its attributes
+        directly, without validation & creating model instances. Only for trusted
+        data: validators & custom serializers of the model are not applied
+        """
+        model = self.generated_model
+        return get_serializer(model).to_json(prepare_sources(model, (source,))[0])
+
+    def dump_columns_json(self, sources: Iterable[Any], flatten: bool = False) -> bytes:
+        """
+        Serializes `sources` into columnar JSON (``{"id": [...], "name": [...]}``)
+        by reading attributes one field at a time, without validation & creating
+        model instances. Only for trusted data, see :py:meth:`dump_attributes_json`.
+        Nested models can be flattened, see :py:meth:`AttributeSerializer.to_columns`
+        """
+        model = self.generated_model
+        return get_serializer(model).to_columns_json(
+            prepare_sources(model, sources), flatten
+        )
+
+    def validate_many(self, sources: Iterable[Any]) -> list[G]:
+        """
+        Validates all `sources` (e.g. ORM objects from a query) with a cached
+        ``TypeAdapter(list[generated_model])``, in one call to pydantic-core
+        """
+        model = self.generated_model
+        return get_list_adapter(model).validate_python(prepare_sources(model, sources))
+
+    def dump_many_json(self, sources: Iterable[Any]) -> bytes:
+        """
+        Same as :py:meth:`validate_many`, but serializes into a JSON array.
+        Objects are validated in batches, see :py:func:`dump_json_array`
+        """
+        model = self.generated_model
+        return dump_json_array(model, prepare_sources(model, sources))
+
     def __get__(
         self,
         instance: Any,  # noqa: U100
         owner: Any | None = None,  # noqa: U100
-    ) -> type[BaseModel]:
+    ) -> type[G]:
         return self.generated_model
+
+
+ModelReference = Union[type[BaseModel], MarshalModel, str]
+"""
+A pydantic model, a :py:class:`MarshalModel` or a name to look it up in the
+registry with (see :py:meth:`MarshalRegistry.find`). Last two are resolved lazily
+"""
+
+
+def find_marshal_model(model: ModelReference) -> MarshalModel | None:
+    """Finds the MarshalModel behind a lazy model reference, if any"""
+    if isinstance(model, str):
+        return registry.find(model)
+    if isinstance(model, MarshalModel):
+        return model
+    return None
+
+
+def find_source_model(model: ModelReference) -> MarshalModel | None:
+    """
+    Same as :py:func:`find_marshal_model`, but also finds the MarshalModel,
+    which generated a pydantic model (see :py:attr:`MarshalBaseModel.__marshal_model__`)
+    """
+    marshal_model = find_marshal_model(model)
+    if marshal_model is None and is_subtype(model, MarshalBaseModel):
+        return vars(model).get("__marshal_model__")
+    return marshal_model
+
+
+def resolve_model_reference(model: ModelReference) -> TypeHint:
+    """
+    Converts model references into type hints, see :py:meth:`MarshalModel.reference`.
+    Pydantic models are returned as is
+    """
+    marshal_model = find_marshal_model(model)
+    if marshal_model is None:
+        return model
+    return marshal_model.reference()
+
+
+def find_generated_model(
+    model_module: str,
+    registry_key: str,
+    selections: tuple[FieldSelection, ...],
+) -> type[BaseModel]:
+    """
+    Finds (generating if needed) the pydantic model described by
+    :py:meth:`MarshalModel.reduction`. The module is imported to register its models
+
+    :raises LookupError: if the model isn't registered after import
+    """
+    import_module(model_module)
+    marshal_model = registry.find(registry_key)
+    for selection in selections:
+        marshal_model = marshal_model.select_field_tree(selection)
+    return marshal_model.generated_model
+
+
+def reduce_model_class(model: MarshalModelMetaclass) -> Any:
+    """
+    Pickles generated models through the registry, see :py:meth:`reduction`.
+    Models from local scopes, shared derived & selected models can be restored.
+    Other subclasses of :py:class:`MarshalBaseModel` are pickled by name, as usual
+    """
+    marshal_model = vars(model).get("__marshal_model__")
+    reduction = None if marshal_model is None else marshal_model.reduction()
+    if reduction is None:
+        return model.__qualname__
+    return find_generated_model, reduction
+
+
+copyreg.pickle(MarshalModelMetaclass, reduce_model_class)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from threading import RLock
+from time import perf_counter
+from typing import TYPE_CHECKING, ForwardRef, TypeVar
+from weakref import WeakValueDictionary
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from pydantic_marshals.base.models import MarshalModel
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class ModelGenerationError(RuntimeError):
+    """
+    Raised by :py:meth:`MarshalRegistry.generate_models` after all models are
+    processed, if some of them failed. Original exceptions are kept in
+    :py:attr:`failures` (by registry key), the first one is also the cause
+    """
+
+    def __init__(self, failures: dict[str, Exception]) -> None:
+        keys = ", ".join(failures)
+        super().__init__(f"Failed to generate {len(failures)} model(s): {keys}")
+        self.failures = failures
+
+
+class MarshalRegistry:
+    """
+    Process-wide collection of all named :py:class:`MarshalModel`s.
+    Models are registered from :py:meth:`MarshalModel.__set_name__`,
+    so every model declared inside a class body ends up here
+    """
+
+    def __init__(self) -> None:
+        self.models: WeakValueDictionary[str, MarshalModel] = WeakValueDictionary()
+        self.interned_models: WeakValueDictionary[
+            Hashable, type[BaseModel]
+        ] = WeakValueDictionary()
+
+        self.generation_lock = RLock()
+        """Lock for generating models, shared to avoid deadlocks on cyclic models"""
+        self.references: WeakValueDictionary[str, MarshalModel] = WeakValueDictionary()
+        self.reference_count: int = 0
+        self.unresolved_models: list[type[BaseModel]] = []
+
+    def register(self, marshal_model: MarshalModel) -> None:
+        self.models[marshal_model.registry_key] = marshal_model
+
+    def __iter__(self) -> Iterator[MarshalModel]:
+        return iter(list(self.models.values()))
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def get(self, registry_key: str) -> MarshalModel | None:
+        return self.models.get(registry_key)
+
+    def find(self, name: str) -> MarshalModel:
+        """
+        Finds a model by its registry key (``module:Class.Model``),
+        its name (``Class.Model``) or the end of its name (``Model``)
+
+        :raises LookupError: if no models or multiple models match the name
+        """
+        marshal_model = self.models.get(name)
+        if marshal_model is not None:
+            return marshal_model
+
+        candidates = [
+            marshal_model
+            for marshal_model in self
+            if marshal_model.model_name == name
+            or marshal_model.model_name.endswith(f".{name}")
+        ]
+        if len(candidates) == 1:
+            return candidates[0]
+        if not candidates:
+            raise LookupError(f"Model {name} not found")
+        keys = ", ".join(candidate.registry_key for candidate in candidates)
+        raise LookupError(f"Model {name} is ambiguous: {keys}")
+
+    def forward_reference(self, marshal_model: MarshalModel) -> ForwardRef:
+        """
+        Creates a forward reference to a model, which isn't generated yet.
+        Models using it are resolved in :py:meth:`resolve_references`
+        """
+        name = f"{type(marshal_model).__name__}_{id(marshal_model):x}"
+        self.references[name] = marshal_model
+        self.reference_count += 1
+        return ForwardRef(name)
+
+    def add_unresolved(self, model: type[BaseModel]) -> None:
+        self.unresolved_models.append(model)
+
+    def resolve_references(self) -> None:
+        """
+        Rebuilds models with forward references (see :py:meth:`forward_reference`),
+        for which all referenced models are generated
+        """
+        while self.unresolved_models:
+            namespace = {
+                name: marshal_model.generated_model
+                for name, marshal_model in self.references.items()
+                if marshal_model.is_generated
+            }
+            unresolved_models = [
+                model
+                for model in self.unresolved_models
+                if model.model_rebuild(raise_errors=False, _types_namespace=namespace)
+                is False
+            ]
+            if len(unresolved_models) == len(self.unresolved_models):
+                return  # no progress, waiting for more models to be generated
+            self.unresolved_models = unresolved_models
+
+    def intern_model(
+        self,
+        structural_key: Hashable,
+        generate_model: Callable[[], type[T]],
+    ) -> type[T]:
+        """
+        Returns the pydantic model stored under `structural_key`,
+        calling `generate_model` to create it only if there is none.
+        Structural keys include the bases, so the stored model is of the same type
+        """
+        model = self.interned_models.get(structural_key)
+        if model is None:
+            model = self.interned_models.setdefault(structural_key, generate_model())
+        return model  # type: ignore[return-value]
+
+    def count_materialized(self) -> int:
+        """
+        Counts distinct generated models with built validators & serializers,
+        see :py:attr:`MarshalModel.is_materialized`
+        """
+        return len(
+            {
+                id(marshal_model.generated_model)
+                for marshal_model in self
+                if marshal_model.is_materialized
+            }
+        )
+
+    def iter_build_order(self) -> Iterator[MarshalModel]:
+        """
+        Yields all registered models, placing every model's dependencies
+        (see :py:meth:`MarshalModel.dependencies`) before the model itself.
+        Abstract models (see :py:attr:`MarshalModel.is_abstract`) are skipped
+        """
+        seen: set[int] = set()
+
+        def visit(marshal_model: MarshalModel) -> Iterator[MarshalModel]:
+            if id(marshal_model) in seen or marshal_model.is_abstract:
+                return
+            seen.add(id(marshal_model))
+            for dependency in marshal_model.dependencies():
+                yield from visit(dependency)
+            yield marshal_model
+
+        for marshal_model in self:
+            yield from visit(marshal_model)
+
+    def generate_models(
+        self,
+        marshal_models: Iterable[MarshalModel],
+        failures: dict[str, Exception] | None = None,
+    ) -> dict[str, float]:
+        """
+        Generates pydantic models for `marshal_models`, which haven't been
+        generated yet, one by one. A failing model doesn't stop the rest
+
+        :param failures: collects exceptions of failed models by registry key.
+            If not passed, they are raised in a :py:class:`ModelGenerationError`
+            after all other models are generated
+        :return: build time (in seconds) for each model built, by registry key
+        """
+        timings: dict[str, float] = {}
+        errors: dict[str, Exception] = {} if failures is None else failures
+        for marshal_model in marshal_models:
+            if marshal_model.is_generated:
+                continue
+            start = perf_counter()
+            try:
+                marshal_model.generated_model  # triggers generation
+            except Exception as error:  # noqa: WPS440
+                errors[marshal_model.registry_key] = error
+            else:
+                timings[marshal_model.registry_key] = perf_counter() - start
+
+        if failures is None and errors:
+            raise ModelGenerationError(errors) from next(iter(errors.values()))
+        return timings
+
+    def warm_up(self, failures: dict[str, Exception] | None = None) -> dict[str, float]:
+        """
+        Generates pydantic models for all registered :py:class:`MarshalModel`s
+        (abstract ones excluded), which haven't been generated yet,
+        in dependency order. Failures are handled by :py:meth:`generate_models`
+
+        :return: build time (in seconds) for each model built, by registry key
+        """
+        return self.generate_models(self.iter_build_order(), failures)
+
+
+registry = MarshalRegistry()
+
+
+def warm_up(failures: dict[str, Exception] | None = None) -> dict[str, float]:
+    """Shortcut for :py:meth:`MarshalRegistry.warm_up` on the global registry"""
+    return registry.warm_up(failures)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pydantic_marshals.base.models import MarshalModel
+
+FieldSelection = frozenset[tuple[str, "FieldSelection"]]
+"""
+Normalized set of selected fields: pairs of field names & selections
+of their nested fields (empty to select nested models as is)
+"""
+
+
+def parse_field_selection(paths: Iterable[str]) -> FieldSelection:
+    """
+    Parses dotted field `paths` (``"avatar.id"``) into a :py:data:`FieldSelection`.
+    Paths can also be comma-separated (``"id,name,avatar.id"``), as in query strings.
+    Order & duplicates are ignored, ``"avatar"`` with ``"avatar.id"``
+    selects only ``id`` of the ``avatar``
+    """
+    tree: dict[str, Any] = {}
+    for path in paths:
+        for dotted_name in path.split(","):
+            dotted_name = dotted_name.strip()
+            if not dotted_name:
+                continue
+            node = tree
+            for name in dotted_name.split("."):
+                node = node.setdefault(name.strip(), {})
+    return freeze_field_selection(tree)
+
+
+def freeze_field_selection(tree: dict[str, Any]) -> FieldSelection:
+    return frozenset(
+        (name, freeze_field_selection(subtree)) for name, subtree in tree.items()
+    )
+
+
+class SelectionCache:
+    """
+    Bounded LRU cache of models, derived from one :py:class:`MarshalModel`
+    by :py:meth:`MarshalModel.select_fields`, keyed by :py:data:`FieldSelection`.
+    Least recently used models are evicted after `maxsize` entries,
+    so arbitrary selections (e.g. from clients) can't grow memory without limit
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.models: OrderedDict[FieldSelection, MarshalModel] = OrderedDict()
+        self.lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.models.clear()
+
+    def get(
+        self,
+        selection: FieldSelection,
+        create_model: Callable[[], MarshalModel],
+    ) -> MarshalModel:
+        """
+        Finds the model for `selection`, creating it with `create_model` on misses.
+        Models are created outside the lock (nested models could use the same
+        cache), concurrent misses keep the first result
+        """
+        with self.lock:
+            marshal_model = self.models.get(selection)
+            if marshal_model is not None:
+                self.models.move_to_end(selection)
+                return marshal_model
+
+        marshal_model = create_model()
+        if self.maxsize <= 0:
+            return marshal_model
+
+        with self.lock:
+            marshal_model = self.models.setdefault(selection, marshal_model)
+            self.models.move_to_end(selection)
+            while len(self.models) > self.maxsize:
+                self.models.popitem(last=False)
+        return marshal_model
@@ -0,0 +1,418 @@
+from __future__ import annotations
+
+from asyncio import sleep
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from math import isfinite, isnan
+from operator import attrgetter
+from threading import RLock
+from types import NoneType, UnionType
+from typing import Annotated, Any, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json, to_jsonable_python
+
+from pydantic_marshals.utils import is_subtype, iter_batches
+
+Converter = Callable[[Any], Any]
+B = TypeVar("B", bound=BaseModel)
+
+collection_types = (list, tuple, set, frozenset)
+
+
+def json_options(model: type[BaseModel]) -> dict[str, Any]:
+    """
+    Options for :py:func:`pydantic_core.to_json`, matching JSON settings of
+    the model's config (``ser_json_*``), with the same defaults as pydantic
+    """
+    config = model.model_config
+    options: dict[str, Any] = {
+        "timedelta_mode": config.get("ser_json_timedelta", "iso8601"),
+        "bytes_mode": config.get("ser_json_bytes", "utf8"),
+        "inf_nan_mode": config.get("ser_json_inf_nan", "null"),
+    }
+    temporal_mode = config.get("ser_json_temporal")
+    if temporal_mode is not None:
+        options["temporal_mode"] = temporal_mode
+    return options
+
+
+def encode_inf_nan(value: Any, inf_nan_mode: str) -> Any:
+    """
+    Replaces infinite & NaN floats in a JSON-compatible `value` the same way
+    ``inf_nan_mode`` of :py:func:`pydantic_core.to_json` does, so they are kept
+    when encoded with other settings. ``"constants"`` are left as floats
+    """
+    if isinstance(value, float):
+        if isfinite(value) or inf_nan_mode == "constants":
+            return value
+        if inf_nan_mode == "null":
+            return None
+        if isnan(value):
+            return "NaN"
+        return "Infinity" if value > 0 else "-Infinity"
+    if isinstance(value, dict):
+        return {key: encode_inf_nan(item, inf_nan_mode) for key, item in value.items()}
+    if isinstance(value, list):
+        return [encode_inf_nan(item, inf_nan_mode) for item in value]
+    return value
+
+
+class AttributeSerializer:
+    """
+    Serializes objects (e.g. ORM instances) into JSON by reading attributes
+    for fields of a pydantic model directly, without validation & creating
+    model instances. The plan (attribute & key for each field, converters
+    for nested models) is computed once per model.
+
+    This is only suitable for trusted data, which would pass validation as is:
+    validators, custom serializers & type coercion of the model are not applied.
+    Output is the same as from ``model_validate(source).model_dump_json()``,
+    including JSON settings of the config (see :py:func:`json_options`)
+    """
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        self.model = model
+        self.json_options: dict[str, Any] = json_options(model)
+        self.plan: list[tuple[str, str, Converter | None]] = []
+        self.nested_models: dict[str, type[BaseModel]] = {}
+
+    def build_plan(self) -> None:
+        self.plan = [
+            (
+                name,
+                field.alias or name,  # `from_attributes` reads aliases
+                self.build_converter(field.annotation),
+            )
+            for name, field in self.model.model_fields.items()
+        ]
+        self.nested_models = {
+            name: nested_model
+            for name, field in self.model.model_fields.items()
+            if (nested_model := find_scalar_model(field.annotation)) is not None
+        }
+
+    def build_converter(self, annotation: Any) -> Converter | None:
+        """
+        Creates a converter for values of `annotation` type.
+        None means that the value can be passed to json encoder as is
+        """
+        if is_subtype(annotation, BaseModel):
+            serializer = get_serializer(annotation)
+            if serializer.json_options == self.json_options:
+                return serializer.to_python
+            return serializer.to_jsonable_python  # different JSON settings
+
+        origin = get_origin(annotation)
+        if origin is None:
+            return None
+
+        args = get_args(annotation)
+        if origin is Annotated:
+            return self.build_converter(args[0])
+
+        if origin in {Union, UnionType}:
+            converters = [self.build_converter(arg) for arg in args]
+            if all(converter is None for converter in converters):
+                return None
+            not_none = [arg for arg in args if arg is not NoneType]
+            if len(not_none) != 1:  # ambiguous, falling back to pydantic
+                return self.build_adapter_converter(annotation)
+            converter = self.build_converter(not_none[0])
+            if converter is None:
+                return None
+            return lambda value: None if value is None else converter(value)
+
+        if origin in collection_types:
+            if origin is tuple and (len(args) != 2 or args[1] is not ...):
+                return self.build_adapter_converter(annotation)
+            item_converter = self.build_converter(args[0])
+            if item_converter is None:
+                return list  # sets & tuples are encoded as arrays
+            return lambda value: [item_converter(item) for item in value]
+
+        if any(self.build_converter(arg) is not None for arg in args):
+            return self.build_adapter_converter(annotation)
+        return None
+
+    def build_adapter_converter(self, annotation: Any) -> Converter:
+        adapter: TypeAdapter[Any] = TypeAdapter(annotation)
+        return lambda value: adapter.dump_python(
+            adapter.validate_python(value, from_attributes=True), mode="json"
+        )
+
+    def to_python(self, source: Any) -> dict[str, Any]:
+        """
+        Collects values of all fields from attributes of `source` into a dict.
+        Nested models become dicts, collections become lists, other values
+        are left as is for :py:func:`pydantic_core.to_json` to encode
+        """
+        result: dict[str, Any] = {}
+        for key, attribute, converter in self.plan:
+            value = getattr(source, attribute)
+            result[key] = value if converter is None else converter(value)
+        return result
+
+    def to_jsonable_python(self, source: Any) -> Any:
+        """
+        Same as :py:meth:`to_python`, but values are encoded like in JSON
+        with settings of this model, for nesting in models with other settings
+        """
+        return encode_inf_nan(
+            to_jsonable_python(self.to_python(source), **self.json_options),
+            self.json_options["inf_nan_mode"],
+        )
+
+    def to_json(self, source: Any) -> bytes:
+        """Serializes `source` into JSON, see :py:meth:`to_python`"""
+        return to_json(self.to_python(source), **self.json_options)
+
+    def collect_columns(
+        self,
+        columns: dict[str, list[Any]],
+        prefix: str,
+        sources: Sequence[Any],
+        path: frozenset[type[BaseModel]] | None,
+    ) -> None:
+        """
+        Adds columns of this model's fields to `columns`, see :py:meth:`to_columns`.
+        Nested models are flattened, unless `path` (models being flattened) is None
+        or includes them already
+        """
+        if path is not None:
+            path = path | {self.model}
+        for key, attribute, converter in self.plan:
+            values = list(map(attrgetter(attribute), sources))
+            nested_model = self.nested_models.get(key)
+            if path is None or nested_model is None or nested_model in path:
+                if converter is not None:
+                    values = list(map(converter, values))
+                columns[prefix + key] = values
+                continue
+
+            indexes = [index for index, value in enumerate(values) if value is not None]
+            nested_columns: dict[str, list[Any]] = {}
+            nested_serializer = get_serializer(nested_model)
+            nested_serializer.collect_columns(
+                nested_columns,
+                f"{prefix}{key}.",
+                [values[index] for index in indexes],
+                path,
+            )
+            for name, column in nested_columns.items():
+                if nested_serializer.json_options != self.json_options:
+                    column = nested_serializer.encode_column(column)
+                if len(indexes) != len(values):  # fill in gaps for None parents
+                    column, nested_column = [None] * len(values), column
+                    for index, value in zip(indexes, nested_column):
+                        column[index] = value
+                columns[name] = column
+
+    def encode_column(self, column: list[Any]) -> list[Any]:
+        """Encodes values of a column like in JSON with settings of this model"""
+        return encode_inf_nan(  # type: ignore[no-any-return]
+            to_jsonable_python(column, **self.json_options),
+            self.json_options["inf_nan_mode"],
+        )
+
+    def to_columns(
+        self, sources: Iterable[Any], flatten: bool = False
+    ) -> dict[str, list[Any]]:
+        """
+        Collects values of all fields from attributes of all `sources`
+        into arrays (one per field, in order of fields), reading one field
+        of all sources at a time. Values are converted like in :py:meth:`to_python`
+
+        :param flatten: expand fields of nested models (ones, which are not
+            collections) into columns of their own, named like ``author.name``.
+            Nested models are not expanded inside themselves (for recursive
+            models), collections of models are kept as arrays of dicts
+        """
+        columns: dict[str, list[Any]] = {}
+        self.collect_columns(
+            columns, "", list(sources), frozenset() if flatten else None
+        )
+        return columns
+
+    def to_columns_json(self, sources: Iterable[Any], flatten: bool = False) -> bytes:
+        """
+        Serializes `sources` into a JSON object of arrays, see :py:meth:`to_columns`.
+        Keys are written once, not for every source. JSON settings of models'
+        configs are applied, like in :py:meth:`to_json`
+        """
+        return to_json(self.to_columns(sources, flatten), **self.json_options)
+
+
+def find_scalar_model(annotation: Any) -> type[BaseModel] | None:
+    """Finds the model in a (possibly optional) annotation of a nested model"""
+    if is_subtype(annotation, BaseModel):
+        return annotation  # type: ignore[no-any-return]
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Annotated:
+        return find_scalar_model(args[0])
+    if origin in {Union, UnionType}:
+        not_none = [arg for arg in args if arg is not NoneType]
+        if len(not_none) == 1:
+            return find_scalar_model(not_none[0])
+    return None
+
+
+serializer_lock = RLock()
+"""Lock for planning serializers, shared for nested & recursive models"""
+
+planned_serializers: dict[type[BaseModel], AttributeSerializer] = {}
+"""Serializers being planned (under the lock), for recursive models"""
+
+
+def publish_serializers() -> None:
+    """Caches all planned serializers on their models (under the lock)"""
+    for model, serializer in planned_serializers.items():
+        model.__attribute_serializer__ = serializer  # type: ignore[attr-defined]
+
+
+def get_serializer(model: type[BaseModel]) -> AttributeSerializer:
+    """
+    Returns the :py:class:`AttributeSerializer` for the model.
+    It's cached on the model class itself, to be collected together with it.
+
+    Serializers are only cached after their plans (and plans of all nested
+    serializers) are built, so other threads never get incomplete ones
+    """
+    serializer: AttributeSerializer | None = model.__dict__.get(
+        "__attribute_serializer__"
+    )
+    if serializer is not None:
+        return serializer
+
+    with serializer_lock:
+        serializer = model.__dict__.get("__attribute_serializer__")
+        if serializer is None:
+            serializer = planned_serializers.get(model)
+        if serializer is not None:
+            return serializer
+
+        outermost = not planned_serializers
+        serializer = AttributeSerializer(model)
+        planned_serializers[model] = serializer  # before planning, for recursion
+        try:
+            serializer.build_plan()
+            if outermost:
+                publish_serializers()
+        finally:
+            if outermost:
+                planned_serializers.clear()
+    return serializer
+
+
+def get_list_adapter(model: type[B]) -> TypeAdapter[list[B]]:
+    """
+    Returns a ``TypeAdapter(list[model])``, for validating & serializing
+    many objects in one call. It's cached on the model class, like serializers
+    """
+    adapter: TypeAdapter[list[B]] | None = model.__dict__.get("__list_adapter__")
+    if adapter is None:
+        adapter = TypeAdapter(list[model])  # type: ignore[valid-type]
+        model.__list_adapter__ = adapter  # type: ignore[attr-defined]
+    return adapter
+
+
+def prepare_sources(model: type[BaseModel], sources: Iterable[Any]) -> list[Any]:
+    """
+    Collects `sources` & passes them through the ``prepare_batch`` hook of
+    the model (see :py:meth:`MarshalBaseModel.prepare_batch`), if it has one.
+    All batch & fast-path entry points of models go through here
+    """
+    prepare_batch = getattr(model, "prepare_batch", None)
+    if prepare_batch is None:
+        return list(sources)
+    return prepare_batch(list(sources))  # type: ignore[no-any-return]
+
+
+def dump_ndjson_batch(model: type[BaseModel], batch: list[Any]) -> bytes:
+    """Validates a batch of objects & serializes it into NDJSON lines"""
+    to_json = model.__pydantic_serializer__.to_json
+    instances = get_list_adapter(model).validate_python(batch)
+    return b"".join(to_json(instance) + b"\n" for instance in instances)
+
+
+def dump_json_array_batch(model: type[BaseModel], batch: list[Any]) -> bytes:
+    """
+    Validates a batch of objects & serializes it into JSON array items,
+    without the surrounding brackets
+    """
+    adapter = get_list_adapter(model)
+    return adapter.dump_json(adapter.validate_python(batch))[1:-1]
+
+
+def iter_ndjson(
+    model: type[BaseModel],
+    batches: Iterable[list[Any]],
+) -> Iterator[bytes]:
+    """
+    Yields `batches` as NDJSON, one chunk of lines per batch.
+    Only one batch is kept in memory at a time
+    """
+    for batch in batches:
+        yield dump_ndjson_batch(model, batch)
+
+
+def iter_json_array(
+    model: type[BaseModel],
+    batches: Iterable[list[Any]],
+) -> Iterator[bytes]:
+    """Same as :py:func:`iter_ndjson`, but chunks form one JSON array together"""
+    yield b"["
+    separator = b""
+    for batch in batches:
+        yield separator + dump_json_array_batch(model, batch)
+        separator = b","
+    yield b"]"
+
+
+def dump_json_array(
+    model: type[BaseModel],
+    sources: Iterable[Any],
+    batch_size: int = 100,
+) -> bytes:
+    """
+    Validates `sources` & serializes them into one JSON array, `batch_size`
+    objects at a time. Keeping all instances of a large list alive makes
+    the garbage collector rescan them over and over, which is slower
+    than validating objects one by one
+    """
+    return b"".join(iter_json_array(model, iter_batches(sources, batch_size)))
+
+
+async def aiter_ndjson(
+    model: type[BaseModel],
+    batches: AsyncIterable[list[Any]],
+) -> AsyncIterator[bytes]:
+    """
+    Async version of :py:func:`iter_ndjson`. Control is handed back
+    to the event loop after each batch, so long exports don't block it
+    """
+    async for batch in batches:
+        yield dump_ndjson_batch(model, batch)
+        await sleep(0)
+
+
+async def aiter_json_array(
+    model: type[BaseModel],
+    batches: AsyncIterable[list[Any]],
+) -> AsyncIterator[bytes]:
+    """Async version of :py:func:`iter_json_array`, see :py:func:`aiter_ndjson`"""
+    yield b"["
+    separator = b""
+    async for batch in batches:
+        yield separator + dump_json_array_batch(model, batch)
+        separator = b","
+        await sleep(0)
+    yield b"]"
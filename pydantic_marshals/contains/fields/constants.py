@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Annotated, Any, Generic, Literal, TypeVar
+from typing import Annotated, Any, Generic, Literal, TypeVar, get_args
 
 from pydantic import AfterValidator
 from typing_extensions import Self
@@ -11,6 +11,8 @@ from pydantic_marshals.contains.type_aliases import LiteralType
 
 
 class LiteralConstantField(MarshalField):
+    source_types = get_args(LiteralType)
+
     def __init__(self, constant: LiteralType) -> None:
         super().__init__()
         self.constant = constant
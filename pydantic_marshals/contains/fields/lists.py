@@ -15,6 +15,8 @@ def strict_list_field_factory(
     convert_type: Callable[[TypeChecker], TypeHint],
 ) -> type[MarshalField]:
     class StrictListFieldInner(TypedField):
+        source_types = (list,)
+
         @classmethod
         def convert(cls, source: Any = None, *_: Any) -> Self | None:
             if isinstance(source, list):
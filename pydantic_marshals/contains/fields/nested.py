@@ -17,6 +17,8 @@ def nested_field_factory(  # noqa: N802
     convert_field: Callable[[TypeChecker], FieldType],
 ) -> type[MarshalField]:
     class NestedFieldInner(TypedField):
+        source_types = (dict,)
+
         @classmethod
         def convert(cls, source: Any = None, *_: Any) -> Self | None:
             if isinstance(source, dict):
@@ -30,6 +30,8 @@ class TypedField(MarshalField):
 
 
 class GeneratedTypeField(TypedField):
+    source_types = (BaseTypeGenerator,)
+
     @classmethod
     def convert(cls, source: Any = None, *_: Any) -> Self | None:
         if isinstance(source, BaseTypeGenerator):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from types import EllipsisType, NoneType
 from typing import Any
 
 from typing_extensions import Self
@@ -10,6 +11,8 @@ from pydantic_marshals.base.type_aliases import TypeHint
 
 
 class NothingField(MarshalField):
+    source_types = (NoneType,)
+
     @classmethod
     def convert(cls, source: Any = None, *_: Any) -> Self | None:
         if source is None:
@@ -24,6 +27,8 @@ class NothingField(MarshalField):
 
 
 class SomethingField(MarshalField):
+    source_types = (EllipsisType,)
+
     @classmethod
     def convert(cls, source: Any = None, *_: Any) -> Self | None:
         if source is ...:
@@ -35,6 +40,8 @@ class SomethingField(MarshalField):
 
 
 class AnythingField(MarshalField):
+    source_types = (type(Any),)
+
     @classmethod
     def convert(cls, source: Any = None, *_: Any) -> Self | None:
         if source is Any:
@@ -19,7 +19,9 @@ base_model_qualname: Final = "pydantic_marshals.sqlalchemy.models.MappedModel"
 type_matrix = {base_model_qualname}
 methods = {"create", "extend", "as_patch"}
 
-pydantic_base_model_qualname: Final = "pydantic_marshals.base.models.MarshalBaseModel"
+pydantic_base_model_qualname: Final = (
+    "pydantic_marshals.sqlalchemy.models.MappedBaseModel"
+)
 stub_module_name: Final = "pydantic_marshals.mypy.magic"
 stub_class_name: Final = f"{stub_module_name}.MappedModelStub"
 
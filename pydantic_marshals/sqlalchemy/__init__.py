@@ -1,3 +1,11 @@
+from pydantic_marshals.sqlalchemy.lazy_loads import LazyLoadError, detect_lazy_loads
 from pydantic_marshals.sqlalchemy.models import MappedModel
+from pydantic_marshals.sqlalchemy.type_registry import TypeRegistry, type_registry
 
-__all__ = ("MappedModel",)
+__all__ = (
+    "MappedModel",
+    "detect_lazy_loads",
+    "LazyLoadError",
+    "TypeRegistry",
+    "type_registry",
+)
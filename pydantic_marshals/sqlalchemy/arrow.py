@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from operator import attrgetter, itemgetter
+from types import NoneType, UnionType
+from typing import Annotated, Any, Union, get_args, get_origin
+from uuid import UUID
+
+import pyarrow as pa
+from sqlalchemy import DateTime, Enum as EnumType, Numeric, Row
+
+from pydantic_marshals.sqlalchemy.fields.columns import ColumnField
+from pydantic_marshals.sqlalchemy.rows import unwrap_entity
+from pydantic_marshals.utils import iter_batches
+
+Converter = Callable[[list[Any]], list[Any]]
+
+arrow_types: dict[type, Callable[[ColumnField], pa.DataType]] = {
+    bool: lambda _: pa.bool_(),
+    int: lambda _: pa.int64(),
+    float: lambda _: pa.float64(),
+    str: lambda _: pa.string(),
+    bytes: lambda _: pa.binary(),
+    date: lambda _: pa.date32(),
+    time: lambda _: pa.time64("us"),
+    timedelta: lambda _: pa.duration("us"),
+    UUID: lambda _: pa.string(),
+    Enum: lambda _: pa.dictionary(pa.int32(), pa.string()),
+}
+"""
+Arrow types for python types of column fields (looked up by their MRO),
+as functions of the field to account for column type's parameters
+"""
+
+
+def datetime_arrow_type(field: ColumnField) -> pa.DataType:
+    column_type = field.column.type
+    timezone = isinstance(column_type, DateTime) and column_type.timezone
+    return pa.timestamp("us", tz="UTC" if timezone else None)
+
+
+def decimal_arrow_type(field: ColumnField) -> pa.DataType:
+    column_type = field.column.type
+    if isinstance(column_type, Numeric) and column_type.precision is not None:
+        return pa.decimal128(column_type.precision, column_type.scale or 0)
+    return pa.decimal128(38, 10)
+
+
+arrow_types[datetime] = datetime_arrow_type  # before date in MRO lookups
+arrow_types[Decimal] = decimal_arrow_type
+
+
+def unwrap_optional(annotation: Any) -> Any:
+    """Removes ``Annotated`` & ``None`` from the field's annotation"""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return unwrap_optional(get_args(annotation)[0])
+    if origin in {Union, UnionType}:
+        not_none = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(not_none) == 1:
+            return unwrap_optional(not_none[0])
+    return annotation
+
+
+def build_enum_converter(field: ColumnField, enum: type[Enum]) -> Converter:
+    # values stored in the database: names or results of `values_callable`
+    column_type = field.column.type
+    lookup: dict[Any, str] = {}
+    if isinstance(column_type, EnumType) and column_type.enum_class is enum:
+        for member, value in zip(enum.__members__.values(), column_type.enums):
+            lookup.setdefault(member, value)
+    else:
+        lookup = {member: member.name for member in enum}
+    return lambda values: [None if value is None else lookup[value] for value in values]
+
+
+class ArrowExporter:
+    """
+    Builds Apache Arrow record batches (requires ``pyarrow``,
+    see the `arrow` extra) straight from ORM objects, Core rows
+    or row mappings for column fields of a model (in order of fields),
+    one column at a time, without validation & per-row dicts.
+
+    The schema is derived from column fields: arrow types from python types
+    (see :py:data:`arrow_types`), nullability from columns. Enums are
+    dictionary-encoded with values, which are stored in the database
+    """
+
+    def __init__(self, fields: Iterable[ColumnField]) -> None:
+        self.fields = list(fields)
+        self.field_names: dict[str, int] = {}
+        self.converters: list[Converter | None] = []
+        arrow_fields: list[pa.Field] = []
+        for index, field in enumerate(self.fields):
+            self.field_names.setdefault(field.column.key, index)
+            self.field_names.setdefault(field.column.name, index)
+            self.field_names.setdefault(field.generate_name(), index)
+
+            python_type = unwrap_optional(field.generate_type())
+            arrow_type = self.find_arrow_type(field, python_type)
+            arrow_fields.append(
+                pa.field(field.generate_name(), arrow_type, field.column.nullable)
+            )
+            self.converters.append(self.build_converter(field, python_type))
+        self.schema: pa.Schema = pa.schema(arrow_fields)
+
+    def find_arrow_type(self, field: ColumnField, python_type: Any) -> pa.DataType:
+        mro: tuple[type, ...] = getattr(python_type, "__mro__", ())
+        if Enum in mro:  # converted to stored values, even for `int` enums
+            mro = (Enum,)
+        for klass in mro:
+            arrow_type = arrow_types.get(klass)
+            if arrow_type is not None:
+                return arrow_type(field)
+        raise TypeError(
+            f"No arrow type for {field.generate_name()}: {python_type},"
+            " register one in `arrow_types`"
+        )
+
+    def build_converter(self, field: ColumnField, python_type: Any) -> Converter | None:
+        if isinstance(python_type, type) and issubclass(python_type, Enum):
+            return build_enum_converter(field, python_type)
+        if python_type is UUID:
+            return lambda values: [
+                None if value is None else str(value) for value in values
+            ]
+        return None
+
+    def find_getters(self, source: Any) -> list[Callable[[Any], Any]]:
+        """Getters of field values for all sources like `source` in the batch"""
+        if isinstance(source, Row):
+            positions = {key: index for index, key in enumerate(source._fields)}
+            return [
+                itemgetter(self.find_position(positions, field))
+                for field in self.fields
+            ]
+        if isinstance(source, Mapping):
+            return [itemgetter(self.find_key(source, field)) for field in self.fields]
+        return [
+            attrgetter(field.alias or field.generate_name()) for field in self.fields
+        ]
+
+    def find_position(self, positions: dict[str, int], field: ColumnField) -> int:
+        for key in (field.column.key, field.column.name, field.generate_name()):
+            if key in positions:
+                return positions[key]
+        raise KeyError(f"Column {field.column.key} is missing in rows")
+
+    def find_key(self, source: Mapping[Any, Any], field: ColumnField) -> Any:
+        for key in (field.column.key, field.column.name, field.generate_name()):
+            if key in source:
+                return key
+        raise KeyError(f"Column {field.column.key} is missing in mappings")
+
+    def record_batch(self, sources: Sequence[Any]) -> pa.RecordBatch:
+        """Converts `sources` (all of one kind) into a record batch"""
+        if not sources:
+            return pa.RecordBatch.from_pylist([], schema=self.schema)
+        sources = [unwrap_entity(source) for source in sources]
+
+        arrays: list[pa.Array] = []
+        getters = self.find_getters(sources[0])
+        for getter, converter, arrow_field in zip(
+            getters, self.converters, self.schema
+        ):
+            values = list(map(getter, sources))
+            if converter is not None:
+                values = converter(values)
+            if pa.types.is_dictionary(arrow_field.type):
+                arrays.append(pa.array(values, pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array(values, arrow_field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    def iter_record_batches(
+        self, sources: Iterable[Any], batch_size: int = 10000
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Converts `sources` (any iterable, e.g. a query result with ``yield_per``)
+        into record batches of `batch_size` rows each
+        """
+        for batch in iter_batches(sources, batch_size):
+            yield self.record_batch(batch)
+
+    def to_table(self, sources: Iterable[Any], batch_size: int = 10000) -> pa.Table:
+        """
+        Collects all `sources` into an Arrow table, which can be converted
+        further, e.g. with ``to_pandas()``, see :py:meth:`iter_record_batches`
+        """
+        return pa.Table.from_batches(
+            self.iter_record_batches(sources, batch_size), schema=self.schema
+        )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Hashable, Iterator
 from enum import Enum
 from typing import Any
 from warnings import warn
@@ -13,6 +13,7 @@ from typing_extensions import Self
 
 from pydantic_marshals.base.fields.base import PatchMarshalField
 from pydantic_marshals.base.type_aliases import TypeHint
+from pydantic_marshals.sqlalchemy.type_registry import type_registry
 from pydantic_marshals.utils import is_subtype
 
 
@@ -22,6 +23,8 @@ class ColumnField(PatchMarshalField):
     This will only work with 2.0-style MappedColumns
     """
 
+    source_types = (MappedColumn,)
+
     def __init__(
         self,
         mapped_column: MappedColumn[Any],
@@ -59,7 +62,7 @@ class ColumnField(PatchMarshalField):
     def generate_type(self) -> TypeHint:
         if self.type_override is not None:
             return self.type_override
-        type_: TypeHint = self.column.type.python_type
+        type_: TypeHint = type_registry.resolve(self.column.type)
         if self.column.nullable:
             return type_ | None
         return type_
@@ -82,6 +85,9 @@ class ColumnField(PatchMarshalField):
         ):  # enums are kept by name in the database
             yield "max_length", column_type.length
 
+    def structural_key(self) -> Hashable:
+        return super().structural_key(), self.column
+
 
 ColumnType = (
     MappedColumn[Any]
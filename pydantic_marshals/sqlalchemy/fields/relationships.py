@@ -1,14 +1,36 @@
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Hashable, Iterator, Sequence
+from typing import Any, Optional
 
 from pydantic import BaseModel
-from sqlalchemy.orm import Mapped, Relationship
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    Mapped,
+    Relationship,
+    joinedload,
+    selectinload,
+)
+from sqlalchemy.orm.interfaces import LoaderOption
 from typing_extensions import Self
 
+from pydantic_marshals.base.cache import (
+    describe_model,
+    describe_type,
+    describe_value,
+    qualified_name,
+)
 from pydantic_marshals.base.fields.base import PatchMarshalField
+from pydantic_marshals.base.models import (
+    MarshalModel,
+    ModelReference,
+    find_marshal_model,
+    find_source_model,
+    resolve_model_reference,
+)
+from pydantic_marshals.base.selections import FieldSelection
 from pydantic_marshals.base.type_aliases import TypeHint
-from pydantic_marshals.utils import ModeledType, is_subtype
+from pydantic_marshals.utils import is_subtype
 
 
 class RelationshipField(PatchMarshalField):
@@ -16,12 +38,19 @@ class RelationshipField(PatchMarshalField):
     Implementation of :py:class:`MarshalField` to use with SQLAlchemy's relationships
     A conversion model has to be specified, preferably one made with
     :py:class:`pydantic_marshals.models.sqlalchemy.MappedModel`
+
+    The model can also be referenced lazily: by a :py:class:`MarshalModel`
+    (e.g. one defined earlier in the same class body) or by its name in the registry
+    (e.g. ``"User.FullModel"``). Those are only resolved when this field is used,
+    and can be recursive (self-referential or mutually dependent)
     """
 
+    source_types = (Relationship,)
+
     def __init__(
         self,
         mapped_relationship: Relationship[Any],
-        model: type[BaseModel],
+        model: ModelReference,
         nullable: bool = False,
         alias: str | None = None,
         patch: bool = False,
@@ -50,7 +79,7 @@ class RelationshipField(PatchMarshalField):
     ) -> Self | None:
         if (
             isinstance(mapped, Relationship)
-            and is_subtype(model, BaseModel)
+            and (is_subtype(model, BaseModel) or isinstance(model, (str, MarshalModel)))
             and isinstance(nullable, bool)
         ):
             return cls(mapped, model, nullable)
@@ -59,19 +88,94 @@ class RelationshipField(PatchMarshalField):
     def generate_name(self) -> str:
         return self.relationship.key
 
+    def dependencies(self) -> Iterator[MarshalModel]:
+        marshal_model = find_marshal_model(self.model)
+        if marshal_model is not None:
+            yield marshal_model
+
+    def loader_option(
+        self,
+        columns: Sequence[InstrumentedAttribute[Any]] = (),
+        options: Sequence[LoaderOption] = (),
+    ) -> LoaderOption:
+        """
+        Loader option for eagerly loading the relationship: ``selectinload``
+        for collections and ``joinedload`` for scalar relationships
+
+        :param columns: restrict loaded columns of the related entity (``load_only``)
+        :param options: nested loader options for the related entity
+        """
+        if self.relationship.uselist:
+            option = selectinload(self.relationship.class_attribute)
+        else:
+            option = joinedload(self.relationship.class_attribute)
+        if columns:
+            option = option.load_only(*columns)
+        if options:
+            option = option.options(*options)  # type: ignore[arg-type]
+        return option
+
     def generate_type(self) -> TypeHint:
+        model = resolve_model_reference(self.model)
         collection_class = self.relationship.collection_class
         if collection_class is None:
             if self.nullable:
-                return self.model | None
-            return self.model
+                return Optional[model]  # noqa: NU001  # forward refs don't support |
+            return model
         if not isinstance(collection_class, type):
             raise RuntimeError(f"Collection is not a type: {collection_class}")
         if issubclass(collection_class, list):
-            return list[self.model]  # type: ignore[name-defined]
+            return list[model]  # type: ignore[valid-type]
         raise RuntimeError(f"Bad collection class: {collection_class}")
 
+    def describe_source(self, seen: set[int]) -> dict[str, Any]:
+        """
+        Same as :py:meth:`MarshalField.describe_source`, but describes
+        the nested MarshalModel by its fields, without generating it
+        """
+        nested_model = self.find_model()
+        return {
+            "kind": qualified_name(type(self)),
+            "model": (
+                describe_type(self.model)
+                if nested_model is None
+                else describe_model(nested_model, seen)
+            ),
+            "collection": describe_value(self.relationship.collection_class),
+            "nullable": self.nullable,
+            "data": {
+                key: describe_value(value) for key, value in self.generate_field_data()
+            },
+        }
+
+    def find_model(self) -> MarshalModel | None:
+        """Finds the MarshalModel used for the relationship, see find_source_model"""
+        return find_source_model(self.model)
+
+    def select_fields(self, selection: FieldSelection) -> Self:
+        nested_model = self.find_model()
+        if nested_model is None:
+            raise ValueError(f"Fields of {self.model} can't be selected")
+        return type(self)(
+            mapped_relationship=self.relationship,
+            model=nested_model.select_field_tree(selection),
+            nullable=self.nullable,
+            alias=self.alias,
+            patch=self.patch,
+        )
+
+    def structural_key(self) -> Hashable:
+        return super().structural_key(), self.relationship
+
+
+ReferencedRelationship = Relationship[Any] | Mapped[Any]
 
 RelationshipType = (
-    ModeledType[Relationship[Any]] | ModeledType[Mapped[Any]] | RelationshipField
+    tuple[ReferencedRelationship, ModelReference]
+    | tuple[ReferencedRelationship, ModelReference, bool]  # nullable
+    | RelationshipField
 )
+"""
+Relationship with a model: a pydantic model, a :py:class:`MarshalModel`
+or a name in the registry, see :py:class:`RelationshipField`
+"""
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Column, Connection, Row, Table, insert
+from sqlalchemy.orm import InstrumentedAttribute, Session
+from sqlalchemy.sql import ColumnElement
+
+from pydantic_marshals.base.serializers import get_list_adapter
+from pydantic_marshals.sqlalchemy.fields.columns import ColumnField
+
+ReturningColumn = Column[Any] | ColumnElement[Any] | InstrumentedAttribute[Any]
+"""Column (or ORM attribute of one) to return from bulk inserts"""
+
+
+def find_table(columns: Iterable[Column[Any]]) -> Table:
+    """Finds the only table of `columns` for bulk statements"""
+    tables = {column.table for column in columns}
+    if len(tables) != 1:
+        raise TypeError("Bulk statements require columns of exactly one table")
+    return tables.pop()
+
+
+class BulkInsertResult(NamedTuple):
+    """Outcome of :py:meth:`BulkInserter.insert`"""
+
+    indexes: list[int]
+    """Positions of inserted payloads (ones, which passed validation)"""
+
+    rows: list[Row[Any]]
+    """Rows from ``RETURNING`` in order of `indexes` (empty if not supported)"""
+
+    errors: dict[int, ValidationError]
+    """Validation errors by positions of payloads, which were skipped"""
+
+
+class BulkInserter:
+    """
+    Validates create payloads (e.g. request bodies) with a generated model
+    and inserts valid ones with one Core ``insert()`` executemany,
+    skipping ORM objects & the unit of work altogether.
+
+    Only column fields are inserted, keyed by keys of their columns, which
+    should all belong to one table. Other fields (relationships, properties)
+    are validated, but not inserted
+    """
+
+    def __init__(self, model: type[BaseModel], fields: Iterable[ColumnField]) -> None:
+        self.model = model
+        self.columns: dict[str, Column[Any]] = {
+            field.generate_name(): field.column for field in fields
+        }
+        self.table: Table = find_table(self.columns.values())
+
+    def validate(
+        self, payloads: Sequence[Any]
+    ) -> tuple[list[int], list[BaseModel], dict[int, ValidationError]]:
+        """
+        Validates all `payloads` in one call, falling back to validating them
+        one by one to collect per-payload errors if any of them are invalid
+        """
+        try:
+            items = get_list_adapter(self.model).validate_python(payloads)
+        except ValidationError:
+            pass
+        else:
+            return list(range(len(items))), items, {}
+
+        indexes: list[int] = []
+        items = []
+        errors: dict[int, ValidationError] = {}
+        for index, payload in enumerate(payloads):
+            try:
+                items.append(self.model.model_validate(payload))
+            except ValidationError as error:
+                errors[index] = error
+            else:
+                indexes.append(index)
+        return indexes, items, errors
+
+    def convert(self, items: Iterable[BaseModel]) -> list[dict[str, Any]]:
+        """Converts validated `items` into parameters for ``insert()``"""
+        columns = [(name, column.key) for name, column in self.columns.items()]
+        return [
+            {key: vars(item)[name] for name, key in columns}  # noqa: WPS421
+            for item in items
+        ]
+
+    def insert(
+        self,
+        connection: Connection | Session,
+        payloads: Sequence[Any],
+        returning: Sequence[ReturningColumn] | None = None,
+        sort_by_parameter_order: bool = True,
+    ) -> BulkInsertResult:
+        """
+        Validates `payloads` & inserts valid ones in one executemany.
+        Nothing is committed, that's up to the caller
+
+        :param connection: Core connection or ORM session to execute in
+        :param returning: columns to return for inserted rows (primary key
+            by default, empty to skip ``RETURNING``). Only used if the dialect
+            supports ``RETURNING`` with executemany
+        :param sort_by_parameter_order: guarantee, that returned rows are
+            in order of payloads. Some dialects (e.g. SQLite with autoincrement
+            primary keys) can only do this by inserting rows one by one
+        """
+        indexes, items, errors = self.validate(payloads)
+        if not items:
+            return BulkInsertResult(indexes, [], errors)
+
+        if isinstance(connection, Session):
+            connection = connection.connection()
+        if returning is None:
+            returning = list(self.table.primary_key.columns)
+
+        statement = insert(self.table)
+        if returning and connection.dialect.insert_executemany_returning:
+            statement = statement.returning(
+                *returning, sort_by_parameter_order=sort_by_parameter_order
+            )
+            rows: list[Row[Any]] = list(
+                connection.execute(statement, self.convert(items))
+            )
+            return BulkInsertResult(indexes, rows, errors)
+
+        connection.execute(statement, self.convert(items))
+        return BulkInsertResult(indexes, [], errors)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging import getLogger
+from typing import Any, Literal, NamedTuple, get_args
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import InstanceState
+
+from pydantic_marshals.utils import is_subtype
+
+logger = getLogger("pydantic_marshals")
+
+
+class LazyLoad(NamedTuple):
+    """An attribute, which is about to be lazy loaded during validation"""
+
+    model: type[BaseModel]
+    field: str
+    instance: Any
+
+    def describe(self) -> str:
+        return (
+            f"Validating {self.model.__name__} lazy loads {self.field!r}"
+            f" of {type(self.instance).__name__}"
+        )
+
+
+class LazyLoadError(RuntimeError):
+    """Raised on lazy loads in ``detect_lazy_loads("raise")`` mode"""
+
+
+LazyLoadHandler = Callable[[LazyLoad], None]
+
+lazy_load_handler: ContextVar[LazyLoadHandler | None] = ContextVar(
+    "lazy_load_handler", default=None
+)
+
+
+def raise_lazy_load(lazy_load: LazyLoad) -> None:
+    raise LazyLoadError(lazy_load.describe())
+
+
+def log_lazy_load(lazy_load: LazyLoad) -> None:
+    logger.warning(lazy_load.describe())
+
+
+lazy_load_handlers: dict[str, LazyLoadHandler] = {
+    "raise": raise_lazy_load,
+    "log": log_lazy_load,
+}
+
+
+@contextmanager
+def detect_lazy_loads(
+    handler: Literal["raise", "log"] | LazyLoadHandler = "raise",
+) -> Iterator[None]:
+    """
+    Reports attributes, which would be lazy loaded (emitting a query) while
+    validating ORM objects with models of :py:class:`MappedModel`, nested ones
+    included. Checked attributes are ones read by fields: columns & relationships
+
+    :param handler: ``"raise"`` to raise :py:class:`LazyLoadError` (e.g. in tests),
+        ``"log"`` to log a warning, or a callable receiving :py:class:`LazyLoad`
+        (e.g. to count lazy loads in metrics)
+    """
+    if isinstance(handler, str):
+        handler = lazy_load_handlers[handler]
+    token = lazy_load_handler.set(handler)
+    try:
+        yield
+    finally:
+        lazy_load_handler.reset(token)
+
+
+def find_nested_model(annotation: Any) -> type[BaseModel] | None:
+    """Finds a pydantic model in a (possibly optional or list) annotation"""
+    if is_subtype(annotation, BaseModel):
+        return annotation  # type: ignore[no-any-return]
+    for argument in get_args(annotation):
+        model = find_nested_model(argument)
+        if model is not None:
+            return model
+    return None
+
+
+def report_lazy_loads(
+    model: type[BaseModel],
+    source: Any,
+    handler: LazyLoadHandler,
+    seen: set[tuple[int, int]] | None = None,
+) -> None:
+    """
+    Finds fields of `model`, which would be lazy loaded from `source`
+    (unloaded attributes of a persistent ORM object) and reports them to `handler`.
+    Already loaded relationships with nested models are checked recursively
+    """
+    if seen is None:
+        seen = set()
+    key = id(model), id(source)
+    if key in seen:
+        return
+    seen.add(key)
+
+    state = inspect(source, raiseerr=False)
+    if not isinstance(state, InstanceState) or not state.persistent:
+        return  # not an ORM object, or the one that can't load anything
+
+    unloaded = state.unloaded
+    relationships = state.mapper.relationships
+    for name, field in model.model_fields.items():
+        attribute = field.alias or name
+        if attribute in unloaded:
+            handler(LazyLoad(model, attribute, source))
+            continue
+
+        nested_model = find_nested_model(field.annotation)
+        if nested_model is None or attribute not in relationships:
+            continue  # properties are not read, they could load something
+        value = getattr(source, attribute)
+        values = value if isinstance(value, (list, tuple, set)) else (value,)
+        for nested_source in values:
+            report_lazy_loads(nested_model, nested_source, handler, seen)
+
+
+def check_lazy_loads(model: type[BaseModel], sources: Iterable[Any]) -> None:
+    """Reports lazy loads for all `sources`, if called inside detect_lazy_loads"""
+    handler = lazy_load_handler.get()
+    if handler is None:
+        return
+    seen: set[tuple[int, int]] = set()
+    for source in sources:
+        report_lazy_loads(model, source, handler, seen)
@@ -1,21 +1,173 @@
 from __future__ import annotations
 
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from pydantic import BaseModel
+from sqlalchemy import Column, Connection, Select, inspect, select
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    MappedColumn,
+    Session,
+    load_only as sqlalchemy_load_only,
+)
+from sqlalchemy.orm.interfaces import LoaderOption
 from typing_extensions import Self
 
 from pydantic_marshals.base.fields.base import MarshalField, PatchMarshalField
 from pydantic_marshals.base.fields.properties import PropertyField, PropertyType
-from pydantic_marshals.base.models import MarshalModel
+from pydantic_marshals.base.models import MarshalBaseModel, MarshalModel
 from pydantic_marshals.sqlalchemy.fields.columns import ColumnField, ColumnType
 from pydantic_marshals.sqlalchemy.fields.relationships import (
     RelationshipField,
     RelationshipType,
 )
+from pydantic_marshals.sqlalchemy.inserts import (
+    BulkInserter,
+    BulkInsertResult,
+    ReturningColumn,
+)
+from pydantic_marshals.sqlalchemy.lazy_loads import check_lazy_loads
+from pydantic_marshals.sqlalchemy.rows import RowValidator, unwrap_entity
+from pydantic_marshals.sqlalchemy.updates import PatchUpdater
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from pydantic_marshals.sqlalchemy.arrow import ArrowExporter
+    from pydantic_marshals.sqlalchemy.polymorphism import PolymorphicUnion
+
+
+class MappedBaseModel(MarshalBaseModel):
+    """Base class for pydantic models, generated by :py:class:`MappedModel`"""
+
+    @classmethod
+    def model_validate(cls, obj: Any, **kwargs: Any) -> Self:
+        """
+        Same as :py:meth:`BaseModel.model_validate`, but reports lazy loads
+        inside :py:func:`detect_lazy_loads` (checks are skipped outside of it)
+        """
+        check_lazy_loads(cls, (obj,))
+        return super().model_validate(obj, **kwargs)
+
+    @classmethod
+    def prepare_batch(cls, batch: list[Any]) -> list[Any]:
+        """
+        Unwraps single-entity rows, e.g. from ``session.execute(select(User))``.
+        Reports lazy loads inside :py:func:`detect_lazy_loads`. Used by all batch
+        & fast-path methods, see :py:func:`prepare_sources`
+        """
+        batch = [unwrap_entity(source) for source in batch]
+        check_lazy_loads(cls, batch)
+        return batch
+
+    @classmethod
+    def _get_mapped_model(cls) -> MappedModel:
+        """
+        Same as :py:meth:`get_marshal_model`, but only for :py:class:`MappedModel`
+
+        :raises TypeError: if the model is not generated by a MappedModel
+        """
+        marshal_model = cls.get_marshal_model()
+        if not isinstance(marshal_model, MappedModel):
+            raise TypeError(f"{cls.__name__} is not generated by a MappedModel")
+        return marshal_model
+
+    @classmethod
+    def loader_options(cls, load_only: bool = False) -> list[LoaderOption]:
+        """
+        Loader options for all relationships used by this model,
+        see :py:meth:`MappedModel.loader_options`
+        """
+        return cls._get_mapped_model().loader_options(load_only=load_only)
+
+    @classmethod
+    def select_statement(cls) -> Select[Any]:
+        """
+        Select statement for loading objects for this model,
+        see :py:meth:`MappedModel.select_statement`
+        """
+        return cls._get_mapped_model().select_statement()
+
+    @classmethod
+    def validate_rows(cls, rows: Iterable[Any]) -> list[Self]:
+        """
+        Validates SQLAlchemy Core rows without ORM objects,
+        see :py:meth:`MappedModel.validate_rows`
+        """
+        return cls._get_mapped_model().validate_rows(rows)  # type: ignore[return-value]
+
+    @classmethod
+    def bulk_insert(
+        cls,
+        connection: Connection | Session,
+        payloads: Sequence[Any],
+        returning: Sequence[ReturningColumn] | None = None,
+        sort_by_parameter_order: bool = True,
+    ) -> BulkInsertResult:
+        """
+        Validates `payloads` & inserts valid ones without ORM objects,
+        see :py:meth:`MappedModel.bulk_insert`
+        """
+        return cls._get_mapped_model().bulk_insert(
+            connection, payloads, returning, sort_by_parameter_order
+        )
+
+    @classmethod
+    def validate_polymorphic(cls, sources: Iterable[Any]) -> list[BaseModel]:
+        """
+        Validates a mixed list of objects from a polymorphic hierarchy,
+        each with the model of its class, see :py:attr:`MappedModel.polymorphic_union`
+        """
+        return cls._get_mapped_model().polymorphic_union.validate_many(sources)
+
+    @classmethod
+    def dump_polymorphic_json(cls, sources: Iterable[Any]) -> bytes:
+        """Same as :py:meth:`validate_polymorphic`, but serializes into JSON"""
+        return cls._get_mapped_model().polymorphic_union.dump_many_json(sources)
+
+    @classmethod
+    def iter_record_batches(
+        cls,
+        sources: Iterable[Any],
+        batch_size: int = 10000,
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Converts `sources` into Arrow record batches of column fields,
+        see :py:attr:`MappedModel.arrow_exporter`
+        """
+        return cls._get_mapped_model().arrow_exporter.iter_record_batches(
+            sources, batch_size
+        )
+
+    @classmethod
+    def to_arrow_table(
+        cls, sources: Iterable[Any], batch_size: int = 10000
+    ) -> pa.Table:
+        """Same as :py:meth:`iter_record_batches`, but collects one Arrow table"""
+        return cls._get_mapped_model().arrow_exporter.to_table(sources, batch_size)
+
+    def update_values(self) -> dict[Column[Any], Any]:
+        """
+        Minimal values for ``update().values(...)`` from this (patch) instance,
+        see :py:meth:`MappedModel.update_values`
+        """
+        return type(self)._get_mapped_model().update_values(self)
+
+    @classmethod
+    def bulk_update(
+        cls,
+        connection: Connection | Session,
+        patches: Iterable[tuple[Any, Self]],
+    ) -> int:
+        """
+        Applies patch instances by primary keys in batches,
+        see :py:meth:`MappedModel.bulk_update`
+        """
+        return cls._get_mapped_model().bulk_update(connection, patches)
 
 
-class MappedModel(MarshalModel):
+class MappedModel(MarshalModel[MappedBaseModel]):
     """
     Implementation of :py:class:`MarshalModel` to use inside SQLAlchemy's
     (ORM style) table definitions (i.e. classes inherited from `Base`).
@@ -29,6 +181,103 @@ class MappedModel(MarshalModel):
     An alternative constructor :py:meth:`create` is available to make this happen
     """
 
+    model_base_class: ClassVar[type[MarshalBaseModel]] = MappedBaseModel
+
+    @property
+    def is_abstract(self) -> bool:
+        """Models declared in ``__abstract__`` mapped classes are abstract"""
+        return self.owner is not None and bool(
+            vars(self.owner).get("__abstract__", False)
+        )
+
+    _row_validator: RowValidator | None = None
+
+    @property
+    def row_validator(self) -> RowValidator:
+        """Validator for Core rows, created lazily, see :py:class:`RowValidator`"""
+        if self._row_validator is None:
+            self._row_validator = RowValidator(
+                self.generated_model,
+                (field for field in self.fields if isinstance(field, ColumnField)),
+            )
+        return self._row_validator
+
+    def core_select(self) -> Select[Any]:
+        """
+        Core ``select()`` of columns used by the model, in order of its fields.
+        Its results can be validated with :py:meth:`validate_rows`, even as tuples
+        """
+        return select(*self.row_validator.columns)
+
+    def validate_rows(self, rows: Iterable[Any]) -> list[BaseModel]:
+        """
+        Validates SQLAlchemy Core results (rows, row mappings or tuples,
+        e.g. from ``connection.execute(select(...))``) straight into the model,
+        without ORM objects. Values are matched with column fields through
+        a precomputed plan, see :py:class:`RowValidator`
+        """
+        return self.row_validator.validate_rows(rows)
+
+    _bulk_inserter: BulkInserter | None = None
+
+    @property
+    def bulk_inserter(self) -> BulkInserter:
+        """Inserter for create payloads, created lazily, see :py:class:`BulkInserter`"""
+        if self._bulk_inserter is None:
+            self._bulk_inserter = BulkInserter(
+                self.generated_model,
+                (field for field in self.fields if isinstance(field, ColumnField)),
+            )
+        return self._bulk_inserter
+
+    def bulk_insert(
+        self,
+        connection: Connection | Session,
+        payloads: Sequence[Any],
+        returning: Sequence[ReturningColumn] | None = None,
+        sort_by_parameter_order: bool = True,
+    ) -> BulkInsertResult:
+        """
+        Validates a batch of create `payloads`, collecting per-payload errors,
+        & inserts valid ones with a single Core ``insert()`` executemany
+        (with ``RETURNING`` where the dialect supports it), skipping ORM objects
+        and the unit of work. See :py:meth:`BulkInserter.insert` for parameters
+        """
+        return self.bulk_inserter.insert(
+            connection, payloads, returning, sort_by_parameter_order
+        )
+
+    _patch_updater: PatchUpdater | None = None
+
+    @property
+    def patch_updater(self) -> PatchUpdater:
+        """Compiler for patch instances, created lazily, see :py:class:`PatchUpdater`"""
+        if self._patch_updater is None:
+            self._patch_updater = PatchUpdater(
+                field for field in self.fields if isinstance(field, ColumnField)
+            )
+        return self._patch_updater
+
+    def update_values(self, item: BaseModel) -> dict[Column[Any], Any]:
+        """
+        Compiles an instance of this (patch) model into the minimal mapping
+        for ``update().values(...)``: only supplied column fields (ones, which
+        are not :py:data:`PatchDefault`), keyed by their columns
+        """
+        return self.patch_updater.update_values(item)
+
+    def bulk_update(
+        self,
+        connection: Connection | Session,
+        patches: Iterable[tuple[Any, BaseModel]],
+    ) -> int:
+        """
+        Applies many patches (pairs of primary key values & instances of this
+        model), grouping ones with the same supplied fields into one executemany
+        ``UPDATE``. See :py:meth:`PatchUpdater.bulk_update` for details
+        """
+        return self.patch_updater.bulk_update(connection, patches)
+
     field_types = (
         ColumnField,
         RelationshipField,
@@ -60,12 +309,36 @@ class MappedModel(MarshalModel):
         bases: Sequence[type[BaseModel]] = (),
         includes: Sequence[MarshalModel] = (),
     ) -> Self:
-        return self.create(
-            columns=columns,
-            relationships=relationships,
-            properties=properties,
-            bases=bases,
-            includes=(self, *includes),
+        """
+        Creates a new model with all fields & bases of this one and the ones passed.
+        Results are memoized by arguments, see :py:meth:`MarshalModel.derive`
+        """
+        try:
+            key: Any = (
+                "extend",
+                *(
+                    tuple(argument)
+                    for argument in (
+                        columns,
+                        relationships,
+                        properties,
+                        bases,
+                        includes,
+                    )
+                ),
+            )
+        except TypeError:  # not iterable, can't be memoized
+            key = None
+
+        return self.derive(
+            key,
+            lambda: self.create(
+                columns=columns,
+                relationships=relationships,
+                properties=properties,
+                bases=bases,
+                includes=(self, *includes),
+            ),
         )
 
     def patch_fields(self) -> Iterator[MarshalField]:
@@ -76,4 +349,128 @@ class MappedModel(MarshalModel):
                 yield field
 
     def as_patch(self) -> Self:
-        return type(self)(*self.patch_fields(), bases=self.bases)
+        """
+        Creates the same model, but with all fields converted via
+        :py:meth:`PatchMarshalField.as_patch`. Memoized, see :py:meth:`derive`
+        """
+        return self.derive(
+            "as_patch",
+            lambda: type(self)(*self.patch_fields(), bases=self.bases),
+        )
+
+    def create_selected_model(self, fields: list[MarshalField]) -> Self:
+        """
+        Same as :py:meth:`MarshalModel.create_selected_model`, but keeps the
+        :py:attr:`owner`, so :py:meth:`select_statement` loads selected fields only
+        """
+        marshal_model = super().create_selected_model(fields)
+        marshal_model.owner = self.owner
+        return marshal_model
+
+    def column_attributes(self, entity: type[Any]) -> list[InstrumentedAttribute[Any]]:
+        """
+        ORM attributes of `entity` for all columns used by the model:
+        ones of column fields and ones declared in `depends` of property fields
+        (as columns or attribute names). Relationships are not included
+        """
+        keys: dict[str, None] = {}
+        for field in self.fields:
+            if isinstance(field, ColumnField):
+                keys[field.column.key] = None
+            elif isinstance(field, PropertyField):
+                for dependency in field.depends:
+                    if isinstance(dependency, MappedColumn):
+                        keys[dependency.column.key] = None
+                    elif isinstance(dependency, str):
+                        keys[dependency] = None
+        return [getattr(entity, key) for key in keys]
+
+    def iter_loader_options(
+        self,
+        path: frozenset[int],
+        load_only: bool,
+    ) -> Iterator[LoaderOption]:
+        path = path | {id(self)}
+        for field in self.fields:
+            if not isinstance(field, RelationshipField):
+                continue
+            nested_model = field.find_model()
+            if not isinstance(nested_model, MappedModel):
+                yield field.loader_option()
+                continue
+
+            columns: list[InstrumentedAttribute[Any]] = []
+            if load_only:
+                entity = field.relationship.mapper.class_
+                columns = nested_model.column_attributes(entity)
+            nested_options: list[LoaderOption] = []
+            if id(nested_model) not in path:
+                nested_options = list(nested_model.iter_loader_options(path, load_only))
+            yield field.loader_option(columns, nested_options)
+
+    def find_owner(self) -> type[Any]:
+        if self.owner is None:
+            raise TypeError("Model is not defined in a body of a mapped class")
+        return self.owner
+
+    def loader_options(self, load_only: bool = False) -> list[LoaderOption]:
+        """
+        Loader options to eagerly load all relationships used by this model,
+        recursing into nested MappedModels (cycles are only followed once).
+        Use as ``select(User).options(*User.FullModel.loader_options())``
+        to avoid lazy loads (N+1 queries) during validation
+
+        :param load_only: also restrict loaded columns to ones used by models
+            (see :py:meth:`column_attributes`) via ``load_only``
+        """
+        options = list(self.iter_loader_options(frozenset(), load_only))
+        if not load_only:
+            return options
+        columns = self.column_attributes(self.find_owner())
+        return [sqlalchemy_load_only(*columns), *options]
+
+    _arrow_exporter: ArrowExporter | None = None
+
+    @property
+    def arrow_exporter(self) -> ArrowExporter:
+        """
+        Exporter of column fields into Apache Arrow, created lazily,
+        see :py:class:`ArrowExporter` (requires ``pyarrow``, see the `arrow` extra)
+        """
+        if self._arrow_exporter is None:
+            from pydantic_marshals.sqlalchemy.arrow import (  # noqa: WPS433
+                ArrowExporter,
+            )
+
+            self._arrow_exporter = ArrowExporter(
+                field for field in self.fields if isinstance(field, ColumnField)
+            )
+        return self._arrow_exporter
+
+    _polymorphic_union: PolymorphicUnion | None = None
+
+    @property
+    def polymorphic_union(self) -> PolymorphicUnion:
+        """
+        Discriminated union of models with the same name from all classes
+        in the polymorphic hierarchy of :py:attr:`owner`, created lazily,
+        see :py:class:`PolymorphicUnion` (requires pydantic 2.5+)
+        """
+        if self._polymorphic_union is None:
+            from pydantic_marshals.sqlalchemy.polymorphism import (  # noqa: WPS433
+                PolymorphicUnion,
+            )
+
+            owner = self.find_owner()
+            self._polymorphic_union = PolymorphicUnion(
+                inspect(owner), self.attribute or ""
+            )
+        return self._polymorphic_union
+
+    def select_statement(self) -> Select[Any]:
+        """
+        ``select()`` of the class with this model, which only loads columns
+        & relationships used by the model (and nested ones)
+        """
+        owner = self.find_owner()
+        return select(owner).options(*self.loader_options(load_only=True))
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from enum import Enum
+from typing import Annotated, Any, Union
+
+from pydantic import BaseModel, Discriminator, Tag, TypeAdapter
+from sqlalchemy.orm import Mapper
+
+from pydantic_marshals.base.type_aliases import TypeHint
+from pydantic_marshals.sqlalchemy.lazy_loads import check_lazy_loads, lazy_load_handler
+from pydantic_marshals.sqlalchemy.rows import unwrap_entity
+
+
+class PolymorphicUnion:
+    """
+    Discriminated union of models for all classes in a polymorphic hierarchy
+    (single or joined table inheritance), keyed on the mapper's
+    ``polymorphic_on`` & ``polymorphic_identity``. Models are taken from
+    the same attribute of every mapped class (inherited ones included).
+
+    Sources are dispatched to their models with one dict lookup:
+    instances of mapped classes & generated models by their class,
+    dicts by the discriminator's value (by column name or attribute key)
+    """
+
+    def __init__(self, mapper: Mapper[Any], attribute: str) -> None:
+        if mapper.polymorphic_on is None:
+            raise TypeError(f"{mapper.class_.__name__} is not polymorphic")
+
+        self.column_name: str | None = getattr(mapper.polymorphic_on, "name", None)
+        self.attribute_key: str = mapper.get_property_by_column(
+            mapper.polymorphic_on
+        ).key
+        self.class_tags: dict[type, str] = {}
+        self.identity_tags: dict[Any, str] = {}
+        self.tag_models: dict[str, type[BaseModel]] = {}
+
+        members: list[Any] = []
+        for identity, sub_mapper in mapper.polymorphic_map.items():
+            if not sub_mapper.isa(mapper):
+                continue
+            model: type[BaseModel] = getattr(sub_mapper.class_, attribute)
+            tag = str(identity)
+            self.class_tags[sub_mapper.class_] = tag
+            self.class_tags.setdefault(model, tag)
+            self.tag_models[tag] = model
+            self.identity_tags.update({identity: tag, tag: tag})
+            if isinstance(identity, Enum):
+                self.identity_tags.update({identity.value: tag, identity.name: tag})
+            members.append(Annotated[model, Tag(tag)])
+
+        if not members:
+            raise TypeError(f"{mapper.class_.__name__} has no polymorphic identities")
+
+        type_hint: Any = members[0]  # not a union, nothing to discriminate
+        if len(members) > 1:
+            type_hint = Annotated[
+                Union[tuple(members)],  # noqa: WPS465
+                Discriminator(self.discriminate),
+            ]
+        self.type_hint: TypeHint = type_hint
+        self.adapter: TypeAdapter[list[BaseModel]] = TypeAdapter(list[type_hint])
+
+    def discriminate(self, source: Any) -> str | None:
+        tag = self.class_tags.get(type(source))
+        if tag is not None:
+            return tag
+        if isinstance(source, dict):
+            identity = source.get(self.column_name, source.get(self.attribute_key))
+        else:
+            identity = getattr(source, self.attribute_key, None)
+        return self.identity_tags.get(identity)
+
+    def validate_many(self, sources: Iterable[Any]) -> list[BaseModel]:
+        """
+        Validates a mixed list of `sources`, each with the model of its class.
+        Single-entity rows are unwrapped (see :py:func:`unwrap_entity`), inside
+        :py:func:`detect_lazy_loads` sources are checked by their models
+        """
+        sources = [unwrap_entity(source) for source in sources]
+        if lazy_load_handler.get() is not None:
+            model_sources: dict[str, list[Any]] = {}
+            for source in sources:
+                tag = self.discriminate(source)
+                if tag in self.tag_models:
+                    model_sources.setdefault(tag, []).append(source)
+            for tag, tag_sources in model_sources.items():
+                check_lazy_loads(self.tag_models[tag], tag_sources)
+        return self.adapter.validate_python(sources)
+
+    def dump_many_json(self, sources: Iterable[Any]) -> bytes:
+        """Validates a mixed list of `sources` & serializes them to a JSON array"""
+        return self.adapter.dump_json(self.validate_many(sources))
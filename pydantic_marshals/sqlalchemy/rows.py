@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from operator import itemgetter
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import Column, Row, inspect
+from sqlalchemy.orm import InstanceState
+
+from pydantic_marshals.base.serializers import get_list_adapter
+from pydantic_marshals.sqlalchemy.fields.columns import ColumnField
+
+RowPlan = Callable[[Sequence[Any]], dict[str, Any]]
+
+
+def unwrap_entity(source: Any) -> Any:
+    """
+    Unwraps single-entity rows (e.g. from ``session.execute(select(User))``)
+    into ORM objects. Other sources (one-column Core rows included) are kept
+    """
+    if (
+        isinstance(source, Row)
+        and len(source) == 1
+        and isinstance(inspect(source[0], raiseerr=False), InstanceState)
+    ):
+        return source[0]
+    return source
+
+
+class RowValidator:
+    """
+    Validates SQLAlchemy Core results (:py:class:`Row`, :py:class:`RowMapping`,
+    plain tuples) into a generated model, without ORM objects and attribute access.
+
+    Values are matched with column fields by keys or names of their columns
+    (``ColumnField.generate_name()``), keys not used by the model are skipped.
+    Plain tuples are matched by position, in order of :py:attr:`columns`.
+    A plan (which values go to which fields) is computed once per set of keys
+    """
+
+    def __init__(self, model: type[BaseModel], fields: Iterable[ColumnField]) -> None:
+        self.model = model
+        self.columns: list[Column[Any]] = []
+        self.field_names: dict[str, str] = {}
+        for field in fields:
+            self.columns.append(field.column)
+            self.field_names.setdefault(field.column.key, field.generate_name())
+            self.field_names.setdefault(field.column.name, field.generate_name())
+
+        self.positional_plan = self.build_plan(
+            tuple(column.key for column in self.columns)
+        )
+        self.plans: dict[tuple[str, ...], RowPlan] = {}
+
+    def build_plan(self, keys: tuple[str, ...]) -> RowPlan:
+        indexes: list[int] = []
+        names: list[str] = []
+        for index, key in enumerate(keys):
+            field_name = self.field_names.get(key)
+            if field_name is not None:
+                indexes.append(index)
+                names.append(field_name)
+
+        if indexes == list(range(len(keys))):
+            return lambda values: dict(zip(names, values))
+        if not indexes:  # no fields to fill, pydantic reports missing ones
+            return lambda values: {}
+        if len(indexes) == 1:
+            index, name = indexes[0], names[0]
+            return lambda values: {name: values[index]}
+        getter = itemgetter(*indexes)
+        return lambda values: dict(zip(names, getter(values)))
+
+    def find_plan(self, keys: tuple[str, ...]) -> RowPlan:
+        plan = self.plans.get(keys)
+        if plan is None:
+            plan = self.plans.setdefault(keys, self.build_plan(keys))
+        return plan
+
+    def convert_rows(self, rows: Iterable[Any]) -> Iterator[dict[str, Any]]:
+        """Converts rows into dicts of field values, see :py:class:`RowValidator`"""
+        plan = self.positional_plan
+        metadata = None
+        for row in rows:
+            if isinstance(row, Row):
+                # rows of one result share metadata, reading keys is slower
+                if row._parent is not metadata:  # noqa: WPS437
+                    metadata = row._parent  # noqa: WPS437
+                    plan = self.find_plan(row._fields)  # noqa: WPS437
+                yield plan(row)
+            elif isinstance(row, Mapping):
+                yield self.find_plan(tuple(row.keys()))(tuple(row.values()))
+            else:
+                yield self.positional_plan(row)
+
+    def validate_rows(self, rows: Iterable[Any]) -> list[BaseModel]:
+        """Validates all rows in one call, see :py:func:`get_list_adapter`"""
+        adapter = get_list_adapter(self.model)
+        return adapter.validate_python(list(self.convert_rows(rows)))
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from threading import Lock
+from typing import Any
+
+from pydantic.networks import IPvAnyInterface, IPvAnyNetwork
+from sqlalchemy import ARRAY, JSON, PickleType, TypeDecorator
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.sql.type_api import TypeEngine
+
+from pydantic_marshals.base.type_aliases import TypeHint
+
+TypeResolver = Callable[[TypeEngine[Any]], TypeHint]
+
+
+class TypeRegistry:
+    """
+    Maps SQLAlchemy's types (:py:class:`TypeEngine` subclasses, including
+    ``TypeDecorator``s & dialect-specific types) to python types for fields,
+    see :py:meth:`resolve`. Constraints can be added with ``Annotated``
+    (e.g. ``Annotated[str, MaxLen(17)]`` from ``annotated_types``)
+
+    Entries are looked up by the MRO of the type's class,
+    lookup results are cached for every class
+    """
+
+    def __init__(self) -> None:
+        self.resolvers: dict[type[TypeEngine[Any]], TypeResolver] = {}
+        self.cache: dict[type[TypeEngine[Any]], TypeResolver | None] = {}
+        self.lock = Lock()
+
+    def register_resolver(
+        self,
+        type_engine: type[TypeEngine[Any]],
+        resolver: TypeResolver,
+    ) -> None:
+        """
+        Registers a function to compute python types for instances
+        of `type_engine` (and its subclasses), e.g. for parametrized types
+        """
+        with self.lock:
+            self.resolvers[type_engine] = resolver
+            self.cache.clear()
+
+    def register(self, type_engine: type[TypeEngine[Any]], type_: TypeHint) -> None:
+        """Registers a python type for `type_engine` (and its subclasses)"""
+        self.register_resolver(type_engine, lambda _: type_)
+
+    def find_resolver(self, type_class: type[TypeEngine[Any]]) -> TypeResolver | None:
+        try:
+            return self.cache[type_class]
+        except KeyError:
+            pass
+
+        resolver = None
+        for klass in type_class.__mro__:
+            resolver = self.resolvers.get(klass)
+            if resolver is not None:
+                break
+        self.cache[type_class] = resolver
+        return resolver
+
+    def find_type(self, type_engine: TypeEngine[Any]) -> TypeHint | None:
+        """
+        Same as :py:meth:`resolve`, but returns None
+        instead of falling back to ``python_type``
+        """
+        resolver = self.find_resolver(type(type_engine))
+        if resolver is not None:
+            return resolver(type_engine)
+
+        try:
+            python_type: TypeHint = type_engine.python_type
+        except NotImplementedError:  # sqlalchemy<2.1 for unknown types
+            python_type = object
+        if python_type is not object:
+            return python_type
+
+        if isinstance(type_engine, TypeDecorator):
+            return self.find_type(type_engine.impl_instance)
+        return None
+
+    def resolve(self, type_engine: TypeEngine[Any]) -> TypeHint:
+        """
+        Finds a python type for `type_engine`, trying (in order):
+        registered entries for classes in its MRO, its ``python_type``
+        and the type it decorates (for ``TypeDecorator``s).
+        Falls back to ``python_type`` for unknown types, which could raise
+        :py:class:`NotImplementedError` (or return ``object``)
+        """
+        type_ = self.find_type(type_engine)
+        if type_ is None:
+            return type_engine.python_type
+        return type_
+
+
+def resolve_array(type_engine: TypeEngine[Any]) -> TypeHint:
+    if not isinstance(type_engine, ARRAY):
+        raise TypeError(f"{type_engine} is not an ARRAY")
+    type_: Any = type_registry.find_type(type_engine.item_type) or Any
+    for _ in range(type_engine.dimensions or 1):
+        type_ = list[type_]
+    return type_
+
+
+type_registry = TypeRegistry()
+"""Default registry, used by :py:class:`ColumnField`"""
+
+type_registry.register(JSON, Any)
+type_registry.register(PickleType, Any)
+type_registry.register_resolver(ARRAY, resolve_array)
+type_registry.register(postgresql.INET, IPvAnyInterface)
+type_registry.register(postgresql.CIDR, IPvAnyNetwork)
+type_registry.register(postgresql.MACADDR, str)
+type_registry.register(postgresql.MACADDR8, str)
+type_registry.register(postgresql.TSVECTOR, str)
+type_registry.register(postgresql.HSTORE, dict[str, str | None])
+type_registry.register(postgresql.OID, int)
+type_registry.register(mysql.YEAR, int)
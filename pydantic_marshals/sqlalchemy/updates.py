@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import Column, Connection, Table, Update, bindparam, update
+from sqlalchemy.orm import Session
+
+from pydantic_marshals.base.fields.base import PatchDefault
+from pydantic_marshals.sqlalchemy.fields.columns import ColumnField
+from pydantic_marshals.sqlalchemy.inserts import find_table
+
+
+class PatchUpdater:
+    """
+    Compiles instances of patch models (see :py:meth:`MappedModel.as_patch`)
+    into ``UPDATE`` values: only fields, which were supplied (are not
+    :py:data:`PatchDefault`), mapped to their columns.
+
+    Only column fields are used, their columns should all belong to one table.
+    Rows in bulk updates are matched by the primary key of this table
+    """
+
+    def __init__(self, fields: Iterable[ColumnField]) -> None:
+        self.columns: dict[str, Column[Any]] = {
+            field.generate_name(): field.column for field in fields
+        }
+        self.table: Table = find_table(self.columns.values())
+        self.primary_key: list[Column[Any]] = list(self.table.primary_key.columns)
+        self.statements: dict[tuple[str, ...], Update] = {}
+
+    def supplied_names(self, item: BaseModel) -> tuple[str, ...]:
+        values = vars(item)  # noqa: WPS421
+        return tuple(name for name in self.columns if values[name] is not PatchDefault)
+
+    def update_values(self, item: BaseModel) -> dict[Column[Any], Any]:
+        """Minimal values for ``update().values(...)``: supplied column fields only"""
+        values = vars(item)  # noqa: WPS421
+        return {self.columns[name]: values[name] for name in self.supplied_names(item)}
+
+    def build_statement(self, names: tuple[str, ...]) -> Update:
+        """
+        ``UPDATE`` of columns for field `names` by the primary key, with
+        parameters named ``new_<column key>`` & ``pk_<column key>`` respectively
+        """
+        return (
+            update(self.table)
+            .where(
+                *(
+                    column == bindparam(f"pk_{column.key}")
+                    for column in self.primary_key
+                )
+            )
+            .values(
+                {
+                    self.columns[name]: bindparam(f"new_{self.columns[name].key}")
+                    for name in names
+                }
+            )
+        )
+
+    def find_statement(self, names: tuple[str, ...]) -> Update:
+        statement = self.statements.get(names)
+        if statement is None:
+            statement = self.statements.setdefault(names, self.build_statement(names))
+        return statement
+
+    def bulk_update(
+        self,
+        connection: Connection | Session,
+        patches: Iterable[tuple[Any, BaseModel]],
+    ) -> int:
+        """
+        Applies `patches` (pairs of primary key values & patch instances)
+        with one executemany ``UPDATE`` per set of supplied fields.
+        Composite keys are passed as tuples in order of primary key columns.
+        Patches without supplied column fields are skipped. Nothing is
+        committed, that's up to the caller
+
+        :returns: total number of matched rows (as reported by the driver)
+        """
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for key, item in patches:
+            names = self.supplied_names(item)
+            if not names:
+                continue
+            keys = key if len(self.primary_key) > 1 else (key,)
+            values = vars(item)  # noqa: WPS421
+            parameters = {
+                f"pk_{column.key}": value
+                for column, value in zip(self.primary_key, keys, strict=True)
+            }
+            for name in names:
+                parameters[f"new_{self.columns[name].key}"] = values[name]
+            groups.setdefault(names, []).append(parameters)
+
+        if isinstance(connection, Session):
+            connection = connection.connection()
+        return sum(
+            connection.execute(self.find_statement(names), parameters).rowcount
+            for names, parameters in groups.items()
+        )
@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from itertools import islice
 from types import NoneType, UnionType
 from typing import Any, TypeVar, get_args, get_origin
 
@@ -13,3 +15,25 @@ def is_subtype(maybe_type: Any, klass: type) -> bool:
 
 def is_optional(annotation: Any) -> bool:
     return get_origin(annotation) == UnionType and NoneType in get_args(annotation)
+
+
+def iter_batches(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Splits `iterable` into lists of `size` items (the last one can be shorter)"""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+async def aiter_batches(
+    iterable: AsyncIterable[T],
+    size: int,
+) -> AsyncIterator[list[T]]:
+    """Async version of :py:func:`iter_batches`"""
+    batch: list[T] = []
+    async for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,254 @@
+import sys
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+from types import ModuleType
+from typing import Annotated, Any
+
+import pytest
+from annotated_types import MaxLen
+from pydantic import AfterValidator, BaseModel, ValidationError
+from sqlalchemy import ForeignKey, MetaData, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+from pydantic_marshals.__main__ import main
+from pydantic_marshals.base.codegen import CodeGenerator, generate_code
+from pydantic_marshals.base.fields.properties import PropertyField
+from pydantic_marshals.base.models import MarshalBaseModel, MarshalModel
+from pydantic_marshals.base.registry import ModelGenerationError
+from pydantic_marshals.sqlalchemy import MappedModel
+from tests.unit.conftest import SampleEnum
+
+
+class Base(DeclarativeBase):
+    metadata = MetaData()
+
+
+class AbstractNamed(Base):
+    __abstract__ = True
+
+    name: Mapped[str] = mapped_column(String(100))
+
+    NameModel = MappedModel.create(columns=[name])  # skipped, not generated
+
+
+class Avatar(Base):
+    __tablename__ = "codegen_avatars"
+
+    id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+
+    IdModel = MappedModel.create(columns=[id])
+
+
+class User(Base):
+    __tablename__ = "codegen_users"
+
+    id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+    name: Mapped[str] = mapped_column(String(100))
+    kind: Mapped[SampleEnum] = mapped_column(default=SampleEnum.B)
+    birthday: Mapped[date | None] = mapped_column(default=date(2000, 1, 1))
+
+    avatar_id: Mapped[int] = mapped_column(ForeignKey("codegen_avatars.id"))
+    avatar: Mapped[Avatar] = relationship()
+
+    parent_id: Mapped[int | None] = mapped_column(ForeignKey("codegen_users.id"))
+    children: Mapped[list["User"]] = relationship()
+
+    @property
+    def title(self) -> str:
+        return f"{self.kind.name}: {self.name}"
+
+    CreateModel = MappedModel.create(columns=[name, kind, birthday])
+    PatchModel = CreateModel.as_patch()
+    FullModel = CreateModel.extend(
+        columns=[id],
+        relationships=[(avatar, Avatar.IdModel), (children, "User.FullModel")],
+        properties=[title],
+    )
+
+
+@pytest.fixture(scope="module")
+def generated_code() -> str:
+    return generate_code(__name__)
+
+
+@pytest.fixture(scope="module")
+def generated_module(generated_code: str) -> Iterator[ModuleType]:
+    module = ModuleType("generated_models")
+    sys.modules[module.__name__] = module
+    exec(generated_code, module.__dict__)  # noqa: S102 SCS101
+    yield module
+    sys.modules.pop(module.__name__)
+
+
+@pytest.mark.parametrize(
+    ("class_name", "model_name"),
+    [
+        pytest.param("Avatar_IdModel", "Avatar.IdModel", id="avatar"),
+        pytest.param("User_CreateModel", "User.CreateModel", id="create"),
+        pytest.param("User_PatchModel", "User.PatchModel", id="patch"),
+        pytest.param("User_FullModel", "User.FullModel", id="full"),
+    ],
+)
+def test_generated_fields(
+    generated_module: ModuleType,
+    class_name: str,
+    model_name: str,
+) -> None:
+    owner, _, attribute = model_name.partition(".")
+    runtime_model: type[BaseModel] = getattr(globals()[owner], attribute)
+    generated_model: type[BaseModel] = getattr(generated_module, class_name)
+
+    assert generated_model.__pydantic_complete__
+    assert list(generated_model.model_fields) == list(runtime_model.model_fields)
+    for name, runtime_field in runtime_model.model_fields.items():
+        generated_field = generated_model.model_fields[name]
+        assert repr(generated_field.default) == repr(runtime_field.default)
+        assert generated_field.metadata == runtime_field.metadata
+
+
+def test_generated_validation(generated_module: ModuleType) -> None:
+    user = User(
+        id=1,
+        name="alex",
+        kind=SampleEnum.A,
+        birthday=None,
+        avatar=Avatar(id=2),
+        children=[
+            User(
+                id=3,
+                name="kid",
+                kind=SampleEnum.B,
+                birthday=date(2020, 2, 2),
+                avatar=Avatar(id=4),
+                children=[],
+            )
+        ],
+    )
+    expected: dict[str, Any] = User.FullModel.model_validate(user).model_dump()
+    real = generated_module.User_FullModel.model_validate(user).model_dump()
+    assert real == expected
+
+
+def test_unrepresentable_type() -> None:
+    class Local:
+        pass
+
+    with pytest.raises(TypeError, match="defined locally"):
+        CodeGenerator([]).render_type(list[Local])
+
+
+def test_unrepresentable_value() -> None:
+    with pytest.raises(TypeError, match="can't be represented"):
+        CodeGenerator([]).render_value(object())
+
+
+def test_codegen_command(tmp_path: Path, generated_code: str) -> None:
+    output = tmp_path / "models.py"
+    arguments = ["codegen", __name__, "--output", str(output)]
+
+    assert main([*arguments, "--check"]) == 1
+    assert main(arguments) == 0
+    assert output.read_text(encoding="utf-8") == generated_code
+    assert main([*arguments, "--check"]) == 0
+
+    output.write_text("outdated", encoding="utf-8")
+    assert main([*arguments, "--check"]) == 1
+
+
+class BrokenModel(MarshalModel):
+    def generate_model(self) -> type[MarshalBaseModel]:
+        raise TypeError("bad model")
+
+
+def test_codegen_failures(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setitem(sys.modules, "codegen_failures", ModuleType("codegen_failures"))
+
+    class Models:
+        __module__ = "codegen_failures"
+
+        broken = BrokenModel(bases=[])
+        working = MarshalModel(bases=[])
+
+    broken_key = Models.__dict__["broken"].registry_key
+    failures: dict[str, Exception] = {}
+    code = generate_code("codegen_failures", failures=failures)
+    assert "Models_working(" in code
+    assert "Models_broken" not in code
+    assert list(failures) == [broken_key]
+
+    with pytest.raises(ModelGenerationError):
+        generate_code("codegen_failures")
+
+    output = tmp_path / "models.py"
+    assert main(["codegen", "codegen_failures", "--output", str(output)]) == 1
+    assert output.read_text(encoding="utf-8") == code
+    assert f"{broken_key} failed: TypeError: bad model" in capsys.readouterr().err
+
+
+def check_title(title: str) -> str:
+    return title.strip()
+
+
+def test_rendered_metadata() -> None:
+    limited = Annotated[str, MaxLen(10), AfterValidator(check_title)]
+    code = CodeGenerator([]).render_type(limited)
+    assert "annotated_types.MaxLen(max_length=10)" in code
+    assert f"AfterValidator(func={__name__}.check_title)" in code
+
+    with pytest.raises(TypeError, match="can't be imported"):
+        CodeGenerator([]).render_value(lambda title: title)
+
+
+def test_codegen_render_failures(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setitem(sys.modules, "codegen_render", ModuleType("codegen_render"))
+    title = User.__dict__["title"]
+    unrenderable = Annotated[str, AfterValidator(lambda value: value)]
+
+    class Validated:
+        __module__ = "codegen_render"
+
+        model = MarshalModel(PropertyField(title, unrenderable), bases=[])
+        limited = MarshalModel(
+            PropertyField(title, Annotated[str, MaxLen(10)]), bases=[]
+        )
+
+    class Dependent:
+        __module__ = "codegen_render"
+
+        model = MarshalModel(PropertyField(title, Validated.model), bases=[])
+
+    failures: dict[str, Exception] = {}
+    code = generate_code("codegen_render", failures=failures)
+    assert "Validated_limited(" in code
+    assert "Validated_model" not in code
+    assert "Dependent_model" not in code
+    assert set(failures) == {
+        Validated.__dict__["model"].registry_key,
+        Dependent.__dict__["model"].registry_key,
+    }
+    assert "Validated_model" in str(failures[Dependent.__dict__["model"].registry_key])
+
+    module = ModuleType("generated_render")
+    exec(code, module.__dict__)  # noqa: S102 SCS101
+    (limited,) = (
+        value for name, value in vars(module).items() if name.endswith("limited")
+    )
+    with pytest.raises(ValidationError):
+        limited(title="long enough title")
+
+    with pytest.raises(ModelGenerationError):
+        generate_code("codegen_render")
+
+    output = tmp_path / "models.py"
+    assert main(["codegen", "codegen_render", "--output", str(output)]) == 1
+    assert "Validated.model failed: TypeError" in capsys.readouterr().err
+
+
+def test_abstract_models_skipped(generated_code: str) -> None:
+    assert AbstractNamed.__dict__["NameModel"].is_abstract
+    assert "NameModel" not in generated_code
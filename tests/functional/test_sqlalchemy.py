@@ -1,15 +1,38 @@
+import asyncio
+import pickle  # noqa: S403
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
 from datetime import date, datetime, time, timedelta
+from pathlib import Path
 from typing import Any, Generic, TypeVar
 
 import pytest
 from pydantic import BaseModel, ValidationError
 from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefined
-from sqlalchemy import ForeignKey, MetaData
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy import (
+    Engine,
+    ForeignKey,
+    MetaData,
+    create_engine,
+    event,
+    select,
+    update,
+)
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    relationship,
+)
 
+from pydantic_marshals.base.cache import SchemaCache
 from pydantic_marshals.base.fields.base import PatchDefault
-from pydantic_marshals.sqlalchemy import MappedModel
+from pydantic_marshals.base.fields.properties import PropertyField
+from pydantic_marshals.base.models import MarshalModel
+from pydantic_marshals.sqlalchemy import LazyLoadError, MappedModel, detect_lazy_loads
+from pydantic_marshals.sqlalchemy.inserts import BulkInserter
 from pydantic_marshals.utils import is_subtype
 from tests.unit.conftest import SampleEnum
 
@@ -349,3 +372,920 @@ def test_property_related_usage(
     instance = property_related_model(related=related_model())
     real = property_related_marshal_model.model_validate(instance)
     assert real.model_dump() == {"field": {}}
+
+
+def test_interning(
+    declarative_base: type[DeclarativeBase],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(MappedModel, "intern_models", True)
+
+    class First(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "first"
+        name: Mapped[str] = mapped_column()
+
+        NameModel = MappedModel.create(columns=[name])
+        OtherNameModel = MappedModel.create(columns=[name])
+        PatchModel = NameModel.as_patch()
+        OtherPatchModel = NameModel.as_patch()
+
+    class Second(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "second"
+        name: Mapped[str] = mapped_column()
+
+        NameModel = MappedModel.create(columns=[name])
+
+    assert First.NameModel is First.OtherNameModel
+    assert First.PatchModel is First.OtherPatchModel
+    assert First.NameModel is not First.PatchModel
+    assert First.NameModel is not Second.NameModel
+
+
+def test_self_referential_relationship(
+    declarative_base: type[DeclarativeBase],
+) -> None:
+    class Comment(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "comments"
+        text: Mapped[str] = mapped_column()
+        parent_id: Mapped[int | None] = mapped_column(ForeignKey("comments.id"))
+        replies: Mapped[list["Comment"]] = relationship()
+
+        TreeModel = MappedModel.create(
+            columns=[text],
+            relationships=[(replies, "Comment.TreeModel")],
+        )
+
+    root = Comment(text="root", replies=[Comment(text="reply", replies=[])])
+    assert Comment.TreeModel.model_validate(root).model_dump() == {
+        "text": "root",
+        "replies": [{"text": "reply", "replies": []}],
+    }
+    assert len(Comment.TreeModel.loader_options()) == 1  # cycle is not followed
+
+
+def test_mutually_recursive_relationships(
+    declarative_base: type[DeclarativeBase],
+) -> None:
+    class Employee(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "employees"
+        name: Mapped[str] = mapped_column()
+        department_id: Mapped[int] = mapped_column(ForeignKey("departments.id"))
+        department: Mapped["Department"] = relationship(back_populates="employees")
+
+        FullModel = MappedModel.create(
+            columns=[name],
+            relationships=[(department, "Department.FullModel", True)],
+        )
+
+    class Department(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "departments"
+        title: Mapped[str] = mapped_column()
+        employees: Mapped[list[Employee]] = relationship(back_populates="department")
+
+        FullModel = MappedModel.create(
+            columns=[title],
+            relationships=[(employees, "Employee.FullModel")],
+        )
+
+    marshal_model = Employee.__dict__["FullModel"]
+    assert not marshal_model.is_generated
+    assert list(marshal_model.dependencies()) == [Department.__dict__["FullModel"]]
+
+    department = Department(title="it")
+    employee = Employee(name="alex", department=department)
+    department.employees = [employee]
+    employee_model = Employee.FullModel
+
+    result = employee_model.model_validate(Employee(name="kate", department=None))
+    assert result.model_dump() == {"name": "kate", "department": None}
+
+    result = Department.FullModel.model_validate(Department(title="hr", employees=[]))
+    assert result.model_dump() == {"title": "hr", "employees": []}
+
+    assert len(Employee.FullModel.loader_options()) == 1
+    assert len(Department.FullModel.loader_options()) == 1
+
+    field = employee_model.model_fields["department"]
+    assert field.annotation == Department.FullModel | None
+
+
+def test_attribute_serialization(
+    declarative_base: type[DeclarativeBase],
+) -> None:
+    class Author(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "authors"
+        name: Mapped[str] = mapped_column()
+        books: Mapped[list["Book"]] = relationship(back_populates="author")
+
+        @property
+        def title(self) -> str:
+            return f"author {self.name}"
+
+        FullModel = MappedModel.create(
+            columns=[name],
+            relationships=[(books, "Book.ShortModel")],
+            properties=[title],
+        )
+
+    class Book(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "books"
+        year: Mapped[int | None] = mapped_column()
+        author_id: Mapped[int] = mapped_column(ForeignKey("authors.id"))
+        author: Mapped[Author] = relationship(back_populates="books")
+
+        ShortModel = MappedModel.create(columns=[year])
+
+    author = Author(name="alex", books=[Book(year=2000), Book(year=None)])
+    expected = Author.FullModel.model_validate(author).model_dump_json().encode()
+    assert Author.FullModel.dump_attributes_json(author) == expected
+    assert Author.__dict__["FullModel"].dump_attributes_json(author) == expected
+    assert Author.FullModel.get_marshal_model() is Author.__dict__["FullModel"]
+
+
+def test_bulk_validation(declarative_base: type[DeclarativeBase]) -> None:
+    class Item(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "items"
+        id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+        name: Mapped[str] = mapped_column()
+
+        FullModel = MappedModel.create(columns=[id, name])
+
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    declarative_base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(Item(name=f"item {index}") for index in range(3))
+        session.commit()
+
+        items = session.scalars(select(Item).order_by(Item.id))
+        result = Item.FullModel.validate_many(items)
+        assert [item.model_dump() for item in result] == [
+            {"id": index + 1, "name": f"item {index}"} for index in range(3)
+        ]
+
+        items = session.scalars(select(Item).order_by(Item.id))
+        marshal_model = Item.__dict__["FullModel"]
+        assert marshal_model.dump_many_json(items) == b"[%s]" % b",".join(
+            item.model_dump_json().encode() for item in result
+        )
+
+
+def test_streaming(declarative_base: type[DeclarativeBase]) -> None:
+    class Item(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "items"
+        id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+        name: Mapped[str] = mapped_column()
+
+        FullModel = MappedModel.create(columns=[id, name])
+
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    declarative_base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(Item(name=f"item {index}") for index in range(5))
+        session.commit()
+
+        rows = session.execute(select(Item).order_by(Item.id)).yield_per(2)
+        chunks = list(Item.FullModel.iter_ndjson(rows, batch_size=2))
+        assert len(chunks) == 3
+        assert b"".join(chunks).splitlines() == [
+            b'{"id":%d,"name":"item %d"}' % (index + 1, index) for index in range(5)
+        ]
+
+        rows = session.execute(select(Item).order_by(Item.id)).yield_per(2)
+        result = b"".join(Item.FullModel.iter_json_array(rows, batch_size=2))
+        assert result == Item.FullModel.dump_many_json(session.scalars(select(Item)))
+
+        IdModel = Item.__dict__["FullModel"].select_fields("id").generated_model
+        id_rows = session.execute(select(Item.id).order_by(Item.id)).all()
+        assert b"".join(IdModel.iter_ndjson(id_rows)).splitlines() == [
+            IdModel.model_validate(row).model_dump_json().encode() for row in id_rows
+        ]
+
+
+def test_async_streaming(declarative_base: type[DeclarativeBase]) -> None:
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("greenlet")
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    class Item(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "items"
+        id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+        name: Mapped[str] = mapped_column()
+
+        FullModel = MappedModel.create(columns=[id, name])
+
+    async def export() -> bytes:
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(declarative_base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add_all(Item(name=f"item {index}") for index in range(5))
+            await session.commit()
+
+            rows = await session.stream(select(Item).order_by(Item.id))
+            chunks = Item.FullModel.aiter_json_array(rows, batch_size=2)
+            result = b"".join([chunk async for chunk in chunks])
+        await engine.dispose()
+        return result
+
+    assert asyncio.run(export()) == b"[%s]" % b",".join(
+        b'{"id":%d,"name":"item %d"}' % (index + 1, index) for index in range(5)
+    )
+
+
+@contextmanager
+def record_queries(engine: Engine) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def before_cursor_execute(_: Any, __: Any, statement: str, *___: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_loader_options(declarative_base: type[DeclarativeBase]) -> None:
+    class Country(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "countries"
+        name: Mapped[str] = mapped_column()
+
+        FullModel = MappedModel.create(columns=[name])
+
+    class City(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "cities"
+        name: Mapped[str] = mapped_column()
+        owner_id: Mapped[int] = mapped_column(ForeignKey("owners.id"))
+        country_id: Mapped[int] = mapped_column(ForeignKey("countries.id"))
+        country: Mapped[Country] = relationship()
+
+        FullModel = MappedModel.create(
+            columns=[name],
+            relationships=[(country, Country.FullModel)],
+        )
+
+    class Owner(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "owners"
+        name: Mapped[str] = mapped_column()
+        country_id: Mapped[int] = mapped_column(ForeignKey("countries.id"))
+        country: Mapped[Country] = relationship()
+        cities: Mapped[list[City]] = relationship()
+
+        FullModel = MappedModel.create(
+            columns=[name],
+            relationships=[(country, Country.FullModel), (cities, "City.FullModel")],
+        )
+
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    declarative_base.metadata.create_all(engine)
+    with Session(engine) as session:
+        for index in range(5):
+            country = Country(name=f"country {index}")
+            session.add(
+                Owner(
+                    name=f"owner {index}",
+                    country=country,
+                    cities=[City(name="city", country=country) for _ in range(3)],
+                )
+            )
+        session.commit()
+
+    options = Owner.FullModel.loader_options()
+    assert len(options) == 2
+
+    statement = select(Owner).order_by(Owner.id)
+    with Session(engine) as session, record_queries(engine) as statements:
+        lazy_result = Owner.FullModel.validate_many(session.scalars(statement))
+    assert len(statements) == 1 + 5 + 5  # owners, countries & cities one by one
+
+    with Session(engine) as session, record_queries(engine) as statements:
+        result = Owner.FullModel.validate_many(
+            session.scalars(statement.options(*options))
+        )
+    assert len(statements) == 2  # owners with countries & cities with countries
+    assert result == lazy_result
+
+
+def test_shared_models_per_owner(declarative_base: type[DeclarativeBase]) -> None:
+    class Staff(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "staff"
+        id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+        kind: Mapped[str] = mapped_column()
+        name: Mapped[str] = mapped_column()
+
+        __mapper_args__ = {"polymorphic_on": kind, "polymorphic_identity": "staff"}
+
+        FullModel = MappedModel.create(columns=[name])
+
+    class Clerk(Staff):
+        __tablename__ = None  # type: ignore[assignment]  # single table
+        __mapper_args__ = {"polymorphic_identity": "clerk"}
+
+        PatchModel = Staff.__dict__["FullModel"].as_patch()
+        AdminPatchModel = Staff.__dict__["FullModel"].as_patch()
+
+    class Guard(Staff):
+        __tablename__ = None  # type: ignore[assignment]  # single table
+        __mapper_args__ = {"polymorphic_identity": "guard"}
+
+        PatchModel = Staff.__dict__["FullModel"].as_patch()
+
+    assert Clerk.PatchModel is Clerk.AdminPatchModel  # shared in one owner
+    assert Guard.PatchModel is not Clerk.PatchModel
+    assert Guard.PatchModel.get_marshal_model() is Guard.__dict__["PatchModel"]
+    assert (
+        pickle.loads(pickle.dumps(Guard.PatchModel)) is Guard.PatchModel
+    )  # noqa: S301
+
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    declarative_base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Clerk(name="clerk"), Guard(name="guard")])
+        session.commit()
+
+    with Session(engine) as session:
+        guards = session.scalars(Guard.PatchModel.select_statement()).all()
+        assert [
+            guard.model_dump() for guard in Guard.PatchModel.validate_many(guards)
+        ] == [{"name": "guard"}]
+
+
+def test_column_projection(declarative_base: type[DeclarativeBase]) -> None:
+    class Tag(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "tags"
+        name: Mapped[str] = mapped_column()
+        description: Mapped[str] = mapped_column()
+        post_id: Mapped[int] = mapped_column(ForeignKey("posts.id"))
+
+        ShortModel = MappedModel.create(columns=[name])
+
+    class Post(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "posts"
+        title: Mapped[str] = mapped_column()
+        subtitle: Mapped[str] = mapped_column()
+        text: Mapped[str] = mapped_column()
+        tags: Mapped[list[Tag]] = relationship()
+
+        @property
+        def heading(self) -> str:
+            return f"{self.title}: {self.subtitle}"
+
+        ShortModel = MappedModel.create(
+            columns=[title],
+            relationships=[(tags, Tag.ShortModel)],
+            properties=[PropertyField(heading, depends=[subtitle, "title"])],
+        )
+
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    declarative_base.metadata.create_all(engine)
+    with Session(engine) as session:
+        tag = Tag(name="tag", description="long description")
+        session.add(Post(title="a", subtitle="b", text="long text", tags=[tag]))
+        session.commit()
+
+    with Session(engine) as session, record_queries(engine) as statements:
+        posts = session.scalars(Post.ShortModel.select_statement()).all()
+        result = Post.ShortModel.validate_many(posts)
+
+    assert [post.model_dump() for post in result] == [
+        {"title": "a", "tags": [{"name": "tag"}], "heading": "a: b"}
+    ]
+    assert len(statements) == 2
+    assert "text" not in statements[0]
+    assert "subtitle" in statements[0]
+    assert "description" not in statements[1]
+
+    marshal_model = Post.__dict__["ShortModel"]
+    assert marshal_model.column_attributes(Post) == [Post.title, Post.subtitle]
+    with pytest.raises(TypeError):  # not assigned in a class body
+        marshal_model.as_patch().select_statement()
+
+
+def test_core_rows_validation(declarative_base: type[DeclarativeBase]) -> None:
+    class Person(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "people"
+        id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+        full_name: Mapped[str] = mapped_column("name")
+        age: Mapped[int | None] = mapped_column()
+        note: Mapped[str] = mapped_column()
+
+        FullModel = MappedModel.create(columns=[id, full_name, age])
+
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    declarative_base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Person(full_name="alex", age=20, note="a"),
+                Person(full_name="kate", note="b"),
+            ]
+        )
+        session.commit()
+
+    marshal_model = Person.__dict__["FullModel"]
+    expected = [
+        {"id": 1, "name": "alex", "age": 20},
+        {"id": 2, "name": "kate", "age": None},
+    ]
+    table = Person.__table__
+    with engine.connect() as connection:
+        statements = {
+            "core_select": marshal_model.core_select(),
+            "table": select(table),
+            "reordered": select(table.c.note, table.c.age, table.c.name, table.c.id),
+            "orm_attributes": select(Person.age, Person.id, Person.full_name),
+        }
+        for name, statement in statements.items():
+            rows = connection.execute(statement.order_by(table.c.id)).all()
+            result = Person.FullModel.validate_rows(rows)
+            assert [item.model_dump() for item in result] == expected, name
+
+            mappings = connection.execute(statement.order_by(table.c.id)).mappings()
+            result = marshal_model.validate_rows(mappings)
+            assert [item.model_dump() for item in result] == expected, name
+
+    result = marshal_model.validate_rows([(1, "alex", 20), (2, "kate", None)])
+    assert [item.model_dump() for item in result] == expected
+    assert len(marshal_model.row_validator.plans) == 4
+
+    with engine.connect() as connection:
+        rows = connection.execute(select(table.c.note)).all()
+        with pytest.raises(ValidationError, match="Field required"):
+            marshal_model.validate_rows(rows)
+
+
+def test_lazy_load_detection(
+    declarative_base: type[DeclarativeBase], caplog: pytest.LogCaptureFixture
+) -> None:
+    class Author(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "authors"
+        name: Mapped[str] = mapped_column()
+        biography: Mapped[str] = mapped_column(deferred=True)
+
+        FullModel = MappedModel.create(columns=[name, biography])
+
+    class Book(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "books"
+        title: Mapped[str] = mapped_column()
+        author_id: Mapped[int] = mapped_column(ForeignKey("authors.id"))
+        author: Mapped[Author] = relationship()
+
+        FullModel = MappedModel.create(
+            columns=[title],
+            relationships=[(author, Author.FullModel)],
+        )
+
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    declarative_base.metadata.create_all(engine)
+    with Session(engine) as session:
+        author = Author(name="alex", biography="long text")
+        session.add_all(
+            [Book(title=f"book {index}", author=author) for index in range(3)]
+        )
+        session.commit()
+
+    transient = Book(title="new", author=Author(name="kate", biography="text"))
+    with detect_lazy_loads():  # transient objects can't lazy load anything
+        Book.FullModel.model_validate(transient)
+
+    statement = select(Book).order_by(Book.id)
+    with Session(engine) as session, detect_lazy_loads():
+        books = session.scalars(statement).all()
+        with pytest.raises(LazyLoadError, match="'author' of Book"):
+            Book.FullModel.model_validate(books[0])
+        with pytest.raises(LazyLoadError):
+            Book.FullModel.validate_many(books)
+
+    marshal_model = Book.__dict__["FullModel"]
+    entry_points: list[Callable[[Sequence[Book]], Any]] = [
+        marshal_model.validate_many,
+        marshal_model.dump_many_json,
+        marshal_model.dump_columns_json,
+        lambda books: marshal_model.dump_attributes_json(books[0]),
+        Book.FullModel.dump_columns_json,
+        lambda books: Book.FullModel.dump_attributes_json(books[0]),
+    ]
+    for entry_point in entry_points:
+        with Session(engine) as session, detect_lazy_loads():
+            books = session.scalars(statement).all()
+            with pytest.raises(LazyLoadError, match="'author' of Book"):
+                entry_point(books)
+
+    lazy_loads: list[str] = []
+    with Session(engine) as session, detect_lazy_loads(
+        lambda lazy_load: lazy_loads.append(lazy_load.field)
+    ):
+        Book.FullModel.validate_many(session.scalars(statement).all())
+        assert lazy_loads == ["author", "author", "author"]
+
+        lazy_loads.clear()
+        options = Book.FullModel.loader_options()
+        result = session.scalars(statement.options(*options))
+        list(Book.FullModel.iter_ndjson(result))
+        assert lazy_loads == ["biography"]  # the author is shared
+
+        lazy_loads.clear()
+        Book.FullModel.dump_many_json(result)
+        assert lazy_loads == []  # everything is loaded by now
+
+    with Session(engine) as session, detect_lazy_loads("log"):
+        Book.FullModel.model_validate(session.scalars(statement).first())
+    assert caplog.messages == [
+        "Validating test_lazy_load_detection.<locals>.Book.FullModel"
+        " lazy loads 'author' of Book"
+    ]
+
+    with Session(engine) as session:
+        books = session.scalars(statement).all()
+        Book.FullModel.validate_many(books)  # nothing is checked outside
+
+
+def test_bulk_insert(declarative_base: type[DeclarativeBase]) -> None:
+    class Item(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "items"
+        id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+        title: Mapped[str] = mapped_column("name")
+        count: Mapped[int] = mapped_column(default=1)
+        note: Mapped[str | None] = mapped_column()
+
+        CreateModel = MappedModel.create(columns=[title, count])
+
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    declarative_base.metadata.create_all(engine)
+    payloads = [
+        {"name": "a", "count": 3},
+        {"name": "b"},
+        {"count": "wrong"},
+        {"name": "c", "count": 5},
+    ]
+
+    with engine.begin() as connection, record_queries(engine) as statements:
+        result = Item.CreateModel.bulk_insert(connection, payloads)
+    assert result.indexes == [0, 1, 3]
+    assert [row.id for row in result.rows] == [1, 2, 3]
+    assert list(result.errors) == [2]
+    assert len(result.errors[2].errors()) == 2
+
+    with engine.begin() as connection, record_queries(engine) as statements:
+        result = Item.CreateModel.bulk_insert(
+            connection, payloads, sort_by_parameter_order=False
+        )
+        assert len(result.rows) == 3
+        Item.CreateModel.bulk_insert(connection, payloads, returning=())
+    assert len(statements) == 2  # one executemany each
+
+    with Session(engine) as session:
+        result = Item.CreateModel.bulk_insert(
+            session, payloads[:2], returning=[Item.title]
+        )
+        assert [row.name for row in result.rows] == ["a", "b"]
+        assert Item.CreateModel.bulk_insert(session, [], returning=()).indexes == []
+        session.commit()
+
+        items = session.scalars(select(Item).order_by(Item.id)).all()
+        assert [(item.title, item.count, item.note) for item in items] == [
+            *[("a", 3, None), ("b", 1, None), ("c", 5, None)] * 3,
+            ("a", 3, None),
+            ("b", 1, None),
+        ]
+
+    with pytest.raises(TypeError):  # no columns
+        BulkInserter(Item.CreateModel, [])
+
+
+def test_patch_updates(declarative_base: type[DeclarativeBase]) -> None:
+    class Item(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "items"
+        id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+        title: Mapped[str] = mapped_column("name")
+        count: Mapped[int] = mapped_column(default=1)
+        note: Mapped[str | None] = mapped_column()
+
+        FullModel = MappedModel.create(columns=[title, count, note])
+        PatchModel = FullModel.as_patch()
+
+    table = Item.__table__
+    patch = Item.PatchModel.model_validate({"name": "new", "note": None})
+    assert patch.update_values() == {table.c.name: "new", table.c.note: None}
+    assert Item.PatchModel.model_validate({}).update_values() == {}
+
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    declarative_base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(Item(title=str(index), note="note") for index in range(4))
+        session.commit()
+
+    patches = [
+        (1, Item.PatchModel.model_validate({"count": 5})),
+        (2, Item.PatchModel.model_validate({"name": "b", "note": None})),
+        (3, Item.PatchModel.model_validate({"count": 7})),
+        (4, Item.PatchModel.model_validate({})),
+        (5, Item.PatchModel.model_validate({"count": 9})),  # missing
+    ]
+    with Session(engine) as session, record_queries(engine) as statements:
+        assert Item.PatchModel.bulk_update(session, patches) == 3
+        session.commit()
+    assert len(statements) == 2  # one executemany per set of fields
+
+    with Session(engine) as session:
+        session.execute(update(Item).where(Item.id == 4).values(patch.update_values()))
+        items = session.scalars(select(Item).order_by(Item.id)).all()
+        assert [(item.title, item.count, item.note) for item in items] == [
+            ("0", 5, "note"),
+            ("b", 1, None),
+            ("2", 7, "note"),
+            ("new", 1, None),
+        ]
+
+
+def test_polymorphic_union(declarative_base: type[DeclarativeBase]) -> None:
+    class Animal(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "animals"
+        id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+        kind: Mapped[str] = mapped_column()
+        name: Mapped[str] = mapped_column()
+
+        __mapper_args__ = {"polymorphic_on": kind, "polymorphic_identity": "animal"}
+
+        FullModel = MappedModel.create(columns=[name])
+
+    class Dog(Animal):
+        __tablename__ = None  # type: ignore[assignment]  # single table
+        barks: Mapped[bool] = mapped_column(nullable=True)
+
+        __mapper_args__ = {"polymorphic_identity": "dog"}
+
+        FullModel = Animal.__dict__["FullModel"].extend(columns=[barks])
+
+    class Cat(Animal):
+        __tablename__ = "cats"
+        id: Mapped[int] = mapped_column(  # noqa: VNE003
+            ForeignKey("animals.id"), primary_key=True
+        )
+        lives: Mapped[int] = mapped_column()
+
+        __mapper_args__ = {"polymorphic_identity": "cat"}
+
+        FullModel = Animal.__dict__["FullModel"].extend(columns=[lives])
+
+    class Puppy(Dog):
+        __tablename__ = None
+        __mapper_args__ = {"polymorphic_identity": "puppy"}  # inherits the model
+
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    declarative_base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Dog(name="rex", barks=True),
+                Cat(name="tom", lives=9),
+                Animal(name="nemo"),
+                Puppy(name="bolt", barks=False),
+            ]
+        )
+        session.commit()
+
+    marshal_model = Animal.__dict__["FullModel"]
+    union = marshal_model.polymorphic_union
+    assert union is marshal_model.polymorphic_union
+    assert union.class_tags[Puppy] == "puppy"
+    assert union.class_tags[Dog.FullModel] == "dog"
+
+    expected = [
+        (Dog.FullModel, {"name": "rex", "barks": True}),
+        (Cat.FullModel, {"name": "tom", "lives": 9}),
+        (Animal.FullModel, {"name": "nemo"}),
+        (Dog.FullModel, {"name": "bolt", "barks": False}),
+    ]
+    with Session(engine) as session:
+        animals = session.scalars(select(Animal).order_by(Animal.id)).all()
+        result = Animal.FullModel.validate_polymorphic(animals)
+        assert [(type(item), item.model_dump()) for item in result] == expected
+        assert Animal.FullModel.dump_polymorphic_json(animals) == (
+            b'[{"barks":true,"name":"rex"},{"lives":9,"name":"tom"},'
+            b'{"name":"nemo"},{"barks":false,"name":"bolt"}]'
+        )
+
+        rows = session.execute(select(Animal).order_by(Animal.id)).all()
+        result = Animal.FullModel.validate_polymorphic(rows)
+        assert [(type(item), item.model_dump()) for item in result] == expected
+
+    with Session(engine) as session, detect_lazy_loads():
+        animals = session.scalars(select(Animal).order_by(Animal.id)).all()
+        with pytest.raises(LazyLoadError, match="'barks' of Dog"):
+            Animal.FullModel.validate_polymorphic(animals)  # subclass columns
+
+    payloads = [
+        {"kind": "dog", "name": "rex", "barks": True},
+        {"kind": "cat", "name": "tom", "lives": 9},
+        {"kind": "animal", "name": "nemo"},
+        {"kind": "puppy", "name": "bolt", "barks": False},
+    ]
+    result = union.validate_many(payloads)
+    assert [(type(item), item.model_dump()) for item in result] == expected
+    assert union.adapter.dump_python(result) == [data for _, data in expected]
+
+    with pytest.raises(ValidationError):
+        union.validate_many([{"kind": "fish", "name": "nemo"}])
+
+
+def test_arrow_export(declarative_base: type[DeclarativeBase]) -> None:
+    pa = pytest.importorskip("pyarrow")
+    from decimal import Decimal
+
+    from sqlalchemy import JSON, Numeric
+
+    class Measure(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "measures"
+        id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+        label: Mapped[str] = mapped_column()
+        value: Mapped[float | None] = mapped_column()
+        price: Mapped[Decimal] = mapped_column(Numeric(10, 2))
+        kind: Mapped[SampleEnum] = mapped_column()
+        taken: Mapped[datetime] = mapped_column()
+        extra: Mapped[dict[str, Any]] = mapped_column(JSON)
+
+        FullModel = MappedModel.create(columns=[id, label, value, price, kind, taken])
+        ExtraModel = MappedModel.create(columns=[extra])
+
+    assert Measure.__dict__["FullModel"].arrow_exporter.schema == pa.schema(
+        [
+            pa.field("id", pa.int64(), nullable=False),
+            pa.field("label", pa.string(), nullable=False),
+            pa.field("value", pa.float64()),
+            pa.field("price", pa.decimal128(10, 2), nullable=False),
+            pa.field("kind", pa.dictionary(pa.int32(), pa.string()), nullable=False),
+            pa.field("taken", pa.timestamp("us"), nullable=False),
+        ]
+    )
+    with pytest.raises(TypeError):
+        Measure.__dict__["ExtraModel"].arrow_exporter
+
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    declarative_base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            Measure(
+                label=f"m{index}",
+                value=None if index == 1 else index / 2,
+                price=Decimal(f"{index}.25"),
+                kind=SampleEnum.B if index % 2 else SampleEnum.A,
+                taken=datetime(2000, 1, 1, index),
+                extra={},
+            )
+            for index in range(3)
+        )
+        session.commit()
+
+    expected = {
+        "id": [1, 2, 3],
+        "label": ["m0", "m1", "m2"],
+        "value": [0.0, None, 1.0],
+        "price": [Decimal("0.25"), Decimal("1.25"), Decimal("2.25")],
+        "kind": ["A", "B", "A"],
+        "taken": [datetime(2000, 1, 1, index) for index in range(3)],
+    }
+    statement = select(Measure).order_by(Measure.id)
+    table = Measure.__table__
+    with Session(engine) as session:
+        sources = {
+            "objects": session.scalars(statement).all(),
+            "entity_rows": session.execute(statement).all(),
+            "core_rows": session.execute(select(table).order_by(table.c.id)).all(),
+            "mappings": session.execute(select(table).order_by(table.c.id))
+            .mappings()
+            .all(),
+        }
+        for name, source in sources.items():
+            result = Measure.FullModel.to_arrow_table(source, batch_size=2)
+            assert result.to_pydict() == expected, name
+
+        batches = list(Measure.FullModel.iter_record_batches(sources["objects"], 2))
+        assert [batch.num_rows for batch in batches] == [2, 1]
+        assert Measure.FullModel.to_arrow_table([]).num_rows == 0
+
+
+def test_field_selection(declarative_base: type[DeclarativeBase]) -> None:
+    class Pet(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "pets"
+        id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+        name: Mapped[str] = mapped_column()
+        owner_id: Mapped[int] = mapped_column(ForeignKey("people.id"))
+
+        FullModel = MappedModel.create(columns=[id, name])
+
+    class Worker(declarative_base):  # type: ignore[valid-type, misc]
+        __tablename__ = "people"
+        id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+        name: Mapped[str] = mapped_column()
+        bio: Mapped[str] = mapped_column()
+        manager_id: Mapped[int | None] = mapped_column(ForeignKey("people.id"))
+        manager: Mapped["Worker | None"] = relationship(remote_side="Worker.id")
+        pets: Mapped[list[Pet]] = relationship()
+
+        FullModel = MappedModel.create(
+            columns=[id, name, bio],
+            relationships=[
+                (manager, "Worker.FullModel", True),
+                (pets, Pet.FullModel),
+            ],
+        )
+
+    boss = Worker(id=1, name="boss", bio="...", pets=[])
+    person = Worker(
+        id=2,
+        name="person",
+        bio="...",
+        manager=boss,
+        pets=[Pet(id=1, name="cat")],
+    )
+
+    model = Worker.FullModel.select_fields("id,manager.name,manager.manager.id")
+    assert list(model.model_fields) == ["id", "manager"]
+    assert model.model_validate(person).model_dump() == {
+        "id": 2,
+        "manager": {"name": "boss", "manager": None},
+    }
+    assert Worker.FullModel.select_fields("manager.manager.id", "manager.name,id") is (
+        model
+    )
+    assert pickle.loads(pickle.dumps(model)) is model  # noqa: S301
+    instance = model.model_validate(person)
+    restored = pickle.loads(pickle.dumps(instance))  # noqa: S301
+    assert type(restored) is model
+    assert type(restored.manager) is type(instance.manager)
+    assert restored == instance
+
+    pets_model = Worker.FullModel.select_fields("name", "pets")
+    assert pets_model.model_validate(person).model_dump() == {
+        "name": "person",
+        "pets": [{"id": 1, "name": "cat"}],
+    }
+
+    marshal_model = Worker.__dict__["FullModel"].select_fields("name", "pets.name")
+    assert marshal_model.generated_model is Worker.FullModel.select_fields(
+        "name,pets.name"
+    )
+
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    declarative_base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(person)
+        session.commit()
+
+    statement = marshal_model.select_statement().order_by(Worker.id)
+    with Session(engine) as session, record_queries(engine) as statements:
+        result = marshal_model.validate_many(session.scalars(statement))
+    assert [item.model_dump() for item in result] == [
+        {"name": "boss", "pets": []},
+        {"name": "person", "pets": [{"name": "cat"}]},
+    ]
+    assert len(statements) == 2  # people & pets
+    assert not any("bio" in statement for statement in statements)
+
+    with pytest.raises(ValueError, match="name has no nested fields"):
+        Worker.FullModel.select_fields("name.first")
+
+
+def declare_cached_models() -> tuple[MarshalModel, MarshalModel]:
+    class Base(DeclarativeBase):
+        metadata = MetaData()
+
+    class Avatar(Base):
+        __tablename__ = "avatars"
+        id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+
+        IdModel = MappedModel.create(columns=[id])
+
+    class Author(Base):
+        __tablename__ = "authors"
+        id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+        avatar_id: Mapped[int] = mapped_column(ForeignKey("avatars.id"))
+        avatar: Mapped[Avatar] = relationship()
+        manager_id: Mapped[int | None] = mapped_column(ForeignKey("authors.id"))
+        manager: Mapped["Author | None"] = relationship(remote_side=[id])
+
+        FullModel = MappedModel.create(
+            columns=[id],
+            relationships=[
+                (avatar, Avatar.__dict__["IdModel"]),
+                (manager, "declare_cached_models.<locals>.Author.FullModel", True),
+            ],
+        )
+
+    return Author.__dict__["FullModel"], Avatar.__dict__["IdModel"]
+
+
+def test_cached_json_schema_nested_models(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(MarshalModel, "schema_cache", SchemaCache(tmp_path))
+
+    author_model, _ = declare_cached_models()
+    expected = author_model.json_schema()
+
+    author_model, avatar_model = declare_cached_models()  # like in a new process
+    assert author_model.json_schema() == expected
+    assert not author_model.is_generated
+    assert not avatar_model.is_generated
@@ -0,0 +1,206 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Annotated, Any
+
+import pytest
+from pydantic import AfterValidator, BaseModel, ConfigDict
+
+from pydantic_marshals.base.cache import SchemaCache, describe_model, describe_type
+from pydantic_marshals.base.fields.base import PatchDefault
+from pydantic_marshals.base.fields.properties import PropertyField
+from pydantic_marshals.base.models import MarshalModel
+from tests.unit.conftest import MockStack, SampleEnum, SampleModel
+
+
+class SampleClass:
+    @property
+    def number(self) -> int:
+        return 3
+
+    @property
+    def text(self) -> str:
+        return "text"
+
+
+def create_marshal_model(*properties: Any, patch: bool = False) -> MarshalModel:
+    marshal_model = MarshalModel(
+        *(PropertyField(prop, patch=patch) for prop in properties),
+        bases=[],
+    )
+    marshal_model.model_name = "Sample"
+    return marshal_model
+
+
+@pytest.fixture()
+def schema_cache(tmp_path: Path) -> SchemaCache:
+    return SchemaCache(tmp_path / "cache")
+
+
+@pytest.mark.parametrize(
+    ("type_hint", "expected"),
+    [
+        pytest.param(None, "None", id="none"),
+        pytest.param(int, "builtins.int", id="simple"),
+        pytest.param(
+            int | None,
+            {"origin": "types.UnionType", "args": ["builtins.int", "None"]},
+            id="union",
+        ),
+        pytest.param(
+            SampleEnum,
+            {
+                "enum": f"{SampleEnum.__module__}.SampleEnum",
+                "members": {"A": "1", "B": "2"},
+            },
+            id="enum",
+        ),
+    ],
+)
+def test_type_description(type_hint: Any, expected: Any) -> None:
+    assert describe_type(type_hint) == expected
+
+
+def test_model_type_description() -> None:
+    description = describe_type(list[SampleModel])
+    assert description["origin"] == "builtins.list"
+    assert description["args"][0]["model"].endswith("SampleModel")
+    assert list(description["args"][0]["fields"]) == ["a", "b", "c"]
+    assert description["args"][0]["fields"]["c"]["default"] == "3"
+
+
+def test_recursive_type_description() -> None:
+    class Node(BaseModel):
+        children: list["Node"]
+
+    description = describe_type(Node)
+    assert description["fields"]["children"]["type"]["args"] == [
+        f"{Node.__module__}.{Node.__qualname__}"
+    ]
+
+
+def test_process_independent_description() -> None:
+    description = describe_model(create_marshal_model(SampleClass.number, patch=True))
+    assert description["fields"]["number"]["data"]["default"] == (
+        f"{type(PatchDefault).__module__}.PatchDefaultType.PatchDefault"
+    )
+
+
+def test_fingerprint_changes(schema_cache: SchemaCache) -> None:
+    fingerprints = {
+        schema_cache.fingerprint(describe_model(marshal_model))
+        for marshal_model in (
+            create_marshal_model(SampleClass.number),
+            create_marshal_model(SampleClass.text),
+            create_marshal_model(SampleClass.number, SampleClass.text),
+            create_marshal_model(SampleClass.number, patch=True),
+        )
+    }
+    assert len(fingerprints) == 4
+
+    assert schema_cache.fingerprint(
+        describe_model(create_marshal_model(SampleClass.number))
+    ) == schema_cache.fingerprint(
+        describe_model(create_marshal_model(SampleClass.number))
+    )
+
+
+def test_uncached_json_schema() -> None:
+    marshal_model = create_marshal_model(SampleClass.number)
+    assert marshal_model.json_schema() == (
+        marshal_model.generated_model.model_json_schema()
+    )
+
+
+def test_cached_json_schema(
+    mock_stack: MockStack,
+    monkeypatch: pytest.MonkeyPatch,
+    schema_cache: SchemaCache,
+) -> None:
+    monkeypatch.setattr(MarshalModel, "schema_cache", schema_cache)
+
+    marshal_model = create_marshal_model(SampleClass.number)
+    expected = marshal_model.json_schema()
+    assert expected["properties"]["number"]["type"] == "integer"
+    assert len(list(schema_cache.directory.iterdir())) == 1
+
+    cached_model = create_marshal_model(SampleClass.number)
+    generate_model_mock = mock_stack.enter_mock(cached_model, "generate_model")
+    assert cached_model.json_schema() == expected
+    generate_model_mock.assert_not_called()
+
+    (stale_path,) = schema_cache.directory.iterdir()
+    changed_model = create_marshal_model(SampleClass.number, SampleClass.text)
+    assert "text" in changed_model.json_schema()["properties"]
+    (changed_path,) = schema_cache.directory.iterdir()  # stale entry is pruned
+    assert changed_path != stale_path
+
+    other_model = create_marshal_model(SampleClass.number)
+    other_model.model_name = "Other"
+    other_model.json_schema()
+    assert len(list(schema_cache.directory.iterdir())) == 2
+
+
+def test_broken_cache_entry(schema_cache: SchemaCache) -> None:
+    schema_cache.directory.mkdir()
+    schema_cache.path("key", "broken").write_text("{", encoding="utf-8")
+    assert schema_cache.load("key", "broken") is None
+    assert schema_cache.load("key", "missing") is None
+
+
+def validate_number(number: int) -> int:
+    return number
+
+
+class ValidatedBase(BaseModel):
+    label: Annotated[str, AfterValidator(validate_number), AfterValidator(str)]
+
+
+def create_validated_model() -> MarshalModel:
+    marshal_model = create_marshal_model(SampleClass.number)
+    marshal_model.bases = [ValidatedBase]
+    return marshal_model
+
+
+def validated_fingerprint() -> str:
+    return SchemaCache("").fingerprint(describe_model(create_validated_model()))
+
+
+def test_validator_description() -> None:
+    description = json.dumps(describe_model(create_validated_model()))
+    assert f"{__name__}.validate_number" in description
+    assert "builtins.str" in description
+    assert " at 0x" not in description
+
+
+def test_cross_process_fingerprint() -> None:
+    command = (
+        "from tests.unit.base.test_cache import validated_fingerprint;"
+        "print(validated_fingerprint())"
+    )
+    fingerprints = {
+        subprocess.run(
+            [sys.executable, "-c", command],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+        for _ in range(2)
+    }
+    assert fingerprints == {validated_fingerprint()}
+
+
+@pytest.mark.parametrize("strict", [False, True])
+def test_base_config_fingerprint(schema_cache: SchemaCache, strict: bool) -> None:
+    def create_described_model(strict: bool) -> Any:
+        class Base(BaseModel):
+            model_config = ConfigDict(strict=strict)
+
+        marshal_model = create_marshal_model(SampleClass.number)
+        marshal_model.bases = [Base]
+        return describe_model(marshal_model)
+
+    fingerprint = schema_cache.fingerprint(create_described_model(strict))
+    assert fingerprint == schema_cache.fingerprint(create_described_model(strict))
+    assert fingerprint != schema_cache.fingerprint(create_described_model(not strict))
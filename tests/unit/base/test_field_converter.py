@@ -169,3 +169,55 @@ def test_convert_multiple_fields(
     convert_aliased_field_mock.assert_has_calls(
         [call(dummy_factory(f"aliased_{i}"), str(i)) for i in range(aliased_count)]
     )
+
+
+def create_typed_field_type(
+    convert_result: Any,
+    source_types: tuple[type, ...] | None,
+) -> Mock:
+    result = create_field_convert_mock(convert_result)
+    result.source_types = source_types
+    return result
+
+
+class SampleSource:
+    pass
+
+
+class SampleSubSource(SampleSource):
+    pass
+
+
+def test_dispatch_table(dummy_factory: DummyFactory) -> None:
+    untyped = create_typed_field_type(None, None)
+    typed = create_typed_field_type(None, (SampleSource,))
+    other = create_typed_field_type(None, (int,))
+
+    class Converter(FieldConverter):
+        field_types = (untyped, typed, other)
+
+    assert Converter.field_type_dispatch == {
+        SampleSource: (untyped, typed),
+        int: (untyped, other),
+    }
+
+    assert Converter.find_field_types((SampleSubSource(),)) == (untyped, typed)
+    assert Converter.field_type_dispatch[SampleSubSource] == (untyped, typed)
+    assert Converter.find_field_types((dummy_factory("raw"),)) == (untyped,)
+    assert Converter.find_field_types(()) == (untyped,)
+
+
+def test_dispatched_conversion(dummy_factory: DummyFactory) -> None:
+    before = create_typed_field_type(None, None)
+    skipped = create_typed_field_type(dummy_factory("skipped"), (int,))
+    matching = create_typed_field_type(dummy_factory("return"), (SampleSource,))
+
+    class Converter(FieldConverter):
+        field_types = (before, skipped, matching)
+
+    source = SampleSubSource()
+    assert Converter.convert_field(source) is dummy_factory("return")
+
+    before.convert.assert_called_once_with(source)
+    skipped.convert.assert_not_called()
+    matching.convert.assert_called_once_with(source)
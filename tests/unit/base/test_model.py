@@ -1,13 +1,20 @@
 # mypy: disable-error-code="method-assign"
 
+import copyreg
+import pickle  # noqa: S403
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Barrier
+from time import sleep
 from typing import Any
 from unittest.mock import Mock
 
 import pytest
-from pydantic import create_model
+from pydantic import BaseModel, create_model
 
 from pydantic_marshals.base import models
 from pydantic_marshals.base.fields.base import MarshalField
+from pydantic_marshals.base.fields.properties import PropertyField
 from tests.unit.conftest import DummyFactory, MockStack
 
 
@@ -46,6 +53,30 @@ def test_generated_model_caching(
     generate_model_mock.assert_called_once_with()
 
 
+def test_generated_model_single_flight(mock_stack: MockStack) -> None:
+    thread_count = 16
+    barrier = Barrier(thread_count)
+    model = models.MarshalModel(bases=[])
+
+    def generate_model() -> Any:
+        sleep(0.01)  # widen the race window
+        return object()
+
+    generate_model_mock = mock_stack.enter_mock(
+        model, "generate_model", mock=Mock(side_effect=generate_model)
+    )
+
+    def access_model(_: int) -> Any:
+        barrier.wait()
+        return model.generated_model
+
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        results = list(executor.map(access_model, range(thread_count)))
+
+    generate_model_mock.assert_called_once_with()
+    assert all(result is results[0] for result in results)
+
+
 @pytest.fixture()
 def simple_model() -> models.MarshalModel:
     return models.MarshalModel(bases=[])
@@ -88,6 +119,7 @@ def test_model_generation(
     field_mock.generate_field.return_value = dummy_factory("field_field")
 
     simple_model.model_name = dummy_factory("name")
+    simple_model.model_module = dummy_factory("module")
     simple_model.generate_base = Mock(return_value=dummy_factory("base"))
     simple_model.fields = [field_mock]
 
@@ -99,6 +131,151 @@ def test_model_generation(
 
     create_model_mock.assert_called_once_with(
         dummy_factory("name"),
+        __module__=dummy_factory("module"),
         __base__=dummy_factory("base"),
+        __cls_kwargs__={},
         field_name=dummy_factory("field_field"),
     )
+
+
+class SampleClass:
+    @property
+    def prop(self) -> int:
+        return 3
+
+    @property
+    def other(self) -> int:
+        return 4
+
+
+def create_property_model(
+    *properties: property | Callable[[Any], Any]
+) -> models.MarshalModel:
+    model = models.MarshalModel(
+        *(PropertyField(prop) for prop in properties),
+        bases=[],
+    )
+    model.model_name = "Sample"
+    return model
+
+
+@pytest.fixture()
+def interning(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(models.MarshalModel, "intern_models", True)
+
+
+def test_structural_key() -> None:
+    key = create_property_model(SampleClass.prop).structural_key()
+    assert key is not None
+    assert key == create_property_model(SampleClass.prop).structural_key()
+    assert key != create_property_model(SampleClass.other).structural_key()
+
+
+def test_unhashable_structural_key(mock_stack: MockStack) -> None:
+    model = create_property_model(SampleClass.prop)
+    mock_stack.enter_mock(
+        model.fields[0], "generate_field_data", return_value=iter([("default", [])])
+    )
+    assert model.structural_key() is None
+
+
+def test_no_interning_by_default() -> None:
+    first = create_property_model(SampleClass.prop)
+    second = create_property_model(SampleClass.prop)
+    assert first.generated_model is not second.generated_model
+
+
+@pytest.mark.usefixtures("interning")
+def test_interning() -> None:
+    first = create_property_model(SampleClass.prop)
+    second = create_property_model(SampleClass.prop)
+    other = create_property_model(SampleClass.other)
+
+    assert first.generated_model is second.generated_model
+    assert first.generated_model is not other.generated_model
+
+
+@pytest.mark.parametrize("defer_build", [False, True])
+def test_class_kwargs(monkeypatch: pytest.MonkeyPatch, defer_build: bool) -> None:
+    monkeypatch.setattr(models.MarshalModel, "defer_build", defer_build)
+    expected = {"defer_build": True} if defer_build else {}
+    assert models.MarshalModel(bases=[]).generate_class_kwargs() == expected
+
+
+def test_deferred_build(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(models.MarshalModel, "defer_build", True)
+    model = create_property_model(SampleClass.prop)
+
+    generated_model = model.generated_model
+    assert model.is_generated
+    assert not model.is_materialized
+    assert generated_model.model_config.get("defer_build") is True
+
+    assert generated_model.model_validate(SampleClass()).model_dump() == {"prop": 3}
+    assert model.is_materialized
+
+
+def test_eager_build() -> None:
+    model = create_property_model(SampleClass.prop)
+    assert not model.is_materialized
+    assert model.generated_model.model_config.get("defer_build") is None
+    assert model.is_materialized
+
+
+class PicklableClass:
+    @property
+    def prop(self) -> int:
+        return 3
+
+    model = models.MarshalModel(PropertyField(prop), bases=[])
+
+
+def dump_in_worker(instance: Any) -> str:
+    return instance.model_dump_json()  # type: ignore[no-any-return]
+
+
+def test_pickling() -> None:
+    model = PicklableClass.model
+    assert model.__module__ == __name__
+    assert pickle.loads(pickle.dumps(model)) is model  # noqa: S301
+
+    instance = model.model_validate(PicklableClass())
+    restored = pickle.loads(pickle.dumps(instance))  # noqa: S301
+    assert type(restored) is model
+    assert restored == instance
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(dump_in_worker, instance).result() == '{"prop":3}'
+
+
+class PlainModel(BaseModel):
+    number: int
+
+
+def test_pickling_plain_models() -> None:
+    metaclass = type(models.MarshalBaseModel)
+    assert copyreg.dispatch_table[metaclass] is models.reduce_model_class
+    assert type(PlainModel) not in copyreg.dispatch_table
+
+    assert pickle.loads(pickle.dumps(PlainModel)) is PlainModel  # noqa: S301
+    restored = pickle.loads(pickle.dumps(PlainModel(number=3)))  # noqa: S301
+    assert restored == PlainModel(number=3)
+
+
+def test_pickling_registered_models() -> None:
+    source = create_property_model(SampleClass.prop)
+
+    def derive_model() -> models.MarshalModel:
+        return models.MarshalModel(*source.fields, bases=[])
+
+    class LocalClass:  # not reachable by name
+        model = source.derive("copy", derive_model)
+        other_model = source.derive("copy", derive_model)
+
+    selected = LocalClass.__dict__["other_model"].select_fields("prop")
+    for model in (LocalClass.model, LocalClass.other_model, selected.generated_model):
+        assert pickle.loads(pickle.dumps(model)) is model  # noqa: S301
+        instance = model.model_validate(SampleClass())
+        restored = pickle.loads(pickle.dumps(instance))  # noqa: S301
+        assert type(restored) is model
+        assert restored == instance
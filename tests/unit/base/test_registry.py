@@ -0,0 +1,160 @@
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_marshals.__main__ import main
+from pydantic_marshals.base.models import MarshalModel
+from pydantic_marshals.base.registry import (
+    MarshalRegistry,
+    ModelGenerationError,
+    registry,
+)
+from tests.unit.conftest import MockStack
+
+
+def test_registration(local_registry: MarshalRegistry) -> None:
+    class M:
+        model = MarshalModel(bases=[])
+
+    marshal_model = M.__dict__["model"]
+    assert marshal_model.registry_key == f"{__name__}:{M.__qualname__}.model"
+    assert local_registry.get(marshal_model.registry_key) is marshal_model
+    assert list(local_registry) == [marshal_model]
+
+
+def test_build_order(local_registry: MarshalRegistry, mock_stack: MockStack) -> None:
+    class M:
+        first = MarshalModel(bases=[])
+        second = MarshalModel(bases=[])
+
+    first, second = M.__dict__["first"], M.__dict__["second"]
+    mock_stack.enter_mock(first, "dependencies", return_value=iter([second]))
+
+    assert list(local_registry.iter_build_order()) == [second, first]
+
+
+def test_warm_up(local_registry: MarshalRegistry) -> None:
+    class M:
+        built = MarshalModel(bases=[])
+        lazy = MarshalModel(bases=[])
+
+    built_model: Any = M.built
+    marshal_model = M.__dict__["lazy"]
+    assert not marshal_model.is_generated
+
+    timings = local_registry.warm_up()
+    assert list(timings.keys()) == [marshal_model.registry_key]
+    assert timings[marshal_model.registry_key] >= 0
+    assert marshal_model.is_generated
+    assert issubclass(built_model, BaseModel)
+
+    assert local_registry.warm_up() == {}
+
+
+def test_warm_up_failures(
+    local_registry: MarshalRegistry, mock_stack: MockStack
+) -> None:
+    class M:
+        broken = MarshalModel(bases=[])
+        model = MarshalModel(bases=[])
+
+    broken_model = M.__dict__["broken"]
+    mock_stack.enter_mock(
+        broken_model, "generate_model", mock=Mock(side_effect=TypeError("bad"))
+    )
+
+    failures: dict[str, Exception] = {}
+    timings = local_registry.warm_up(failures)
+    assert list(timings) == [M.__dict__["model"].registry_key]
+    assert list(failures) == [broken_model.registry_key]
+    assert isinstance(failures[broken_model.registry_key], TypeError)
+
+    with pytest.raises(ModelGenerationError, match=r"1 model\(s\)") as error_info:
+        local_registry.warm_up()
+    error = error_info.value.failures[broken_model.registry_key]
+    assert isinstance(error, TypeError)
+    assert error_info.value.__cause__ is error
+
+
+def test_warmup_command_failures(
+    local_registry: MarshalRegistry,
+    mock_stack: MockStack,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    class M:
+        broken = MarshalModel(bases=[])
+        model = MarshalModel(bases=[])
+
+    broken_model = M.__dict__["broken"]
+    mock_stack.enter_mock(
+        broken_model, "generate_model", mock=Mock(side_effect=TypeError("bad"))
+    )
+
+    assert main(["warmup", "json"]) == 1
+    assert M.__dict__["model"].is_generated
+
+    output = capsys.readouterr()
+    assert "1 built" in output.out
+    assert f"{broken_model.registry_key} failed: TypeError: bad" in output.err
+
+
+def test_warmup_command(
+    local_registry: MarshalRegistry,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    class M:
+        model = MarshalModel(bases=[])
+
+    assert main(["warmup", "json"]) == 0
+    assert M.__dict__["model"].is_generated
+
+    output = capsys.readouterr().out
+    assert M.__dict__["model"].registry_key in output
+    assert "1 built, 1 materialized, 1 registered" in output
+
+
+def test_global_registry() -> None:
+    assert isinstance(registry, MarshalRegistry)
+
+
+def test_count_materialized(
+    local_registry: MarshalRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class M:
+        eager = MarshalModel(bases=[])
+
+    class D:
+        deferred = MarshalModel(bases=[])
+        other_deferred = MarshalModel(bases=[])
+
+    monkeypatch.setattr(M.__dict__["eager"], "defer_build", False)
+    for name in ("deferred", "other_deferred"):
+        monkeypatch.setattr(D.__dict__[name], "defer_build", True)
+
+    assert local_registry.count_materialized() == 0
+    local_registry.warm_up()
+    assert local_registry.count_materialized() == 1
+
+    D.deferred.model_validate({})
+    assert local_registry.count_materialized() == 2
+
+
+def test_find(local_registry: MarshalRegistry) -> None:
+    class First:
+        model = MarshalModel(bases=[])
+
+    class Second:
+        model = MarshalModel(bases=[])
+
+    first = First.__dict__["model"]
+    assert local_registry.find(first.registry_key) is first
+    assert local_registry.find(first.model_name) is first
+    assert local_registry.find("First.model") is first
+
+    with pytest.raises(LookupError, match="ambiguous"):
+        local_registry.find("model")
+    with pytest.raises(LookupError, match="not found"):
+        local_registry.find("Third.model")
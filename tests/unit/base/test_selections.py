@@ -0,0 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from pydantic_marshals.base.fields.properties import PropertyField
+from pydantic_marshals.base.models import MarshalModel
+from pydantic_marshals.base.selections import SelectionCache, parse_field_selection
+
+
+class SampleClass:
+    @property
+    def number(self) -> int:
+        return 3
+
+    @property
+    def text(self) -> str:
+        return "text"
+
+
+def create_marshal_model() -> MarshalModel:
+    marshal_model = MarshalModel(
+        PropertyField(SampleClass.number),
+        PropertyField(SampleClass.text, alias="label"),
+        bases=[],
+    )
+    marshal_model.model_name = "Sample"
+    return marshal_model
+
+
+@pytest.mark.parametrize(
+    ("paths", "expected"),
+    [
+        pytest.param((), frozenset(), id="empty"),
+        pytest.param(("", " , "), frozenset(), id="blank"),
+        pytest.param(
+            ("id,name", "id"),
+            frozenset({("id", frozenset()), ("name", frozenset())}),
+            id="duplicates",
+        ),
+        pytest.param(
+            ("a.b, a.c", "a", "d"),
+            frozenset(
+                {
+                    ("a", frozenset({("b", frozenset()), ("c", frozenset())})),
+                    ("d", frozenset()),
+                }
+            ),
+            id="nested",
+        ),
+    ],
+)
+def test_parse_field_selection(paths: tuple[str, ...], expected: Any) -> None:
+    assert parse_field_selection(paths) == expected
+    assert parse_field_selection(reversed(paths)) == expected
+
+
+def test_selection_cache_eviction() -> None:
+    cache = SelectionCache(maxsize=2)
+    models = {name: create_marshal_model() for name in "abc"}
+    selections = {name: parse_field_selection([name]) for name in "abc"}
+
+    def get(name: str) -> MarshalModel:
+        return cache.get(selections[name], lambda: models[name])
+
+    assert get("a") is models["a"]
+    assert get("b") is models["b"]
+    assert cache.get(selections["a"], create_marshal_model) is models["a"]
+    assert get("c") is models["c"]  # evicts "b", as "a" was used recently
+    assert len(cache) == 2
+    assert cache.get(selections["b"], create_marshal_model) is not models["b"]
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_disabled_selection_cache() -> None:
+    cache = SelectionCache(maxsize=0)
+    selection = parse_field_selection(["a"])
+    assert cache.get(selection, create_marshal_model) is not cache.get(
+        selection, create_marshal_model
+    )
+    assert len(cache) == 0
+
+
+def test_select_fields() -> None:
+    marshal_model = create_marshal_model()
+
+    selected = marshal_model.select_fields("label")
+    assert selected.model_name == "Sample[text]"
+    assert list(selected.generated_model.model_fields) == ["text"]
+    assert marshal_model.select_fields(" label ") is selected
+    assert marshal_model.select_fields("text").fields == selected.fields
+
+    numbers = marshal_model.select_fields("number").generated_model
+    assert numbers.model_validate(SampleClass()).model_dump() == {"number": 3}
+    assert marshal_model.select_fields("number,text").fields == marshal_model.fields
+    assert marshal_model.select_fields() is marshal_model
+
+
+@pytest.mark.parametrize(
+    ("path", "message"),
+    [
+        pytest.param("missing", "Unknown field missing in Sample", id="unknown"),
+        pytest.param("number.id", "Field number has no nested fields", id="nested"),
+    ],
+)
+def test_select_unknown_fields(path: str, message: str) -> None:
+    marshal_model = create_marshal_model()
+    with pytest.raises(ValueError, match=message):
+        marshal_model.select_fields(path)
+    assert len(marshal_model._selection_cache) == 0  # noqa: WPS437
+
+
+def test_concurrent_selection() -> None:
+    marshal_model = create_marshal_model()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda _: marshal_model.select_fields("number"), range(64))
+        )
+    assert all(result is results[0] for result in results)
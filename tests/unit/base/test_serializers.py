@@ -0,0 +1,359 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from threading import Barrier
+from types import SimpleNamespace
+from typing import Annotated, Any
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, create_model
+from pydantic_core import from_json, to_json
+
+from pydantic_marshals.base.models import MarshalBaseModel
+from pydantic_marshals.base.serializers import (
+    AttributeSerializer,
+    dump_json_array,
+    get_list_adapter,
+    get_serializer,
+)
+from pydantic_marshals.utils import aiter_batches, iter_batches
+from tests.unit.conftest import SampleEnum
+
+
+class Inner(MarshalBaseModel):
+    number: int
+
+
+class Outer(MarshalBaseModel):
+    text: str
+    when: date
+    enum: SampleEnum
+    inner: Inner
+    maybe_inner: Inner | None
+    inners: list[Inner]
+    tags: set[str]
+    annotated: Annotated[Inner, Field(description="annotated")]
+    aliased: int = Field(alias="real_name")
+
+
+class Node(MarshalBaseModel):
+    value: int
+    children: list["Node"]
+
+
+def test_serialization() -> None:
+    inner = SimpleNamespace(number=3)
+    source = SimpleNamespace(
+        text="text",
+        when=date(2000, 1, 2),
+        enum=SampleEnum.B,
+        inner=inner,
+        maybe_inner=None,
+        inners=[inner, inner],
+        tags={"tag"},
+        annotated=inner,
+        real_name=5,
+    )
+
+    expected = Outer.model_validate(source)
+    assert Outer.dump_attributes_json(source) == expected.model_dump_json().encode()
+
+
+def test_recursive_serialization() -> None:
+    leaf = SimpleNamespace(value=2, children=[])
+    root = SimpleNamespace(value=1, children=[leaf])
+
+    assert (
+        Node.dump_attributes_json(root)
+        == b'{"value":1,"children":[{"value":2,"children":[]}]}'
+    )
+
+
+class Measures(MarshalBaseModel):
+    value: float
+    duration: timedelta
+    payload: bytes
+
+
+class FloatMeasures(Measures):
+    model_config = ConfigDict(
+        ser_json_inf_nan="strings",
+        ser_json_timedelta="float",
+        ser_json_bytes="base64",
+    )
+
+
+class MeasuresHolder(MarshalBaseModel):
+    measures: FloatMeasures
+    maybe_measures: Measures | None
+    values: list[float]
+
+
+measures_sources = [
+    SimpleNamespace(value=value, duration=timedelta(seconds=90), payload=b"\x00a")
+    for value in (1.5, float("inf"), float("-inf"), float("nan"))
+]
+
+
+@pytest.mark.parametrize("model", [Measures, FloatMeasures])
+@pytest.mark.parametrize("source", measures_sources)
+def test_json_config_parity(model: type[MarshalBaseModel], source: Any) -> None:
+    expected = model.model_validate(source).model_dump_json().encode()
+    assert model.dump_attributes_json(source) == expected
+
+
+@pytest.mark.parametrize("source", measures_sources)
+def test_nested_json_config_parity(source: Any) -> None:
+    holder = SimpleNamespace(
+        measures=source, maybe_measures=source, values=[source.value]
+    )
+    expected = MeasuresHolder.model_validate(holder).model_dump_json().encode()
+    assert MeasuresHolder.dump_attributes_json(holder) == expected
+
+
+def test_concurrent_serializer_planning() -> None:
+    models = [
+        create_model(f"Model{index}", __base__=Outer, extra=(Inner, ...))
+        for index in range(32)
+    ]
+    barrier = Barrier(len(models))
+
+    def plan(model: type[BaseModel]) -> int:
+        barrier.wait()
+        return len(get_serializer(model).plan)
+
+    with ThreadPoolExecutor(max_workers=len(models)) as executor:
+        lengths = list(executor.map(plan, models))
+    assert lengths == [len(Outer.model_fields) + 1] * len(models)
+
+
+def make_outer(index: int, inner: Any) -> Any:
+    return SimpleNamespace(
+        text=str(index),
+        when=date(2000, 1, index + 1),
+        enum=SampleEnum.A,
+        inner=SimpleNamespace(number=index),
+        maybe_inner=inner,
+        inners=[],
+        tags=set(),
+        annotated=SimpleNamespace(number=-index),
+        real_name=index,
+    )
+
+
+def test_columnar_serialization() -> None:
+    sources = [make_outer(0, SimpleNamespace(number=5)), make_outer(1, None)]
+    columns = get_serializer(Outer).to_columns(sources)
+    rows = [Outer.model_validate(source).model_dump(mode="json") for source in sources]
+    assert list(columns) == list(rows[0])
+    expected = to_json({key: [row[key] for row in rows] for key in rows[0]})
+    assert Outer.dump_columns_json(sources) == expected
+    assert Outer.dump_columns_json([]) == to_json({key: [] for key in columns})
+
+
+def test_flat_columnar_serialization() -> None:
+    sources = [make_outer(0, SimpleNamespace(number=5)), make_outer(1, None)]
+    columns = get_serializer(Outer).to_columns(sources, flatten=True)
+    assert columns == {
+        "text": ["0", "1"],
+        "when": [date(2000, 1, 1), date(2000, 1, 2)],
+        "enum": [SampleEnum.A, SampleEnum.A],
+        "inner.number": [0, 1],
+        "maybe_inner.number": [5, None],
+        "inners": [[], []],
+        "tags": [[], []],
+        "annotated.number": [0, -1],
+        "aliased": [0, 1],
+    }
+
+
+@pytest.mark.parametrize("flatten", [False, True])
+def test_columnar_json_config_parity(flatten: bool) -> None:
+    holders = [
+        SimpleNamespace(measures=source, maybe_measures=None, values=[source.value])
+        for source in measures_sources
+    ]
+    rows = [
+        from_json(MeasuresHolder.model_validate(holder).model_dump_json())
+        for holder in holders
+    ]
+    result = from_json(MeasuresHolder.dump_columns_json(holders, flatten))
+    assert result["values"] == [row["values"] for row in rows]
+    if not flatten:
+        assert result["measures"] == [row["measures"] for row in rows]
+        return
+    for key in FloatMeasures.model_fields:
+        expected = [row["measures"][key] for row in rows]
+        assert result[f"measures.{key}"] == expected
+
+
+class Chain(MarshalBaseModel):
+    value: int
+    next: "Chain | None"  # noqa: WPS125
+
+
+def test_recursive_flat_columnar_serialization() -> None:
+    last = SimpleNamespace(value=3, next=None)
+    sources = [SimpleNamespace(value=1, next=SimpleNamespace(value=2, next=last))]
+    assert Chain.dump_columns_json(sources, flatten=True) == (
+        b'{"value":[1],"next":[{"value":2,"next":{"value":3,"next":null}}]}'
+    )
+
+
+@pytest.mark.parametrize(
+    ("annotation", "check_converter"),
+    [
+        pytest.param(int, lambda converter: converter is None, id="simple"),
+        pytest.param(int | None, lambda converter: converter is None, id="optional"),
+        pytest.param(list[int], lambda converter: converter is list, id="list"),
+        pytest.param(
+            Inner | int,
+            lambda converter: converter is not None,
+            id="ambiguous_union",
+        ),
+        pytest.param(
+            dict[str, Inner],
+            lambda converter: converter is not None,
+            id="fallback",
+        ),
+    ],
+)
+def test_converter_building(
+    annotation: Any,
+    check_converter: Callable[[Any], bool],
+) -> None:
+    serializer = AttributeSerializer(BaseModel)
+    assert check_converter(serializer.build_converter(annotation))
+
+
+def test_fallback_conversion() -> None:
+    converter = AttributeSerializer(BaseModel).build_converter(dict[str, Inner])
+    assert converter is not None
+    assert converter({"key": SimpleNamespace(number=1)}) == {"key": {"number": 1}}
+
+
+def test_serializer_caching() -> None:
+    serializer = get_serializer(Outer)
+    assert get_serializer(Outer) is serializer
+    assert get_serializer(Inner) is not serializer
+    assert len(serializer.plan) == len(Outer.model_fields)
+
+
+@pytest.mark.parametrize(
+    "make_sources",
+    [
+        pytest.param(list, id="list"),
+        pytest.param(lambda items: (item for item in items), id="generator"),
+    ],
+)
+def test_validate_many(make_sources: Callable[[list[Any]], Any]) -> None:
+    sources = [SimpleNamespace(number=number) for number in range(3)]
+
+    result = Inner.validate_many(make_sources(sources))
+    assert result == [Inner(number=number) for number in range(3)]
+    assert Inner.dump_many_json(make_sources(sources)) == (
+        b'[{"number":0},{"number":1},{"number":2}]'
+    )
+
+
+def test_list_adapter_caching() -> None:
+    adapter = get_list_adapter(Inner)
+    assert get_list_adapter(Inner) is adapter
+    assert get_list_adapter(Outer).core_schema != adapter.core_schema
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 5])
+def test_streaming(batch_size: int) -> None:
+    sources = [SimpleNamespace(number=number) for number in range(3)]
+    lines = [b'{"number":%d}' % number for number in range(3)]
+
+    chunks = list(Inner.iter_ndjson(iter(sources), batch_size=batch_size))
+    assert len(chunks) == len(list(iter_batches(sources, batch_size)))
+    assert b"".join(chunks) == b"".join(line + b"\n" for line in lines)
+
+    chunks = list(Inner.iter_json_array(iter(sources), batch_size=batch_size))
+    assert b"".join(chunks) == Inner.dump_many_json(sources)
+
+
+def test_streaming_empty() -> None:
+    assert list(Inner.iter_ndjson([])) == []
+    assert b"".join(Inner.iter_json_array([])) == b"[]"
+    assert Inner.dump_many_json([]) == b"[]"
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 5])
+def test_dump_json_array(batch_size: int) -> None:
+    sources = [SimpleNamespace(number=number) for number in range(3)]
+    adapter = get_list_adapter(Inner)
+    expected = adapter.dump_json(adapter.validate_python(sources))
+    assert dump_json_array(Inner, iter(sources), batch_size) == expected
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [
+        pytest.param(2, [[0, 1], [2, 3], [4]], id="partial"),
+        pytest.param(5, [[0, 1, 2, 3, 4]], id="exact"),
+        pytest.param(10, [[0, 1, 2, 3, 4]], id="bigger"),
+    ],
+)
+def test_iter_batches(size: int, expected: list[list[int]]) -> None:
+    assert list(iter_batches(range(5), size)) == expected
+
+
+async def iter_async(items: list[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+async def collect_async(chunks: AsyncIterator[bytes]) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 5])
+def test_async_streaming(batch_size: int) -> None:
+    sources = [SimpleNamespace(number=number) for number in range(3)]
+
+    chunks = asyncio.run(
+        collect_async(Inner.aiter_ndjson(iter_async(sources), batch_size))
+    )
+    assert chunks == list(Inner.iter_ndjson(sources, batch_size))
+
+    chunks = asyncio.run(
+        collect_async(Inner.aiter_json_array(iter_async(sources), batch_size))
+    )
+    assert chunks == list(Inner.iter_json_array(sources, batch_size))
+
+
+def test_async_streaming_yields_to_event_loop() -> None:
+    sources = [SimpleNamespace(number=number) for number in range(4)]
+    ticks: list[int] = []
+
+    async def tick() -> None:
+        while True:  # noqa: WPS457
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def export() -> list[int]:
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        ticks_per_chunk = []
+        async for _ in Inner.aiter_ndjson(iter_async(sources), batch_size=1):
+            ticks_per_chunk.append(len(ticks))
+        ticker.cancel()
+        return ticks_per_chunk
+
+    ticks_per_chunk = asyncio.run(export())
+    assert len(ticks_per_chunk) == 4
+    assert ticks_per_chunk == sorted(set(ticks_per_chunk))  # ticked in between
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 10])
+def test_aiter_batches(size: int) -> None:
+    async def collect() -> list[list[int]]:
+        return [
+            batch async for batch in aiter_batches(iter_async(list(range(5))), size)
+        ]
+
+    assert asyncio.run(collect()) == list(iter_batches(range(5), size))
@@ -9,6 +9,8 @@ import pytest
 from pydantic import BaseModel
 from pydantic_core import PydanticUndefined, PydanticUndefinedType
 
+from pydantic_marshals.base.registry import MarshalRegistry
+
 DummyException = BaseException
 
 
@@ -132,3 +134,12 @@ class MockStack(ExitStack):
 def mock_stack() -> Iterator[MockStack]:
     with MockStack() as stack:
         yield stack
+
+
+@pytest.fixture()
+def local_registry(mock_stack: MockStack) -> MarshalRegistry:
+    """Empty registry, which replaces the global one for models declared in a test"""
+    local_registry = MarshalRegistry()
+    for target in ("base.models.registry", "__main__.registry"):
+        mock_stack.enter_context(patch(f"pydantic_marshals.{target}", local_registry))
+    return local_registry
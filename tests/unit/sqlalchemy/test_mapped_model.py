@@ -1,17 +1,25 @@
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any, TypeVar
 from unittest.mock import Mock, call
 
 import pytest
 from pydantic import BaseModel
-from sqlalchemy.orm import MappedColumn, Relationship
+from sqlalchemy import MetaData
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    MappedColumn,
+    Relationship,
+    mapped_column,
+)
 
 from pydantic_marshals.base.fields.base import MarshalField
 from pydantic_marshals.base.fields.properties import PropertyField
 from pydantic_marshals.base.models import MarshalModel
+from pydantic_marshals.base.registry import MarshalRegistry, registry
 from pydantic_marshals.sqlalchemy.fields.columns import ColumnField
 from pydantic_marshals.sqlalchemy.fields.relationships import RelationshipField
-from pydantic_marshals.sqlalchemy.models import MappedModel
+from pydantic_marshals.sqlalchemy.models import MappedBaseModel, MappedModel
 from tests.unit.conftest import DummyFactory, MockStack
 
 
@@ -152,3 +160,113 @@ def test_extends(
     assert real_includes[0] is model
     for i in range(included_count or 0):
         assert real_includes[i + 1] is dummy_factory(f"include_{i}")
+
+
+def test_extend_memoization(mock_stack: MockStack) -> None:
+    create_mock = mock_stack.enter_mock(
+        MappedModel, "create", mock=Mock(side_effect=lambda **_: MappedModel(bases=[]))
+    )
+    model = MappedModel(bases=[])
+    column = MappedColumn()  # type: ignore[var-annotated]
+    relationship = (Relationship(), BaseModel)  # type: ignore[var-annotated]
+
+    extended = model.extend(columns=[column], relationships=[relationship])
+    prototype = extended.prototype
+    assert prototype is not None
+    for same in (
+        model.extend(columns=[column], relationships=[relationship]),
+        model.extend(columns=(column,), relationships=(relationship,)),
+    ):
+        assert same is not extended
+        assert same.prototype is prototype
+    assert create_mock.call_count == 1
+
+    assert model.extend(columns=[column]).prototype is not prototype
+    assert model.extend().prototype is not prototype
+    assert create_mock.call_count == 3
+
+
+def test_extend_unhashable(mock_stack: MockStack) -> None:
+    create_mock = mock_stack.enter_mock(
+        MappedModel, "create", mock=Mock(side_effect=lambda **_: MappedModel(bases=[]))
+    )
+    model = MappedModel(bases=[])
+    unhashable: Any = []  # columns can't be hashed
+
+    for _ in range(2):
+        assert model.extend(columns=[unhashable]).prototype is None
+    assert create_mock.call_count == 2
+
+
+def test_patch_memoization() -> None:
+    model = MappedModel(PropertyField(SampleClass.prop), bases=[])
+
+    patch_model = model.as_patch()
+    assert model.as_patch().prototype is patch_model.prototype
+    assert model.as_patch().fields == patch_model.fields
+    assert isinstance(patch_model.fields[0], PropertyField)
+    assert patch_model.fields[0].patch
+    assert patch_model.as_patch().prototype is not patch_model.prototype
+
+
+def test_shared_derived_models(mock_stack: MockStack) -> None:
+    generate_mock = mock_stack.enter_mock(
+        MappedModel, "generate_model", mock=Mock(side_effect=lambda: BaseModel)
+    )
+    model = MappedModel(PropertyField(SampleClass.prop), bases=[])
+
+    class Sample:
+        PatchModel = model.as_patch()
+        AdminPatchModel = model.as_patch()
+
+    patch_model: MappedModel = Sample.__dict__["PatchModel"]
+    admin_patch_model: MappedModel = Sample.__dict__["AdminPatchModel"]
+    assert patch_model.model_name.endswith("Sample.PatchModel")
+    assert admin_patch_model.model_name.endswith("Sample.AdminPatchModel")
+    assert registry.find(patch_model.registry_key) is patch_model
+    assert registry.find(admin_patch_model.registry_key) is admin_patch_model
+
+    assert patch_model.generated_model is admin_patch_model.generated_model
+    generate_mock.assert_called_once_with()
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        pytest.param(lambda: MappedBaseModel.loader_options(), id="loader_options"),
+        pytest.param(lambda: MappedBaseModel.select_statement(), id="select"),
+        pytest.param(lambda: MappedBaseModel.validate_rows([]), id="validate_rows"),
+        pytest.param(lambda: MappedBaseModel.bulk_update(Mock(), []), id="bulk_update"),
+        pytest.param(
+            lambda: MappedBaseModel.validate_polymorphic([]), id="validate_polymorphic"
+        ),
+        pytest.param(lambda: MappedBaseModel().update_values(), id="update_values"),
+    ],
+)
+def test_methods_without_marshal_model(method: Callable[[], Any]) -> None:
+    with pytest.raises(TypeError, match="not generated by a MappedModel"):
+        method()
+
+
+def test_warm_up_abstract_models(local_registry: MarshalRegistry) -> None:
+    class Base(DeclarativeBase):
+        metadata = MetaData()
+
+    class AbstractItem(Base):
+        __abstract__ = True
+        name: Mapped[str] = mapped_column()
+
+        BaseModel = MappedModel.create(columns=[name])
+
+    class Item(AbstractItem):
+        __tablename__ = "items"
+        id: Mapped[int] = mapped_column(primary_key=True)  # noqa: VNE003
+
+        FullModel = MappedModel.create(columns=[id])
+
+    abstract_model = AbstractItem.__dict__["BaseModel"]
+    assert abstract_model.is_abstract
+    assert not Item.__dict__["FullModel"].is_abstract
+    assert list(local_registry.iter_build_order()) == [Item.__dict__["FullModel"]]
+    assert list(local_registry.warm_up()) == [Item.__dict__["FullModel"].registry_key]
+    assert not abstract_model.is_generated
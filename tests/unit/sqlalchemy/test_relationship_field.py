@@ -7,13 +7,21 @@ from pydantic_core import PydanticUndefined
 from sqlalchemy.orm import Relationship
 
 from pydantic_marshals.base.fields.base import PatchDefault
+from pydantic_marshals.base.models import MarshalModel
 from pydantic_marshals.sqlalchemy.fields.relationships import RelationshipField
-from tests.unit.conftest import DummyFactory
+from tests.unit.conftest import DummyFactory, MockStack
 
 
-def test_conversion() -> None:
+@pytest.mark.parametrize(
+    "model_dummy",
+    [
+        pytest.param(BaseModel, id="pydantic"),
+        pytest.param(MarshalModel(bases=[]), id="marshal"),
+        pytest.param("Class.Model", id="name"),
+    ],
+)
+def test_conversion(model_dummy: Any) -> None:
     relationship_dummy: Relationship[Any] = Relationship()
-    model_dummy = BaseModel
 
     column_field = RelationshipField.convert(relationship_dummy, model_dummy)
     assert isinstance(column_field, RelationshipField)
@@ -109,3 +117,76 @@ def test_field_data_generation(
     if as_patch:
         relationship_field = relationship_field.as_patch()
     assert dict(relationship_field.generate_field_data()) == expected
+
+
+def test_lazy_model_reference(
+    dummy_factory: DummyFactory,
+    mapped_relationship_mock: Mock,
+    mock_stack: MockStack,
+) -> None:
+    marshal_model = MarshalModel(bases=[])
+    mock_stack.enter_mock(
+        marshal_model, "reference", return_value=dummy_factory("reference")
+    )
+    find_mock = mock_stack.enter_mock(
+        "pydantic_marshals.base.models.registry.find", return_value=marshal_model
+    )
+    mapped_relationship_mock.collection_class = None
+
+    for model in (marshal_model, "Class.Model"):
+        relationship_field = RelationshipField(mapped_relationship_mock, model)
+        assert relationship_field.generate_type() is dummy_factory("reference")
+        assert list(relationship_field.dependencies()) == [marshal_model]
+
+    find_mock.assert_called_with("Class.Model")
+
+
+def test_no_dependencies(relationship_field: RelationshipField) -> None:
+    assert list(relationship_field.dependencies()) == []
+
+
+@pytest.mark.parametrize(
+    ("uselist", "loader_name"),
+    [
+        pytest.param(False, "joinedload", id="scalar"),
+        pytest.param(True, "selectinload", id="collection"),
+    ],
+)
+def test_loader_option(
+    mock_stack: MockStack,
+    dummy_factory: DummyFactory,
+    relationship_field: RelationshipField,
+    mapped_relationship_mock: Mock,
+    uselist: bool,
+    loader_name: str,
+) -> None:
+    loader_mock = mock_stack.enter_mock(
+        f"pydantic_marshals.sqlalchemy.fields.relationships.{loader_name}",
+        return_value=dummy_factory("option"),
+    )
+    mapped_relationship_mock.uselist = uselist
+    mapped_relationship_mock.class_attribute = dummy_factory("attribute")
+
+    assert relationship_field.loader_option() is dummy_factory("option")
+    loader_mock.assert_called_once_with(dummy_factory("attribute"))
+
+
+def test_nested_loader_option(
+    mock_stack: MockStack,
+    dummy_factory: DummyFactory,
+    relationship_field: RelationshipField,
+    mapped_relationship_mock: Mock,
+) -> None:
+    loader_mock = mock_stack.enter_patch(
+        "pydantic_marshals.sqlalchemy.fields.relationships.selectinload"
+    )
+    mapped_relationship_mock.uselist = True
+    columns = [dummy_factory("column")]
+    options = [dummy_factory("option")]
+
+    option = relationship_field.loader_option(columns, options)
+    load_only_mock = loader_mock.return_value.load_only
+    load_only_mock.assert_called_once_with(dummy_factory("column"))
+    options_mock = load_only_mock.return_value.options
+    options_mock.assert_called_once_with(dummy_factory("option"))
+    assert option is options_mock.return_value
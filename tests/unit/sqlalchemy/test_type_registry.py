@@ -0,0 +1,75 @@
+from typing import Any
+from uuid import UUID
+
+import pytest
+from pydantic.networks import IPvAnyInterface
+from sqlalchemy import ARRAY, JSON, Integer, String, TypeDecorator, Uuid
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.type_api import TypeEngine
+
+from pydantic_marshals.sqlalchemy.type_registry import TypeRegistry, type_registry
+from tests.unit.conftest import SampleType
+
+
+class UnknownType(TypeEngine[Any]):
+    @property
+    def python_type(self) -> type[Any]:
+        raise NotImplementedError
+
+
+class StringDecorator(TypeDecorator[str]):
+    impl = String
+    cache_ok = True
+
+
+class UnknownDecorator(TypeDecorator[Any]):
+    impl = UnknownType
+    cache_ok = True
+
+
+@pytest.mark.parametrize(
+    ("type_engine", "expected"),
+    [
+        pytest.param(Integer(), int, id="python_type"),
+        pytest.param(Uuid(), UUID, id="uuid"),
+        pytest.param(postgresql.JSONB(), Any, id="jsonb"),
+        pytest.param(JSON(), Any, id="json"),
+        pytest.param(postgresql.INET(), IPvAnyInterface, id="inet"),
+        pytest.param(ARRAY(Integer), list[int], id="array"),
+        pytest.param(ARRAY(String, dimensions=2), list[list[str]], id="array_2d"),
+        pytest.param(ARRAY(UnknownType()), list[Any], id="array_unknown"),
+        pytest.param(StringDecorator(), str, id="decorator"),
+    ],
+)
+def test_default_registry(type_engine: TypeEngine[Any], expected: Any) -> None:
+    assert type_registry.resolve(type_engine) == expected
+
+
+def test_unknown_types() -> None:
+    registry = TypeRegistry()
+    assert registry.find_type(UnknownType()) is None
+    assert registry.find_type(UnknownDecorator()) is None
+    with pytest.raises(NotImplementedError):
+        registry.resolve(UnknownType())
+
+
+def resolve_length(type_engine: TypeEngine[Any]) -> Any:
+    assert isinstance(type_engine, String)
+    return type_engine.length
+
+
+def test_registration() -> None:
+    registry = TypeRegistry()
+    assert registry.find_resolver(UnknownDecorator) is None
+    assert UnknownDecorator in registry.cache
+
+    registry.register(UnknownType, SampleType)
+    assert registry.resolve(UnknownType()) is SampleType
+    assert registry.resolve(UnknownDecorator()) is SampleType  # via impl
+
+    registry.register(TypeDecorator, str)  # MRO lookup goes first
+    assert registry.resolve(UnknownDecorator()) is str
+    assert registry.resolve(StringDecorator()) is str
+
+    registry.register_resolver(String, resolve_length)
+    assert registry.resolve(String(17)) == 17